@@ -0,0 +1,363 @@
+# batch.py
+"""MLFQ lockstep untuk ribuan workload kecil sekaligus (studi Monte Carlo).
+
+Setiap workload menjadi satu baris array 2-D (workload x proses): level
+antrian, posisi di antrian, sisa waktu, sisa I/O, last_run_time, dst.
+Satu langkah menjalankan satu iterasi loop mlfq_scheduler untuk semua
+workload yang masih aktif sekaligus: kedatangan, I/O selesai, aging,
+dispatch + degradasi, atau lompat idle. Urutan di dalam antrian dikodekan
+sebagai kunci posisi (append = kunci belakang naik, appendleft = kunci
+depan turun), sehingga hasil per proses sama persis dengan menjalankan
+mlfq_scheduler per workload. Baris yang sudah selesai dibuang dari state
+secara berkala agar langkah berikutnya hanya menghitung workload aktif.
+
+Workload harus segar (belum pernah dijalankan); proses tidak diubah,
+hasil dikembalikan sebagai array.
+"""
+import math
+from statistics import NormalDist
+
+from optional_deps import require_numpy
+from process import ProcessTable, arrival_order
+from ready_queue import level_thresholds
+
+_NONE = -1 # Penanda start/completion yang belum ada
+_LEVEL_WEIGHT = 1 << 48 # Bobot level di skor dispatch; posisi antrian selalu jauh lebih kecil
+
+
+def pack_workloads(workloads):
+    """Kemas workload ke array (W, P) terurut kedatangan; kolom lebih dari ukuran workload adalah padding.
+
+    Mengembalikan dict berisi arrival, burst, io_burst, priority, valid,
+    size dan pids (list per workload).
+    """
+    np = require_numpy()
+    rows = [arrival_order(w) for w in workloads]
+    count = len(rows)
+    width = max((len(row) for row in rows), default=0)
+    size = np.array([len(row) for row in rows], dtype=np.int64)
+    names = (('arrival', 'arrival_time', 0), ('burst', 'burst_time', 1),
+             ('io_burst', 'io_burst', 0), ('priority', 'original_priority', 1))
+    # ProcessTable terurut dibaca per kolom; workload lain lewat atribut proses
+    tables = all(isinstance(row, ProcessTable) for row in rows)
+    if tables:
+        dtype = np.float64 if any(row.time_code == 'd' for row in rows) else np.int64
+    packed = {}
+    for name, column, pad in names:
+        if tables:
+            values = np.full((count, width), pad, dtype=np.int64 if name == 'priority' else dtype)
+            for i, row in enumerate(rows):
+                values[i, :len(row)] = getattr(row, column)
+        else:
+            values = np.array([[getattr(p, column) for p in row] + [pad] * (width - len(row)) for row in rows])
+            values = values.reshape(count, width)
+        packed[name] = values
+    pids = [list(row.pids) if tables else [p.pid for p in row] for row in rows]
+    packed['valid'] = np.arange(width) < size[:, None]
+    packed['size'] = size
+    packed['pids'] = pids
+    return packed
+
+
+def mlfq_batch(workloads, time_quantums, aging_threshold, max_time, compact_ratio=0.5):
+    """Jalankan mlfq_scheduler atas banyak workload secara lockstep.
+
+    `workloads` berupa list workload (list Process / ProcessTable) atau
+    hasil pack_workloads. Mengembalikan dict array (W, P): start,
+    completion (-1 jika belum), wait, remaining dan priority, ditambah
+    arrival, burst, valid, size dan pids dari workload.
+    """
+    np = require_numpy()
+    packed = workloads if isinstance(workloads, dict) else pack_workloads(workloads)
+    num_levels = len(time_quantums)
+    thresholds = level_thresholds(aging_threshold, num_levels)
+    # Threshold <= 0: proses yang baru dipromosikan langsung jatuh tempo lagi di level berikutnya
+    cascade = any(t is not None and t <= 0 for t in thresholds)
+    arrival, burst, valid = packed['arrival'], packed['burst'], packed['valid']
+    priority = packed['priority']
+    if np.any(valid & ((priority < 1) | (priority > num_levels))):
+        raise ValueError(f"Prioritas proses di luar 1..{num_levels}")
+    count, width = arrival.shape
+    dtype = np.result_type(arrival, burst, packed['io_burst'], np.asarray(time_quantums))
+
+    # Hasil (baris asli); baris yang tidak aktif lagi dipindah dari state ke sini
+    out = {
+        'start': np.full((count, width), _NONE, dtype=dtype),
+        'completion': np.full((count, width), _NONE, dtype=dtype),
+        'wait': np.zeros((count, width), dtype=dtype),
+        'remaining': burst.astype(dtype),
+        'priority': priority.astype(np.int64),
+    }
+    tq = np.asarray(time_quantums, dtype=dtype)
+    thr = np.array([math.inf if t is None else t for t in thresholds], dtype=np.float64)
+    # Skor dispatch = level * _LEVEL_WEIGHT - posisi: argmax memilih level tertinggi, lalu posisi terdepan
+    not_ready = np.iinfo(np.int64).min
+    cols = np.arange(width, dtype=np.int64)
+
+    # State baris aktif: kolom (W, P) per proses dan (W,) per workload
+    s = {
+        'row': np.arange(count),
+        'arrival': arrival.astype(dtype),
+        'burst': burst.astype(dtype),
+        'io_burst': packed['io_burst'].astype(dtype),
+        'orig': priority.astype(np.int64) - 1,
+        'size': packed['size'],
+        'level': np.full((count, width), -1, dtype=np.int64), # -1: tidak di ready queue
+        'key': np.zeros((count, width), dtype=np.int64),      # posisi di antrian levelnya
+        'score': np.full((count, width), not_ready, dtype=np.int64),
+        'deadline': np.full((count, width), math.inf),        # last_run_time + threshold level
+        'enq_busy': np.zeros((count, width), dtype=dtype),    # nilai busy saat masuk antrian
+        'in_io': np.zeros((count, width), dtype=bool),
+        'io_rem': np.zeros((count, width), dtype=dtype),
+        'io_count': np.zeros((count, width), dtype=np.int64),
+        'io_seq': np.zeros((count, width), dtype=np.int64),
+        'service': np.zeros((count, width), dtype=dtype),
+        'time': np.zeros(count, dtype=dtype),
+        'busy': np.zeros(count, dtype=dtype),     # total waktu CPU terpakai (wait_time lazy)
+        'ptr': np.zeros(count, dtype=np.int64),   # kedatangan berikutnya
+        'ready': np.zeros(count, dtype=np.int64), # jumlah proses di ready queue
+        'blocked': np.zeros(count, dtype=np.int64),
+        'back': np.zeros(count, dtype=np.int64),
+        'front': np.zeros(count, dtype=np.int64),
+        'io_counter': np.zeros(count, dtype=np.int64),
+    }
+    for name in ('start', 'completion', 'wait', 'remaining', 'priority'):
+        s[name] = out[name].copy()
+
+    def place(r, c, levels, keys, last_run):
+        s['level'][r, c] = levels
+        s['key'][r, c] = keys
+        s['score'][r, c] = levels * _LEVEL_WEIGHT - keys
+        s['deadline'][r, c] = last_run + thr[levels]
+
+    def enqueue(r, c, levels, keys, last_run):
+        place(r, c, levels, keys, last_run)
+        s['enq_busy'][r, c] = s['busy'][r]
+        s['ready'] += np.bincount(r, minlength=s['ready'].size)
+
+    def promote(aging, due):
+        """Promosikan proses `due` (baris `aging`) ke depan level di atasnya"""
+        local, c = np.nonzero(due)
+        if not local.size:
+            return
+        r = aging[local]
+        # Promosi berurutan dengan appendleft membalik urutan antrian asal:
+        # peringkat posisi lama di antara proses yang dipromosikan dalam satu workload
+        counts = due.sum(1)
+        order = np.lexsort((s['key'][r, c], local))
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        promoted = s['level'][r, c] + 1
+        s['priority'][r, c] = promoted + 1
+        place(r, c, promoted, s['front'][r] - 1 - rank, s['time'][r])
+        s['front'][aging] -= counts
+
+    def retire(keep):
+        """Tulis baris yang tidak aktif lagi ke hasil, sisakan baris `keep`"""
+        done = ~keep
+        rows = s['row'][done]
+        # Proses yang masih di antrian menunggu sampai akhir simulasi
+        queued = s['level'][done] >= 0
+        s['wait'][done] += np.where(queued, s['busy'][done][:, None] - s['enq_busy'][done], 0)
+        for name in ('start', 'completion', 'wait', 'remaining', 'priority'):
+            out[name][rows] = s[name][done]
+        for name, value in s.items():
+            s[name] = value[keep]
+
+    while s['row'].size:
+        time = s['time']
+        ptr = s['ptr']
+        active = (time < max_time) & ((s['ready'] > 0) | (ptr < s['size']) | (s['blocked'] > 0))
+        if active.sum() <= compact_ratio * active.size:
+            retire(active)
+            continue
+        n = active.size
+        rows = np.arange(n)
+        level = s['level']
+        in_io = s['in_io']
+        any_io = s['blocked'].any()
+
+        # 1. Kedatangan Proses Baru (urutan kedatangan = urutan kolom)
+        next_arrival = s['arrival'][rows, np.minimum(ptr, width - 1)]
+        arriving = np.flatnonzero(active & (ptr < s['size']) & (next_arrival <= time))
+        if arriving.size:
+            new = ((cols >= ptr[arriving, None]) & (cols < s['size'][arriving, None])
+                   & (s['arrival'][arriving] <= time[arriving, None]))
+            local, c = np.nonzero(new)
+            r = arriving[local]
+            # Kedatangan baru tetap memakai last_run_time = 0 seperti mlfq_scheduler
+            enqueue(r, c, s['priority'][r, c] - 1, s['back'][r] + c, 0)
+            ptr[arriving] += new.sum(1)
+            s['back'][arriving] += width
+
+        # 2. I/O selesai, urut sesuai urutan blok; kembali ke prioritas awal
+        if any_io:
+            r, c = np.nonzero(in_io & (s['io_rem'] <= 0) & active[:, None])
+            if r.size:
+                in_io[r, c] = False
+                s['blocked'] -= np.bincount(r, minlength=n)
+                enqueue(r, c, s['orig'][r, c], s['back'][r] + s['io_seq'][r, c], time[r])
+                s['back'] += s['io_counter'] + 1
+
+        # 3. Aging: proses yang menunggu >= threshold naik ke depan level di atasnya.
+        #    Dengan threshold positif, proses yang baru dipromosikan tidak jatuh tempo lagi
+        #    di iterasi yang sama, jadi semua level bisa diproses serentak. Dengan threshold
+        #    <= 0 level diproses berurutan dari bawah seperti mlfq_scheduler.
+        deadline = s['deadline']
+        aging = np.flatnonzero((deadline.min(1) <= time) & active)
+        if aging.size:
+            if cascade:
+                for q in range(num_levels - 1):
+                    promote(aging, (level[aging] == q) & (deadline[aging] <= time[aging, None]))
+            else:
+                promote(aging, deadline[aging] <= time[aging, None])
+
+        # 4. Pilih proses: level tertinggi yang berisi, posisi terdepan
+        has = active & (s['ready'] > 0)
+        idle = np.flatnonzero(active & ~has)
+        r = np.flatnonzero(has)
+        if r.size:
+            c = s['score'].argmax(1)[r]
+            sel_level = level[r, c]
+            level[r, c] = -1
+            s['score'][r, c] = not_ready
+            s['deadline'][r, c] = math.inf
+            s['ready'][r] -= 1
+            s['wait'][r, c] += s['busy'][r] - s['enq_busy'][r, c]
+            start = s['start']
+            start[r, c] = np.where(start[r, c] == _NONE, time[r], start[r, c])
+            remaining = s['remaining']
+            exec_time = np.minimum(tq[sel_level], remaining[r, c])
+            now = time[r] + exec_time
+            time[r] = now
+            s['busy'][r] += exec_time
+            remaining[r, c] -= exec_time
+            service = s['service']
+            service[r, c] += exec_time
+
+            # 5. Selesai, I/O, atau degradasi
+            finished = remaining[r, c] == 0
+            s['completion'][r[finished], c[finished]] = now[finished]
+            chunk = s['burst'][r, c] // (s['io_count'][r, c] + 1)
+            safe_chunk = np.where(chunk > 0, chunk, 1)
+            blocked = ~finished & (chunk > 0) & (service[r, c] % safe_chunk == 0) & (s['io_burst'][r, c] > 0)
+            if blocked.any():
+                rb, cb = r[blocked], c[blocked]
+                in_io[rb, cb] = True
+                s['io_rem'][rb, cb] = s['io_burst'][rb, cb]
+                s['io_count'][rb, cb] += 1
+                s['io_seq'][rb, cb] = s['io_counter'][rb]
+                s['io_counter'][rb] += 1
+                s['blocked'][rb] += 1
+                any_io = True
+            requeue = ~finished & ~blocked
+            rq, cq, lq = r[requeue], c[requeue], sel_level[requeue]
+            s['priority'][rq, cq] = np.where(lq > 0, lq, s['priority'][rq, cq])
+            enqueue(rq, cq, np.maximum(lq - 1, 0), s['back'][rq], now[requeue])
+            s['back'][rq] += 1
+            if any_io:
+                # Kurangi waktu I/O proses yang terblokir (termasuk yang baru saja terblokir)
+                step = np.zeros(n, dtype=dtype)
+                step[r] = exec_time
+                s['io_rem'] -= step[:, None] * in_io
+
+        # CPU idle: lompat ke kedatangan berikutnya, atau ke I/O tercepat selesai
+        if idle.size:
+            pending = ptr[idle] < s['size'][idle]
+            gap = np.where(pending, s['arrival'][idle, np.minimum(ptr[idle], width - 1)] - time[idle], 0)
+            if any_io:
+                soonest = np.where(in_io[idle], s['io_rem'][idle], np.inf).min(1)
+                gap = np.where(~pending & (s['blocked'][idle] > 0), soonest, gap).astype(dtype)
+                s['io_rem'][idle] -= gap[:, None] * in_io[idle]
+            time[idle] += gap
+
+    return dict(out, arrival=arrival, burst=burst, valid=valid, size=packed['size'], pids=packed['pids'])
+
+
+def batch_metrics(result):
+    """Metrik per workload: completed, avg TAT, avg WT, avg RT (NaN jika tidak ada yang selesai)"""
+    np = require_numpy()
+    done = result['valid'] & (result['completion'] != _NONE)
+    completed = done.sum(1)
+    tat = result['completion'] - result['arrival']
+    wt = tat - result['burst']
+    rt = result['start'] - result['arrival']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        metrics = {name: np.where(done, values, 0).sum(1) / completed
+                   for name, values in (('avg_tat', tat), ('avg_wt', wt), ('avg_rt', rt))}
+    metrics['completed'] = completed
+    return metrics
+
+
+def confidence_interval(values, confidence=0.95):
+    """(mean, lower, upper) dengan aproksimasi normal; NaN diabaikan"""
+    np = require_numpy()
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if not values.size:
+        return math.nan, math.nan, math.nan
+    mean = values.mean().item()
+    if values.size < 2:
+        return mean, mean, mean
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    half = z * values.std(ddof=1).item() / math.sqrt(values.size)
+    return mean, mean - half, mean + half
+
+
+def summarize(metrics, confidence=0.95):
+    """Rata-rata antar workload + interval kepercayaan untuk setiap metrik per workload"""
+    return {name: confidence_interval(values, confidence) for name, values in metrics.items()}
+
+
+def random_workloads(count, min_size=5, max_size=50, seed=0, **options):
+    """`count` workload sintetis (workload.generate_workload) dengan ukuran acak min_size..max_size"""
+    import random
+
+    from workload import generate_workload
+
+    rng = random.Random(seed)
+    return [generate_workload(rng.randint(min_size, max_size), seed=rng.getrandbits(32), **options)
+            for _ in range(count)]
+
+
+def main(argv=None):
+    import argparse
+    import time
+
+    import main as defaults
+
+    parser = argparse.ArgumentParser(description="Monte Carlo MLFQ: banyak workload kecil disimulasikan lockstep dengan NumPy")
+    parser.add_argument("--workloads", type=int, default=1000, help="Jumlah workload")
+    parser.add_argument("--min-size", type=int, default=5)
+    parser.add_argument("--max-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tq", type=int, nargs="+", default=defaults.TIME_QUANTUMS, metavar="TQ")
+    parser.add_argument("--aging", type=int, default=defaults.AGING_THRESHOLD)
+    parser.add_argument("--max-time", type=int, default=10**9)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--compare", action="store_true", help="Bandingkan waktu dengan mlfq_scheduler per workload")
+    args = parser.parse_args(argv)
+
+    workloads = random_workloads(args.workloads, args.min_size, args.max_size, args.seed)
+    require_numpy() # Waktu import NumPy tidak ikut diukur
+    started = time.perf_counter()
+    summary = summarize(batch_metrics(mlfq_batch(workloads, args.tq, args.aging, args.max_time)), args.confidence)
+    batch_wall = time.perf_counter() - started
+    print(f"{args.workloads} workload ({args.min_size}-{args.max_size} proses), TQ={args.tq}, Aging={args.aging}")
+    for name, (mean, lower, upper) in summary.items():
+        print(f"{name:<10} {mean:10.3f}  CI {100 * args.confidence:.0f}%: [{lower:.3f}, {upper:.3f}]")
+    print(f"Batch: {batch_wall:.3f} s")
+    if args.compare:
+        from mlfq import mlfq_scheduler
+
+        for table in workloads:
+            table.reset()
+        started = time.perf_counter()
+        for table in workloads:
+            mlfq_scheduler(table, args.tq, args.aging, args.max_time)
+        loop_wall = time.perf_counter() - started
+        print(f"Per workload: {loop_wall:.3f} s ({loop_wall / batch_wall:.1f}x lebih lambat)")
+
+
+if __name__ == "__main__":
+    main()
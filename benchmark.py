@@ -0,0 +1,113 @@
+# benchmark.py
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from fcfs import fcfs_stream
+from mlfq import mlfq_stream
+from rr import rr_stream
+from workload import ARRIVAL_MODELS, BURST_MODELS, generate_workload
+
+DEFAULT_SIZES = [100, 1000, 10000]
+TIME_QUANTUMS = [2, 4, 8]
+RR_QUANTUM = 4
+AGING_THRESHOLD = 10
+
+
+def _run_fcfs(table, max_time):
+    return sum(1 for _ in fcfs_stream(table))
+
+def _run_rr(table, max_time):
+    return sum(1 for _ in rr_stream(table, RR_QUANTUM))
+
+def _run_mlfq(table, max_time):
+    return sum(1 for _ in mlfq_stream(table, TIME_QUANTUMS, AGING_THRESHOLD, max_time))
+
+# Setiap runner mengembalikan jumlah event tersimulasi (segmen + event log)
+SCHEDULERS = {
+    'fcfs': _run_fcfs,
+    'rr': _run_rr,
+    'mlfq': _run_mlfq,
+}
+
+
+def bench_one(name, table, max_time, measure_memory=True):
+    runner = SCHEDULERS[name]
+
+    table.reset()
+    started = time.perf_counter()
+    events = runner(table, max_time)
+    wall = time.perf_counter() - started
+
+    peak = None
+    if measure_memory:
+        # Pass terpisah: tracemalloc memperlambat eksekusi, jadi tidak ikut diukur waktunya
+        table.reset()
+        tracemalloc.start()
+        runner(table, max_time)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'scheduler': name,
+        'processes': len(table),
+        'events': events,
+        'wall_time_s': wall,
+        'events_per_s': events / wall if wall > 0 else None,
+        'peak_memory_bytes': peak,
+    }
+
+
+def run_benchmarks(sizes, schedulers, seed=0, arrival='poisson', burst='exponential',
+                   max_time=float('inf'), measure_memory=True, progress=None):
+    results = []
+    for n in sizes:
+        table = generate_workload(n, seed=seed, arrival=arrival, burst=burst)
+        for name in schedulers:
+            result = bench_one(name, table, max_time, measure_memory)
+            results.append(result)
+            if progress:
+                progress(result)
+    return {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'workload': {'seed': seed, 'arrival': arrival, 'burst': burst,
+                     'max_time': None if max_time == float('inf') else max_time},
+        'parameters': {'time_quantums': TIME_QUANTUMS, 'rr_quantum': RR_QUANTUM, 'aging_threshold': AGING_THRESHOLD},
+        'results': results,
+    }
+
+
+def _print_result(result):
+    peak = result['peak_memory_bytes']
+    peak_str = f"{peak / 1024 / 1024:8.2f} MiB" if peak is not None else "       - MiB"
+    print(f"{result['scheduler']:<11} n={result['processes']:<8} events={result['events']:<9} "
+          f"wall={result['wall_time_s']:8.3f}s  {result['events_per_s'] or 0:12.0f} events/s  peak={peak_str}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark reprodusibel untuk scheduler FCFS, RR dan MLFQ")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Jumlah proses per workload")
+    parser.add_argument("--schedulers", nargs="+", choices=sorted(SCHEDULERS), default=list(SCHEDULERS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrival", choices=ARRIVAL_MODELS, default="poisson")
+    parser.add_argument("--burst", choices=BURST_MODELS, default="exponential")
+    parser.add_argument("--max-time", type=float, default=float('inf'), help="Batas waktu simulasi MLFQ")
+    parser.add_argument("--no-memory", action="store_true", help="Lewati pengukuran peak memory")
+    parser.add_argument("--output", default="bench_results.json", help="File JSON hasil benchmark")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.sizes, args.schedulers, seed=args.seed, arrival=args.arrival, burst=args.burst,
+                            max_time=args.max_time, measure_memory=not args.no_memory, progress=_print_result)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nHasil benchmark disimpan di: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+# cache.py
+"""Cache hasil simulasi berbasis hash konten.
+
+Kunci cache = SHA-256 dari workload (PID + kolom statis), nama scheduler,
+parameternya, dan versi kode scheduler (hash source modul yang dipakai),
+sehingga perubahan kode scheduler otomatis membuat entri lama tidak
+terpakai. Nilai yang disimpan: timeline, log antrian, dan state run akhir
+setiap proses (agar metrik bisa dihitung tanpa menjalankan ulang).
+
+Dua lapis penyimpanan: LRU di memori proses dan direktori di disk
+(pickle, satu file per kunci) dengan eviksi menurut total ukuran. Lapis
+disk hanya aktif jika direktorinya diberikan (argumen `directory` atau
+env SCHED_SIM_CACHE); default_cache() tanpa env hanya memakai memori.
+File cache di-unpickle, jadi direktori cache hanya boleh ditulis oleh
+pengguna sendiri.
+"""
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import tempfile
+from array import array
+from collections import OrderedDict
+
+from process import _NONE, ProcessTable, column_typecode
+
+CACHE_FORMAT = 1
+# None: tanpa lapis disk (cache hanya di memori proses)
+DEFAULT_DIRECTORY = os.environ.get("SCHED_SIM_CACHE") or None
+
+# Modul awal setiap scheduler; modul lokal yang di-import (transitif) dibaca dari source-nya,
+# dan semuanya ikut di-hash sebagai versi kode
+SCHEDULER_MODULES = {
+    'fcfs': ('fcfs',),
+    'rr': ('rr',),
+    'mlfq': ('mlfq',),
+    'sjf': ('engine', 'policies'),
+    'srtf': ('engine', 'policies'),
+    'priority': ('engine', 'policies'),
+}
+_SOURCE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# Scheduler yang hanya ada sebagai policy di engine.simulate (tanpa parameter)
+ENGINE_POLICIES = ('sjf', 'srtf', 'priority')
+
+_code_versions = {}
+
+
+def _local_source(name):
+    """Path source modul jika modul itu bagian dari proyek ini (bukan stdlib/paket terpasang)"""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    origin = spec.origin if spec is not None else None
+    if origin and origin.endswith(".py") and os.path.dirname(os.path.abspath(origin)) == _SOURCE_DIRECTORY:
+        return origin
+    return None
+
+
+def scheduler_modules(scheduler):
+    """Modul lokal yang dipakai scheduler: modul awal + semua import-nya (juga import di dalam fungsi)"""
+    found = {}
+    pending = list(SCHEDULER_MODULES[scheduler])
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        path = _local_source(name)
+        if path is None:
+            continue
+        with open(path, "rb") as f:
+            source = f.read()
+        found[name] = source
+        for node in ast.walk(ast.parse(source, path)):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                pending.append(node.module.split(".")[0])
+    return dict(sorted(found.items()))
+
+
+def code_version(scheduler):
+    """Hash source semua modul yang dipakai scheduler"""
+    version = _code_versions.get(scheduler)
+    if version is None:
+        digest = hashlib.sha256()
+        for name, source in scheduler_modules(scheduler).items():
+            digest.update(name.encode("utf-8"))
+            digest.update(source)
+        version = _code_versions[scheduler] = digest.hexdigest()
+    return version
+
+
+def _as_table(processes):
+    return processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+
+
+def workload_hash(processes):
+    """Hash kolom statis workload (urutan input ikut menentukan hasil)"""
+    table = _as_table(processes)
+    digest = hashlib.sha256()
+    # PID apa pun (tidak harus str) di-hash sebagai str dengan prefiks panjang, jadi "\n" di PID tidak ambigu
+    parts = []
+    for pid in table.pids:
+        data = str(pid).encode("utf-8")
+        parts.append(len(data).to_bytes(4, "little"))
+        parts.append(data)
+    digest.update(b"".join(parts))
+    for name in ProcessTable.STATIC_COLUMNS:
+        column = getattr(table, name)
+        digest.update(column_typecode(column).encode("ascii"))
+        digest.update(column.tobytes())
+    return digest.hexdigest()
+
+
+def _parameters(scheduler, time_quantums, aging_threshold, max_time, rr_quantum, boost_step, boost_interval):
+    if scheduler == 'fcfs' or scheduler in ENGINE_POLICIES:
+        return {}
+    if scheduler == 'rr':
+        return {'rr_quantum': rr_quantum}
+    return {'time_quantums': list(time_quantums), 'aging_threshold': aging_threshold, 'max_time': max_time,
+            'boost_step': boost_step, 'boost_interval': boost_interval}
+
+
+def cache_key(scheduler, processes, time_quantums=None, aging_threshold=None, max_time=None, rr_quantum=None,
+              workload=None, boost_step=1, boost_interval=None):
+    """Kunci cache; `workload` boleh berisi workload_hash(processes) yang sudah dihitung"""
+    if scheduler not in SCHEDULER_MODULES:
+        raise ValueError(f"Scheduler tidak dikenal: {scheduler} (pilih {', '.join(SCHEDULER_MODULES)})")
+    material = json.dumps({
+        'format': CACHE_FORMAT,
+        'scheduler': scheduler,
+        'code': code_version(scheduler),
+        'workload': workload or workload_hash(processes),
+        'parameters': _parameters(scheduler, time_quantums, aging_threshold, max_time, rr_quantum, boost_step,
+                                  boost_interval),
+    }, sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _run_state(processes):
+    """State run akhir per kolom, urutan sama dengan input"""
+    return {name: [getattr(p, name) for p in processes] for name in ProcessTable.RUN_COLUMNS}
+
+
+def apply_run_state(processes, run):
+    """Tulis state run hasil cache ke proses (urutan sama dengan saat disimpan)"""
+    if isinstance(processes, ProcessTable):
+        for name in ProcessTable.RUN_COLUMNS:
+            column = getattr(processes, name)
+            setattr(processes, name, array(column.typecode, [_NONE if v is None else v for v in run[name]]))
+        return
+    for name in ProcessTable.RUN_COLUMNS:
+        for p, value in zip(processes, run[name]):
+            setattr(p, name, value)
+
+
+class ResultCache:
+    """LRU di memori + penyimpanan disk dengan batas total ukuran.
+
+    directory=None mematikan lapis disk; max_entries=0 mematikan lapis memori.
+    """
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_entries=32, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def get(self, key):
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return value
+        if self.directory:
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+                os.utime(path) # mtime = waktu akses terakhir, dipakai urutan eviksi
+            except (OSError, EOFError, pickle.UnpicklingError):
+                value = None
+            if value is not None:
+                self._remember(key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # Tulis ke file sementara lalu rename, agar run paralel tidak membaca file setengah jadi
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self._evict()
+
+    def _remember(self, key, value):
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        """Hapus file yang paling lama tidak diakses hingga total ukuran <= max_bytes"""
+        files = []
+        total = 0
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pkl") and entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        self._memory.clear()
+        if self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+
+_default_cache = None
+
+def default_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
+
+
+def _compute(scheduler, processes, time_quantums, aging_threshold, max_time, rr_quantum, boost_step, boost_interval):
+    if scheduler == 'fcfs':
+        # fcfs_stream tidak mengurutkan input in-place, jadi urutan proses tetap sama dengan kunci cache
+        from fcfs import fcfs_stream
+        return [payload for _, payload in fcfs_stream(processes)], None
+    if scheduler == 'rr':
+        from rr import rr_scheduler
+        return rr_scheduler(processes, rr_quantum), None
+    if scheduler in ENGINE_POLICIES:
+        from engine import simulate
+        from policies import make_policy
+        return simulate(processes, make_policy(scheduler))
+    from mlfq import mlfq_scheduler
+    return mlfq_scheduler(processes, time_quantums, aging_threshold, max_time, boost_step=boost_step,
+                          boost_interval=boost_interval)
+
+
+def cached_run(scheduler, processes, time_quantums=None, aging_threshold=None, max_time=None, rr_quantum=None,
+               cache=None, boost_step=1, boost_interval=None):
+    """Jalankan scheduler lewat cache; mengembalikan (timeline, log atau None).
+
+    `processes` harus dalam state awal (baru dibuat atau sudah di-reset).
+    Pada cache hit, state run akhir setiap proses ditulis ke `processes`
+    seperti jika scheduler benar-benar dijalankan. Timeline dan log yang
+    dikembalikan adalah salinan, jadi mengubahnya tidak mengubah isi cache.
+    cache=None memakai default_cache().
+    """
+    if cache is None:
+        cache = default_cache()
+    key = cache_key(scheduler, processes, time_quantums, aging_threshold, max_time, rr_quantum,
+                    boost_step=boost_step, boost_interval=boost_interval)
+    value = cache.get(key)
+    if value is not None:
+        timeline, log, run = value
+        apply_run_state(processes, run)
+        return list(timeline), None if log is None else log.copy()
+
+    timeline, log = _compute(scheduler, processes, time_quantums, aging_threshold, max_time, rr_quantum, boost_step,
+                             boost_interval)
+    cache.put(key, (timeline, log, _run_state(processes)))
+    return list(timeline), None if log is None else log.copy()
+
@@ -0,0 +1,224 @@
+# cli.py
+"""Entry point command line: python cli.py {simulate,metrics,gantt,report} [opsi]
+
+Hanya modul simulasi yang di-import di awal; matplotlib, NumPy dan fpdf
+di-import oleh subcommand yang membutuhkannya, sehingga `simulate`
+berjalan tanpa biaya import library berat.
+"""
+import argparse
+import sys
+
+import main as defaults
+from process import ProcessTable
+
+SCHEDULERS = ('fcfs', 'rr', 'mlfq', 'sjf', 'srtf', 'priority')
+
+
+def load_workload(args):
+    if args.workload:
+        from trace_file import load_workload as load_file
+        return load_file(args.workload)
+    if args.generate:
+        from workload import generate_workload
+        return generate_workload(args.generate, seed=args.seed)
+    return ProcessTable.from_processes(defaults.sample_processes)
+
+
+def run_scheduler(args, processes, profile=None):
+    """Jalankan scheduler terpilih lewat cache hasil; mengembalikan (timeline, log atau None)"""
+    if profile is not None:
+        # Profil butuh run sungguhan, jadi cache dilewati
+        from mlfq import mlfq_scheduler
+        return mlfq_scheduler(processes, args.tq, args.aging, args.max_time, profile=profile,
+                              boost_step=args.boost_step, boost_interval=args.boost_interval)
+    from cache import ResultCache, cached_run
+    cache = None
+    if args.no_cache:
+        cache = ResultCache(directory=None, max_entries=0)
+    elif args.cache_dir:
+        cache = ResultCache(directory=args.cache_dir)
+    return cached_run(args.scheduler, processes, time_quantums=args.tq, aging_threshold=args.aging,
+                      max_time=args.max_time, rr_quantum=args.rr_quantum, cache=cache,
+                      boost_step=args.boost_step, boost_interval=args.boost_interval)
+
+
+def run_smp(args, processes):
+    """Mode multi-core: run queue policy per core; mengembalikan (timeline gabungan, statistik per core)"""
+    from policies import make_policy
+    from smp import merge_timelines, smp_simulate, socket_migration_cost
+
+    factory = lambda: make_policy(args.scheduler, args.tq, args.aging, args.rr_quantum, args.boost_step,
+                                  args.boost_interval)
+    cost = args.migration_cost
+    if args.cores_per_socket:
+        cost = socket_migration_cost(args.cores_per_socket, args.migration_cost, args.remote_migration_cost)
+    max_time = args.max_time if args.scheduler == 'mlfq' else None
+    timelines, stats = smp_simulate(processes, factory, args.cores, max_time, migration_cost=cost)
+    return merge_timelines(timelines), stats
+
+
+def print_core_stats(stats):
+    print(f"{'Core':<6}{'Sibuk':>10}{'Utilisasi':>11}{'Slice':>9}{'Migrasi':>9}{'Curian':>8}")
+    for core, core_stats in enumerate(stats):
+        print(f"C{core:<5}{core_stats['busy_time']:>10}{100 * core_stats['utilization']:>10.1f}%"
+              f"{core_stats['slices']:>9}{core_stats['migrations']:>9}{core_stats['steals']:>8}")
+
+
+def cmd_simulate(args, processes, timeline, log):
+    if not args.quiet:
+        for pid, start, end in timeline:
+            print(f"{pid:>6}  {start:>6} -> {end:<6}")
+    busy = sum(end - start for _, start, end in timeline)
+    last_end = max((end for _, _, end in timeline), default=0)
+    done = sum(1 for p in processes if p.completion_time is not None)
+    print(f"{args.scheduler}: {len(processes)} proses, {done} selesai, {len(timeline)} segmen, "
+          f"CPU sibuk {busy} ms, selesai pada T={last_end}")
+    if args.log and log is not None:
+        defaults.print_queue_log(log)
+    if args.export_timeline:
+        from export import save_timeline
+        count = save_timeline(timeline, args.export_timeline)
+        print(f"Timeline ({count} segmen setelah digabung) disimpan di: {args.export_timeline}")
+    if args.export_log and log is not None:
+        from export import save_log
+        save_log(log, args.export_log)
+        print(f"Log antrian disimpan di: {args.export_log}")
+
+
+def cmd_metrics(args, processes, timeline, log):
+    # Timeline SMP gabungan diurutkan menurut start, jadi akhir simulasi = end terbesar
+    end_time = max((end for _, _, end in timeline), default=None)
+    defaults.calculate_metrics(processes, end_time=end_time, cores=args.cores)
+
+
+def cmd_gantt(args, processes, timeline, log):
+    defaults.draw_gantt_chart(timeline, f"Gantt Chart {args.scheduler.upper()} (Max Time = {defaults.MAX_TIME_UNITS}ms)",
+                              output_path=args.output)
+    if args.output:
+        print(f"Gantt chart disimpan di: {args.output}")
+
+
+def cmd_report(args, processes, timeline, log):
+    if log is None:
+        from queue_log import QueueLog
+        log = QueueLog(len(args.tq)) # FCFS/RR tidak memiliki log antrian MLFQ
+    defaults.generate_pdf_report(timeline, log, processes, output_path=args.output,
+                                 time_quantums=args.tq, aging_threshold=args.aging, max_time=args.max_time,
+                                 log_mode=args.log_mode, log_limit=args.log_events,
+                                 log_start=args.log_start, log_end=args.log_end, table_limit=args.table_limit,
+                                 cores=args.cores)
+
+
+def _boost_step(text):
+    if text == "top":
+        return None
+    try:
+        step = int(text)
+    except ValueError:
+        step = 0
+    if step < 1:
+        raise argparse.ArgumentTypeError(f"harus bilangan bulat >= 1 atau 'top': {text!r}")
+    return step
+
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--scheduler", choices=SCHEDULERS, default="mlfq")
+    common.add_argument("--tq", type=int, nargs="+", default=defaults.TIME_QUANTUMS, metavar="TQ",
+                        help="Time quantum MLFQ per level (terendah ke tertinggi); jumlah nilai = jumlah level")
+    common.add_argument("--aging", type=int, nargs="+", default=defaults.AGING_THRESHOLD, metavar="MS",
+                        help="Aging threshold MLFQ: satu nilai untuk semua level, atau satu nilai per level di bawah level tertinggi")
+    common.add_argument("--boost-step", type=_boost_step, default=1, metavar="N|top",
+                        help="Jumlah level per promosi aging MLFQ ('top': langsung ke level tertinggi)")
+    common.add_argument("--boost-interval", type=int, metavar="MS",
+                        help="Priority boost MLFQ berkala: semua proses yang menunggu naik ke level tertinggi")
+    common.add_argument("--max-time", type=int, default=defaults.MAX_TIME_UNITS, help="Batas waktu simulasi MLFQ")
+    common.add_argument("--rr-quantum", type=int, default=4, help="Time quantum Round Robin")
+    common.add_argument("--cores", type=int, default=1, help="Jumlah core (>1: mode SMP dengan run queue per core)")
+    common.add_argument("--migration-cost", type=int, default=0, help="Biaya migrasi proses antar core (satu socket)")
+    common.add_argument("--cores-per-socket", type=int, help="Ukuran socket; migrasi antar socket memakai --remote-migration-cost")
+    common.add_argument("--remote-migration-cost", type=int, default=0, help="Biaya migrasi antar socket")
+    common.add_argument("--generate", type=int, metavar="N", help="Pakai workload sintetis N proses, bukan sample_processes")
+    common.add_argument("--seed", type=int, default=0, help="Seed workload sintetis")
+    common.add_argument("--workload", metavar="PATH", help="Baca workload dari file .csv, .jsonl atau .trace (mmap)")
+    common.add_argument("--no-cache", action="store_true", help="Selalu jalankan ulang scheduler (abaikan cache hasil)")
+    common.add_argument("--cache-dir", metavar="PATH",
+                        help="Simpan cache hasil juga di direktori ini (default: env SCHED_SIM_CACHE, atau hanya memori)")
+    common.add_argument("--profile", action="store_true", help="Cetak profil per fase MLFQ setelah run (tanpa cache)")
+    common.add_argument("--profile-alloc", action="store_true", help="Profil juga mengukur alokasi dengan tracemalloc")
+    common.add_argument("--profile-json", metavar="PATH", help="Simpan statistik profil ke file JSON")
+
+    parser = argparse.ArgumentParser(description="Simulator penjadwalan CPU (FCFS, RR, MLFQ)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    simulate = sub.add_parser("simulate", parents=[common], help="Jalankan simulasi tanpa plotting")
+    simulate.add_argument("--quiet", action="store_true", help="Hanya cetak ringkasan, tanpa timeline")
+    simulate.add_argument("--log", action="store_true", help="Cetak log perubahan status queue (MLFQ)")
+    simulate.add_argument("--export-timeline", metavar="PATH", help="Simpan timeline ringkas ke .npz atau .parquet")
+    simulate.add_argument("--export-log", metavar="PATH", help="Simpan log antrian MLFQ ke .npz")
+    simulate.set_defaults(handler=cmd_simulate)
+
+    metrics = sub.add_parser("metrics", parents=[common], help="Cetak performance metrics")
+    metrics.set_defaults(handler=cmd_metrics)
+
+    gantt = sub.add_parser("gantt", parents=[common], help="Gambar Gantt chart")
+    gantt.add_argument("--output", help="Simpan ke file PNG alih-alih membuka window")
+    gantt.set_defaults(handler=cmd_gantt)
+
+    report = sub.add_parser("report", parents=[common], help="Buat laporan PDF")
+    report.add_argument("--output", default="output/hasil.pdf")
+    report.add_argument("--log-mode", choices=defaults.LOG_MODES, default="auto",
+                        help="full: semua event, summary: jumlah per action + N event pertama/terakhir")
+    report.add_argument("--log-events", type=int, default=50, metavar="N", help="Jumlah event pertama/terakhir di mode summary")
+    report.add_argument("--log-start", type=int, help="Awal jendela waktu log (mode full)")
+    report.add_argument("--log-end", type=int, help="Akhir jendela waktu log (mode full)")
+    report.add_argument("--table-limit", type=int, default=200, help="Jumlah baris maksimum tabel metrik")
+    report.set_defaults(handler=cmd_report)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if isinstance(args.aging, list):
+        if len(args.aging) == 1:
+            args.aging = args.aging[0]
+        elif len(args.aging) not in (len(args.tq) - 1, len(args.tq)):
+            counts = [str(n) for n in sorted({1, len(args.tq) - 1, len(args.tq)}) if n > 0]
+            counts = " atau ".join([", ".join(counts[:-1]), counts[-1]] if len(counts) > 1 else counts)
+            parser.error(f"--aging butuh {counts} nilai untuk {len(args.tq)} level")
+    profile = None
+    if args.profile or args.profile_alloc or args.profile_json:
+        if args.scheduler != "mlfq":
+            parser.error("--profile hanya tersedia untuk --scheduler mlfq")
+        from instrument import SchedulerProfile
+        profile = SchedulerProfile(trace_allocations=args.profile_alloc)
+    if args.boost_interval is not None and args.boost_interval <= 0:
+        parser.error("--boost-interval harus positif")
+    if args.cores < 1:
+        parser.error("--cores minimal 1")
+    if args.cores > 1 and profile is not None:
+        parser.error("--profile hanya tersedia untuk satu core")
+    processes = load_workload(args)
+    core_stats = None
+    if args.cores > 1:
+        # Mode SMP tidak memakai cache hasil dan tidak memiliki log antrian tunggal
+        timeline, core_stats = run_smp(args, processes)
+        log = None
+    else:
+        timeline, log = run_scheduler(args, processes, profile)
+    args.handler(args, processes, timeline, log)
+    if core_stats is not None:
+        print()
+        print_core_stats(core_stats)
+    if profile is not None:
+        print()
+        profile.print_summary()
+        if args.profile_json:
+            profile.dump(args.profile_json)
+            print(f"Statistik profil disimpan di: {args.profile_json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
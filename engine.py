@@ -0,0 +1,152 @@
+# engine.py
+"""Inti simulasi bersama untuk semua policy penjadwalan.
+
+Engine memegang waktu, cursor kedatangan (workload terurut), I/O (heap
+waktu selesai), wait_time (dihitung lazy dari waktu masuk ready set) dan
+pencatatan (timeline + QueueLog). Policy (lihat policies.py) hanya
+memutuskan proses mana yang jalan berikutnya, berapa lama slice-nya, dan
+ke mana proses kembali setelah slice habis. Setiap policy menghasilkan
+item stream dan (timeline, log) dengan bentuk yang sama.
+
+fcfs_scheduler, rr_scheduler dan mlfq_scheduler sengaja tidak dipindah ke
+engine: hanya jalur itu yang punya fast-forward (item SPAN), MLFQState
+(snapshot/resume/fork) dan profile per fase, dan cache/batch/trace
+memakainya sebagai acuan. FCFSPolicy, RoundRobinPolicy dan MLFQPolicy
+diuji menghasilkan timeline dan state yang sama dengan jalur lama.
+"""
+from io_devices import UnlimitedIO
+from process import arrival_order
+from queue_log import NullQueueLog, QueueLog
+from stream import EVENT, SEGMENT
+
+
+def engine_stream(processes, policy, max_time=None, log=None, io=None):
+    """Jalankan `policy` atas workload; menghasilkan (SEGMENT, ...) dan (EVENT, ...).
+
+    Urutan satu iterasi: kedatangan, I/O selesai, policy.tick (mis.
+    aging), lalu satu slice untuk proses dari policy.pick. Policy
+    preemptive dipotong pada kedatangan atau I/O selesai berikutnya. Jika
+    ready set kosong, waktu lompat ke kedatangan atau I/O selesai
+    terdekat. max_time=None berarti sampai semua selesai. `io` adalah
+    subsistem I/O dari io_devices (default UnlimitedIO); subsistem itu
+    juga menentukan kapan proses terblokir (io.needs_io).
+    """
+    arrivals = arrival_order(processes)
+    count = len(arrivals)
+    limit = float('inf') if max_time is None else max_time
+    if log is None:
+        log = NullQueueLog()
+    policy.start(log)
+
+    time = 0
+    idx = 0
+    if io is None:
+        io = UnlimitedIO()
+    # Waktu proses terakhir masuk ready set (untuk wait_time lazy)
+    enqueued_at = {}
+
+    def event(current_time, action, process=None, from_q=None, to_q=None):
+        pid = process.pid if process is not None else None
+        log.record(current_time, action, pid, from_q, to_q)
+        return (EVENT, {'time': current_time, 'action': action, 'process': pid, 'from_q': from_q, 'to_q': to_q})
+
+    def admit_arrivals():
+        nonlocal idx
+        while idx < count and arrivals[idx].arrival_time <= time:
+            p = arrivals[idx]
+            idx += 1
+            enqueued_at[p] = time
+            yield event(time, "Arrival", p, to_q=policy.admit(p, time))
+
+    while time < limit and (policy or idx < count or io):
+        # 1. Kedatangan Proses Baru
+        yield from admit_arrivals()
+
+        # 2. I/O selesai
+        next_io = io.next_completion()
+        if next_io is not None and next_io <= time:
+            for done_at, p in io.pop_completed(time):
+                log.io_remove(p.pid)
+                p.in_io = False
+                p.remaining_io = done_at - time
+                p.last_run_time = time
+                enqueued_at[p] = time
+                yield event(time, "IO Complete, Requeue", p, to_q=policy.admit(p, time, from_io=True))
+
+        # 3. Aturan policy yang bergantung waktu (mis. aging MLFQ)
+        for action, p, from_q, to_q in policy.tick(time):
+            yield event(time, action, p, from_q, to_q)
+
+        # 4. Pilih proses
+        picked = policy.pick(time)
+        if picked is None:
+            next_arrival = arrivals[idx].arrival_time if idx < count else None
+            next_io = io.next_completion()
+            if next_arrival is not None and (next_io is None or next_arrival <= next_io):
+                time = next_arrival
+                yield event(time, "Idle Time End")
+            elif next_io is not None:
+                time = next_io
+                yield event(time, "IO Time Advance")
+            else:
+                break
+            continue
+
+        p, from_q = picked
+        p.wait_time += time - enqueued_at.pop(p)
+        if p.start_time is None:
+            p.start_time = time
+
+        run = p.remaining_time
+        time_slice = policy.time_slice(p)
+        if time_slice is not None and time_slice < run:
+            run = time_slice
+        io_limit = io.run_limit(p)
+        if io_limit is not None and io_limit < run:
+            run = io_limit
+        if policy.preemptive:
+            # Semua kedatangan/I-O <= time sudah diproses, jadi batasnya selalu > 0
+            if idx < count and arrivals[idx].arrival_time - time < run:
+                run = arrivals[idx].arrival_time - time
+            next_io = io.next_completion()
+            if next_io is not None and next_io - time < run:
+                run = next_io - time
+
+        start = time
+        time += run
+        p.remaining_time -= run
+        p.service_time += run
+        yield (SEGMENT, (p.pid, start, time))
+
+        # 5. Selesai, I/O, atau kembali ke ready set
+        if p.remaining_time <= 0:
+            p.completion_time = time
+            yield event(time, "Completed", p, from_q=from_q)
+        elif io.needs_io(p):
+            p.in_io = True
+            p.remaining_io = p.io_burst
+            p.io_count += 1
+            log.io_append(p.pid)
+            io.submit(p, time, start)
+            yield event(time, "IO Blocked", p, from_q=from_q)
+        else:
+            if policy.admit_arrivals_first:
+                # Kedatangan selama slice masuk sebelum proses yang dipreempsi (seperti rr_scheduler)
+                yield from admit_arrivals()
+            p.last_run_time = time
+            enqueued_at[p] = time
+            action, to_q = policy.requeue(p, time)
+            yield event(time, action, p, from_q=from_q, to_q=to_q)
+
+    # Tutup akumulasi waktu tunggu dan sisa I/O pada saat simulasi berhenti
+    for p, since in enqueued_at.items():
+        p.wait_time += time - since
+    for done_at, p in io.pending():
+        p.remaining_io = p.io_burst if done_at is None else done_at - time
+
+
+def simulate(processes, policy, max_time=None, checkpoint_interval=256, io=None):
+    """Jalankan policy; mengembalikan (timeline, QueueLog) untuk semua policy"""
+    log = QueueLog(policy.num_levels, checkpoint_interval)
+    timeline = [payload for kind, payload in engine_stream(processes, policy, max_time, log, io) if kind == SEGMENT]
+    return timeline, log
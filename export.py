@@ -0,0 +1,207 @@
+# export.py
+"""Ekspor timeline dan log antrian ke kolom bertipe (.npz, atau Parquet jika pyarrow ada).
+
+PID di-intern menjadi ID integer dengan satu tabel nama, segmen
+berurutan dari proses yang sama digabung (run-length), dan setiap kolom
+integer disimpan dengan tipe tersempit yang muat (biasanya 4 byte per
+nilai). File .npz disimpan tanpa kompresi agar setiap kolom bisa
+di-memory-map langsung saat dimuat.
+
+Tabel nama PID disimpan sebagai int64 jika semua PID bertipe int, dan
+dimuat kembali sebagai int; selain itu (termasuk campuran int dan str)
+disimpan sebagai str(pid).
+"""
+import struct
+import zipfile
+from array import array
+
+from optional_deps import require_numpy, require_pyarrow
+from process import _typecode
+from queue_log import QueueLog
+
+
+def coalesce_timeline(timeline):
+    """Gabungkan segmen berurutan dari PID yang sama (end == start berikutnya)"""
+    merged = []
+    for pid, start, end in timeline:
+        if merged and merged[-1][0] == pid and merged[-1][2] == start:
+            merged[-1] = (pid, merged[-1][1], end)
+        else:
+            merged.append((pid, start, end))
+    return merged
+
+
+class TimelineColumns:
+    """Timeline dalam bentuk kolom: pid_id (indeks ke `pids`), start, end.
+
+    Iterasi menghasilkan (pid, start, end) seperti timeline biasa, sehingga
+    bisa langsung dipakai render_gantt / TimelineIndex.
+    """
+
+    def __init__(self, pids, pid_id, start, end):
+        self.pids = pids
+        self.pid_id = pid_id
+        self.start = start
+        self.end = end
+
+    def __len__(self):
+        return len(self.pid_id)
+
+    def __iter__(self):
+        pids = self.pids
+        for i, s, e in zip(self.pid_id, self.start, self.end):
+            yield (pids[i], s, e)
+
+    def tolist(self):
+        return list(self)
+
+
+def encode_timeline(timeline, coalesce=True):
+    """Intern PID dan (opsional) gabungkan segmen; hasilnya TimelineColumns dengan array.array"""
+    if coalesce:
+        timeline = coalesce_timeline(timeline)
+    ids = {}
+    pid_id = array('i')
+    starts = []
+    ends = []
+    for pid, start, end in timeline:
+        pid_id.append(ids.setdefault(pid, len(ids)))
+        starts.append(start)
+        ends.append(end)
+    code = _typecode(starts + ends)
+    return TimelineColumns(list(ids), pid_id, array(code, starts), array(code, ends))
+
+
+def _intern(values):
+    """Nilai (boleh None) -> (tabel nama, kode int32); None menjadi -1"""
+    ids = {}
+    codes = array('i', [-1 if v is None else ids.setdefault(v, len(ids)) for v in values])
+    return list(ids), codes
+
+
+def _compact(values):
+    """Kolom integer dengan tipe signed tersempit yang muat (int16/int32/int64); float apa adanya"""
+    np = require_numpy()
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu" or not values.size:
+        return values
+    lo, hi = values.min(), values.max()
+    for dtype in (np.int16, np.int32, np.int64):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return values.astype(dtype)
+    return values
+
+
+def _all_int(values):
+    # bool juga subclass int, tapi tidak kembali sebagai bool; simpan sebagai string
+    return bool(values) and all(type(v) is int for v in values)
+
+
+def _names(values):
+    # Bytes UTF-8 ('S'), bukan '<U' yang memakai 4 byte per karakter; PID int tetap int64
+    np = require_numpy()
+    if _all_int(values):
+        return np.asarray(values, dtype=np.int64)
+    return np.array([str(v).encode("utf-8") for v in values], dtype=bytes) if values else np.zeros(0, dtype='S1')
+
+
+def _decode_names(column):
+    if column.dtype.kind in "iu":
+        return column.tolist()
+    return [v.decode("utf-8") for v in column.tolist()]
+
+
+def save_timeline(timeline, path, coalesce=True):
+    """Simpan timeline ke .npz (tanpa kompresi) atau .parquet; mengembalikan jumlah segmen tersimpan"""
+    columns = timeline if isinstance(timeline, TimelineColumns) else encode_timeline(timeline, coalesce)
+    if path.lower().endswith(".parquet"):
+        pa = require_pyarrow()
+        np = require_numpy()
+        pids = list(columns.pids)
+        names = (pa.array(pids, type=pa.int64()) if _all_int(pids)
+                 else pa.array([str(pid) for pid in pids], type=pa.string()))
+        pid = pa.DictionaryArray.from_arrays(pa.array(np.asarray(columns.pid_id), type=pa.int32()), names)
+        table = pa.table({'pid': pid, 'start': np.asarray(columns.start), 'end': np.asarray(columns.end)})
+        pa.parquet.write_table(table, path)
+        return len(columns)
+
+    np = require_numpy()
+    np.savez(path, pids=_names(list(columns.pids)), pid_id=_compact(columns.pid_id),
+             start=_compact(columns.start), end=_compact(columns.end))
+    return len(columns)
+
+
+def _load_npz(path, mmap):
+    """Muat semua array di .npz; anggota yang tidak dikompresi di-memory-map langsung dari file"""
+    np = require_numpy()
+    arrays = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        for info in zf.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                # Local file header: 30 byte + nama + extra, lalu isi .npy apa adanya
+                f.seek(info.header_offset + 26)
+                name_len, extra_len = struct.unpack("<HH", f.read(4))
+                f.seek(info.header_offset + 30 + name_len + extra_len)
+                version = np.lib.format.read_magic(f)
+                if version in ((1, 0), (2, 0)):
+                    read_header = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                                   else np.lib.format.read_array_header_2_0)
+                    shape, fortran, dtype = read_header(f)
+                    if not dtype.hasobject and all(shape):
+                        arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                                                 order="F" if fortran else "C")
+                        continue
+            with zf.open(info) as member:
+                arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+    return arrays
+
+
+def load_timeline(path, mmap=True):
+    """Muat timeline hasil save_timeline sebagai TimelineColumns (kolom NumPy / memmap)"""
+    if path.lower().endswith(".parquet"):
+        pa = require_pyarrow()
+        table = pa.parquet.read_table(path, memory_map=mmap)
+        pid = table.column('pid').combine_chunks()
+        if not pa.types.is_dictionary(pid.type):
+            # Reader Parquet hanya mempertahankan dictionary string; PID int di-encode ulang
+            pid = pid.dictionary_encode()
+        return TimelineColumns(pid.dictionary.to_pylist(), pid.indices.to_numpy(),
+                               table.column('start').to_numpy(), table.column('end').to_numpy())
+
+    require_numpy()
+    arrays = _load_npz(path, mmap)
+    return TimelineColumns(_decode_names(arrays['pids']), arrays['pid_id'], arrays['start'], arrays['end'])
+
+
+def save_log(log, path):
+    """Simpan QueueLog (event + delta antrian) ke .npz dengan action/PID/level yang di-intern"""
+    np = require_numpy()
+    columns = log.to_columns()
+    names, codes = {}, {}
+    for key in ('action', 'process', 'from_q', 'to_q', 'op_pid'):
+        names[key], codes[key] = _intern(columns[key])
+    time_code = _typecode(columns['time'])
+    np.savez(path,
+             num_levels=np.array(log.num_levels), checkpoint_interval=np.array(log.checkpoint_interval),
+             time=_compact(array(time_code, columns['time'])),
+             op_code=np.asarray(columns['op_code'], dtype=np.int8),
+             op_level=np.asarray(columns['op_level'], dtype=np.int16),
+             op_end=_compact(array('q', columns['op_end'])),
+             **{key: _compact(codes[key]) for key in codes},
+             **{key + "_names": _names(names[key]) for key in names})
+
+
+def load_log(path, mmap=True):
+    """Bangun ulang QueueLog dari file save_log"""
+    require_numpy()
+    arrays = _load_npz(path, mmap)
+
+    def decode(key):
+        table = _decode_names(arrays[key + "_names"])
+        return [None if code < 0 else table[code] for code in arrays[key].tolist()]
+
+    columns = {key: decode(key) for key in ('action', 'process', 'from_q', 'to_q', 'op_pid')}
+    columns.update({key: arrays[key].tolist() for key in ('time', 'op_code', 'op_level', 'op_end')})
+    return QueueLog.from_columns(int(arrays['num_levels']), columns, int(arrays['checkpoint_interval']))
@@ -1,15 +1,64 @@
+from optional_deps import require_numpy
+from process import arrival_order
+from stream import SEGMENT
+
+
 def fcfs_scheduler(processes):
     processes.sort(key=lambda p: p.arrival_time)
+    return [payload for _, payload in fcfs_stream(processes)]
+
+def fcfs_stream(processes):
+    # Versi generator: segmen dihasilkan satu per satu, input tidak diurutkan in-place
     current_time = 0
-    timeline = []
 
-    for p in processes:
+    for p in arrival_order(processes):
         if current_time < p.arrival_time:
             current_time = p.arrival_time
         start = current_time
         end = start + p.burst_time
-        timeline.append((p.pid, start, end))
         current_time = end
+        p.start_time = start
         p.completion_time = end
+        yield (SEGMENT, (p.pid, start, end))
+
+def fcfs_vectorized(arrival_time, burst_time):
+    """FCFS tanpa loop Python; input tidak diubah.
+
+    Dengan S = cumsum(burst) setelah diurutkan menurut kedatangan, waktu
+    selesai proses ke-i adalah S_i + max(0, max_{j<=i}(a_j - S_{j-1})),
+    yaitu running max dari kedatangan dan waktu selesai sebelumnya.
+    Mengembalikan (start, end) dengan urutan yang sama seperti input.
+    """
+    np = require_numpy()
+    start, end = fcfs_batched(np.asarray(arrival_time)[None, :], np.asarray(burst_time)[None, :])
+    return start[0], end[0]
+
+def fcfs_batched(arrival_times, burst_times):
+    """FCFS untuk banyak workload independen sekaligus.
+
+    arrival_times dan burst_times berbentuk (jumlah_workload, jumlah_proses);
+    setiap baris disimulasikan terpisah. Mengembalikan (start, end) 2-D.
+    """
+    np = require_numpy()
+    arrival_times = np.asarray(arrival_times)
+    burst_times = np.asarray(burst_times)
+    if arrival_times.shape != burst_times.shape or arrival_times.ndim != 2:
+        raise ValueError("arrival_times dan burst_times harus array 2-D dengan bentuk sama")
+
+    # Urutan stabil sama seperti sorted(..., key=arrival_time)
+    order = np.argsort(arrival_times, axis=1, kind="stable")
+    a = np.take_along_axis(arrival_times, order, axis=1)
+    b = np.take_along_axis(burst_times, order, axis=1)
+
+    served = np.cumsum(b, axis=1)
+    slack = np.maximum.accumulate(a - (served - b), axis=1)
+    end_sorted = served + np.maximum(slack, 0)
+    start_sorted = end_sorted - b
+
+    # Kembalikan ke urutan input
+    start = np.empty_like(start_sorted)
+    end = np.empty_like(end_sorted)
+    np.put_along_axis(start, order, start_sorted, axis=1)
+    np.put_along_axis(end, order, end_sorted, axis=1)
+    return start, end
 
-    return timeline
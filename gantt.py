@@ -0,0 +1,148 @@
+# gantt.py
+from bisect import bisect_left, bisect_right
+
+DENSITY_LEVELS = 8
+
+
+def _pid_sort_key(pid):
+    return (0, pid, "") if isinstance(pid, (int, float)) else (1, 0, str(pid))
+
+
+class TimelineIndex:
+    """Indeks interval timeline per PID.
+
+    Dibangun dalam satu pass (bukan memfilter timeline sekali per PID).
+    Segmen berurutan dari PID yang sama digabung; karena segmen satu PID
+    tidak saling tumpang tindih, start dan end per PID sama-sama terurut
+    sehingga query jendela [t0, t1] cukup dua bisect.
+    """
+
+    def __init__(self, timeline):
+        self._starts = {}
+        self._ends = {}
+        self.start = None
+        self.end = None
+        for pid, start, end in timeline:
+            if end <= start:
+                continue
+            starts = self._starts.get(pid)
+            if starts is None:
+                self._starts[pid] = [start]
+                self._ends[pid] = [end]
+            elif self._ends[pid][-1] == start:
+                self._ends[pid][-1] = end
+            else:
+                starts.append(start)
+                self._ends[pid].append(end)
+            self.start = start if self.start is None else min(self.start, start)
+            self.end = end if self.end is None else max(self.end, end)
+
+    @property
+    def pids(self):
+        # PID angka (terurut nilai) sebelum PID lain (terurut str), jadi campuran int/str tetap bisa diurutkan
+        return sorted(self._starts, key=_pid_sort_key)
+
+    def window(self, pid, t0, t1):
+        """Segmen PID yang beririsan dengan [t0, t1], dipotong ke jendela"""
+        starts = self._starts.get(pid, [])
+        ends = self._ends.get(pid, [])
+        lo = bisect_right(ends, t0)
+        hi = bisect_left(starts, t1)
+        segments = list(zip(starts[lo:hi], ends[lo:hi]))
+        if segments:
+            if segments[0][0] < t0:
+                segments[0] = (t0, segments[0][1])
+            if segments[-1][1] > t1:
+                segments[-1] = (segments[-1][0], t1)
+        return segments
+
+
+def _density_bands(segments, t0, t1, bins):
+    """Agregasi segmen ke `bins` pita selebar piksel.
+
+    Mengembalikan [(start, durasi, okupansi 0..1)].
+    """
+    width = (t1 - t0) / bins
+    occupancy = [0.0] * bins
+    for start, end in segments:
+        first = min(int((start - t0) / width), bins - 1)
+        last = min(int((end - t0) / width), bins - 1)
+        for b in range(first, last + 1):
+            lo = max(start, t0 + b * width)
+            hi = min(end, t0 + (b + 1) * width)
+            if hi > lo:
+                occupancy[b] += hi - lo
+
+    # Okupansi dikuantisasi ke DENSITY_LEVELS tingkat; pita bersebelahan
+    # dengan tingkat yang sama digabung menjadi satu bar
+    bands = []
+    last_bin = None
+    for b, used in enumerate(occupancy):
+        if used <= 0:
+            continue
+        level = max(1, min(DENSITY_LEVELS, round(used / width * DENSITY_LEVELS))) / DENSITY_LEVELS
+        if bands and bands[-1][2] == level and last_bin == b - 1:
+            bands[-1] = (bands[-1][0], bands[-1][1] + width, level)
+        else:
+            bands.append((t0 + b * width, width, level))
+        last_bin = b
+    return bands
+
+
+def render_gantt(gnt, timeline, t0=0, t1=None, title=None, pixel_width=None):
+    """Gambar Gantt chart ke axes matplotlib, satu broken_barh per PID.
+
+    `timeline` boleh list (pid, start, end) atau TimelineIndex. Jika segmen
+    sebuah PID di jendela rata-rata lebih sempit dari satu piksel, segmen
+    diagregasi menjadi pita densitas selebar piksel, sehingga jumlah bar
+    dibatasi ukuran gambar, bukan panjang trace.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import to_rgba
+
+    index = timeline if isinstance(timeline, TimelineIndex) else TimelineIndex(timeline)
+    if t1 is None:
+        t1 = index.end if index.end is not None else t0 + 1
+    if pixel_width is None:
+        pixel_width = max(int(gnt.get_window_extent().width), 1)
+
+    rows = [(pid, index.window(pid, t0, t1)) for pid in index.pids]
+    rows = [(pid, segments) for pid, segments in rows if segments]
+
+    # Jika PID lebih banyak dari tinggi axes dalam piksel, PID berurutan digabung per baris
+    pixel_height = max(int(gnt.get_window_extent().height), 1)
+    group = -(-len(rows) // pixel_height)
+    if group > 1:
+        rows = [(f"{rows[i][0]}..{rows[min(i + group, len(rows)) - 1][0]}",
+                 [segment for _, segments in rows[i:i + group] for segment in segments])
+                for i in range(0, len(rows), group)]
+    process_ids = [pid for pid, _ in rows]
+
+    if title:
+        gnt.set_title(title)
+    gnt.set_xlabel("Time (ms)")
+    gnt.set_ylabel("Processes")
+    gnt.set_xlim(t0, t1)
+
+    # Label sumbu-Y dijarangkan jika PID terlalu banyak untuk dibaca
+    step = max(1, len(process_ids) // 40)
+    gnt.set_yticks([15 + 10 * i for i in range(0, len(process_ids), step)])
+    gnt.set_yticklabels(process_ids[::step])
+    gnt.set_ylim(0, 10 * len(process_ids) + 10)
+    gnt.grid(True)
+
+    pixel_time = (t1 - t0) / pixel_width
+    colors = plt.get_cmap("tab20", max(len(process_ids), 1))
+    for i, (pid, segments) in enumerate(rows):
+        y_pos = 10 * i + 10
+        color = to_rgba(colors(i))
+        # Agregasi jika bar rata-rata lebih sempit dari satu piksel (atau baris berisi banyak PID)
+        busy = sum(end - start for start, end in segments)
+        if len(segments) > 1 and (group > 1 or busy / len(segments) < pixel_time):
+            bands = _density_bands(segments, t0, t1, pixel_width)
+            xranges = [(start, width) for start, width, _ in bands]
+            facecolors = [color[:3] + (color[3] * max(level, 0.15),) for _, _, level in bands]
+            gnt.broken_barh(xranges, (y_pos, 8), facecolors=facecolors)
+        else:
+            gnt.broken_barh([(start, end - start) for start, end in segments], (y_pos, 8), facecolors=color)
+    return gnt
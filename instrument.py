@@ -0,0 +1,162 @@
+# instrument.py
+"""Instrumentasi opsional untuk hot path scheduler (saat ini mlfq_stream).
+
+Tanpa profiler, mlfq_stream hanya menguji satu variabel lokal per fase
+dan tidak memanggil apa pun. Dengan SchedulerProfile, setiap fase
+mencatat jumlah panggilan dan wall time, panjang maksimum setiap antrian
+(high-water mark) dicatat sebelum dispatch, dan jika trace_allocations
+aktif, tracemalloc mengukur selisih memori per fase serta lokasi alokasi
+terbanyak selama run.
+
+Waktu yang dihabiskan konsumen stream di antara dua yield tidak dihitung
+ke fase mana pun (lihat wrap). Fase 'log' bersarang di dalam fase yang
+memanggilnya, jadi waktunya juga termasuk di fase itu.
+"""
+import json
+import os
+import time
+import tracemalloc
+
+# Urutan fase untuk ringkasan
+PHASES = ('arrival', 'io_complete', 'aging', 'fast_forward', 'dispatch', 'idle', 'log')
+
+
+class SchedulerProfile:
+    """Statistik per fase satu (atau beberapa) run scheduler"""
+
+    def __init__(self, trace_allocations=False, top_allocations=10, clock=time.perf_counter):
+        self.trace_allocations = trace_allocations
+        self.top_allocations = top_allocations
+        self.clock = clock
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.wall = dict.fromkeys(PHASES, 0.0)
+        self.alloc_bytes = dict.fromkeys(PHASES, 0)
+        self.high_water = {}  # nama antrian -> panjang maksimum
+        self.iterations = 0
+        self.total_wall = 0.0
+        self.allocations = []  # lokasi alokasi terbanyak (dari snapshot tracemalloc)
+        self._paused = 0.0
+
+    # ------------------------------------------------------------------
+    # Dipanggil scheduler (hanya jika profiler diberikan)
+    # ------------------------------------------------------------------
+    def start(self):
+        """Token awal fase: (clock, waktu konsumen sejauh ini, memori ter-trace)"""
+        memory = tracemalloc.get_traced_memory()[0] if self.trace_allocations else 0
+        return self.clock(), self._paused, memory
+
+    def stop(self, phase, token):
+        started, paused, memory = token
+        self.calls[phase] += 1
+        self.wall[phase] += self.clock() - started - (self._paused - paused)
+        if self.trace_allocations:
+            self.alloc_bytes[phase] += tracemalloc.get_traced_memory()[0] - memory
+
+    def sample_queues(self, queues, io_queue):
+        self.iterations += 1
+        high_water = self.high_water
+        for level, q in enumerate(queues):
+            name = f"L{level+1}"
+            if len(q) > high_water.get(name, 0):
+                high_water[name] = len(q)
+        if len(io_queue) > high_water.get('io', 0):
+            high_water['io'] = len(io_queue)
+
+    def wrap_log_state(self, log_state):
+        """Bungkus log_state agar setiap pencatatan dihitung sebagai fase 'log'"""
+        def timed_log_state(*args, **kwargs):
+            token = self.start()
+            try:
+                return log_state(*args, **kwargs)
+            finally:
+                self.stop('log', token)
+        return timed_log_state
+
+    def wrap(self, stream):
+        """Alirkan stream scheduler; waktu di luar generator tidak masuk ke fase"""
+        started_tracing = self.trace_allocations and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot() if self.trace_allocations else None
+        clock = self.clock
+        started = clock()
+        try:
+            for item in stream:
+                paused = clock()
+                yield item
+                self._paused += clock() - paused
+        finally:
+            self.total_wall += clock() - started - self._paused
+            self._paused = 0.0
+            if before is not None:
+                self._record_allocations(before, tracemalloc.take_snapshot())
+            if started_tracing:
+                tracemalloc.stop()
+
+    def _record_allocations(self, before, after):
+        # Hanya alokasi dari modul simulator; profiler dan tracemalloc sendiri diabaikan
+        root = os.path.dirname(os.path.abspath(__file__))
+        filters = [tracemalloc.Filter(True, os.path.join(root, "*.py")),
+                   tracemalloc.Filter(False, os.path.abspath(__file__)),
+                   tracemalloc.Filter(False, tracemalloc.__file__)]
+        diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'lineno')
+        diff = [stat for stat in diff if stat.count_diff > 0]
+        diff.sort(key=lambda stat: stat.count_diff, reverse=True)
+        self.allocations = [{
+            'file': os.path.basename(stat.traceback[0].filename),
+            'line': stat.traceback[0].lineno,
+            'count': stat.count_diff,
+            'bytes': stat.size_diff,
+        } for stat in diff[:self.top_allocations]]
+
+    # ------------------------------------------------------------------
+    # Hasil
+    # ------------------------------------------------------------------
+    def stats(self):
+        """Statistik sebagai dict (siap di-serialisasi ke JSON)"""
+        phases = {}
+        for phase in PHASES:
+            entry = {'calls': self.calls[phase], 'wall_time_s': self.wall[phase]}
+            if self.trace_allocations:
+                entry['alloc_bytes'] = self.alloc_bytes[phase]
+            phases[phase] = entry
+        stats = {
+            'iterations': self.iterations,
+            'total_wall_time_s': self.total_wall,
+            'phases': phases,
+            'queue_high_water': dict(self.high_water),
+        }
+        if self.trace_allocations:
+            stats['allocations'] = list(self.allocations)
+        return stats
+
+    def to_json(self, indent=2):
+        return json.dumps(self.stats(), indent=indent)
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+    def summary_lines(self):
+        total = self.total_wall or 1.0
+        lines = [f"Profil scheduler: {self.iterations} iterasi, {self.total_wall:.4f} s di dalam scheduler",
+                 f"{'Fase':<13}{'Panggilan':>11}{'Waktu (s)':>12}{'%':>7}"
+                 + (f"{'Alokasi (B)':>14}" if self.trace_allocations else "")]
+        for phase in PHASES:
+            if not self.calls[phase]:
+                continue
+            line = (f"{phase:<13}{self.calls[phase]:>11}{self.wall[phase]:>12.4f}"
+                    f"{100 * self.wall[phase] / total:>6.1f}%")
+            if self.trace_allocations:
+                line += f"{self.alloc_bytes[phase]:>14}"
+            lines.append(line)
+        if self.high_water:
+            lines.append("Panjang antrian maksimum: "
+                         + ", ".join(f"{name}={size}" for name, size in self.high_water.items()))
+        for site in self.allocations:
+            lines.append(f"  {site['file']}:{site['line']}: {site['count']} blok, {site['bytes']} B")
+        return lines
+
+    def print_summary(self):
+        for line in self.summary_lines():
+            print(line)
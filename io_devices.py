@@ -0,0 +1,258 @@
+# io_devices.py
+"""Subsistem I/O untuk engine: heap waktu selesai absolut, tanpa pengurangan per tick.
+
+UnlimitedIO (default engine) menjalankan semua I/O paralel, sama seperti
+mlfq_scheduler. DeviceIO memodelkan sejumlah perangkat (disk, network,
+...) masing-masing dengan jumlah server terbatas dan antrian FIFO atau
+elevator (LOOK), sehingga kontensi I/O ikut terlihat di hasil simulasi.
+Setiap submit/selesai O(log k) untuk k permintaan I/O yang tertunda.
+
+Kapan proses terblokir ditentukan oleh `rule` subsistem: default
+mlfq_io_rule (aturan mlfq_scheduler), atau PeriodicIORule(interval)
+untuk trace yang benar-benar sering melakukan I/O; rule yang punya
+limit(p) juga memotong slice tepat di titik I/O berikutnya.
+"""
+import heapq
+import zlib
+from collections import deque
+
+DISCIPLINES = ('fifo', 'elevator')
+
+
+def mlfq_io_rule(p):
+    """Aturan I/O mlfq_scheduler: blok setelah setiap 1/(io_count+1) bagian burst"""
+    if p.io_burst <= 0 or p.remaining_time <= 0:
+        return False
+    chunk = p.burst_time // (p.io_count + 1)
+    return chunk > 0 and p.service_time % chunk == 0
+
+
+class PeriodicIORule:
+    """Blok setiap `interval` unit CPU (untuk proses dengan io_burst > 0)"""
+
+    def __init__(self, interval):
+        if interval <= 0:
+            raise ValueError("interval I/O harus positif")
+        self.interval = interval
+
+    def __call__(self, p):
+        return p.io_burst > 0 and p.remaining_time > 0 and p.service_time >= (p.io_count + 1) * self.interval
+
+    def limit(self, p):
+        """Sisa CPU sampai titik I/O berikutnya (None jika proses tidak melakukan I/O)"""
+        if p.io_burst <= 0:
+            return None
+        return (p.io_count + 1) * self.interval - p.service_time
+
+
+class IOSubsystem:
+    """Dasar subsistem I/O: `rule(p)` menentukan kapan proses terblokir"""
+
+    def __init__(self, rule=mlfq_io_rule):
+        self.needs_io = rule
+        self._limit = getattr(rule, 'limit', None)
+
+    def run_limit(self, p):
+        """Batas panjang slice agar I/O terjadi tepat waktu (None jika tidak dibatasi)"""
+        return self._limit(p) if self._limit is not None else None
+
+
+class UnlimitedIO(IOSubsystem):
+    """Perangkat tak terbatas: I/O selesai io_burst setelah awal segmen yang memicunya"""
+
+    def __init__(self, rule=mlfq_io_rule):
+        super().__init__(rule)
+        self._events = [] # (waktu selesai, urutan blok, proses)
+        self._seq = 0
+
+    def submit(self, p, time, segment_start):
+        # I/O dihitung sejak awal segmen, sama seperti mlfq_scheduler
+        self._seq += 1
+        heapq.heappush(self._events, (segment_start + p.io_burst, self._seq, p))
+
+    def next_completion(self):
+        return self._events[0][0] if self._events else None
+
+    def pop_completed(self, time):
+        """(waktu selesai, proses) untuk semua I/O yang selesai <= time, urut sesuai urutan blok"""
+        finished = []
+        while self._events and self._events[0][0] <= time:
+            finished.append(heapq.heappop(self._events))
+        finished.sort(key=lambda e: e[1])
+        return [(done_at, p) for done_at, _, p in finished]
+
+    def pending(self):
+        """(waktu selesai atau None jika belum dilayani, proses) untuk I/O yang tertunda"""
+        return [(done_at, p) for done_at, _, p in self._events]
+
+    def stats(self, end_time):
+        return {}
+
+    def __len__(self):
+        return len(self._events)
+
+
+class Device:
+    """Satu perangkat I/O dengan `servers` permintaan yang dilayani bersamaan.
+
+    discipline 'fifo' melayani menurut urutan datang; 'elevator' (LOOK)
+    melayani posisi terdekat searah gerak head, lalu berbalik arah.
+    Waktu layanan = io_burst + seek_time * jarak head (jarak hanya
+    bermakna untuk elevator; FIFO juga menggeser head jika seek_time > 0).
+    """
+
+    def __init__(self, name, servers=1, discipline='fifo', seek_time=0):
+        if discipline not in DISCIPLINES:
+            raise ValueError(f"Discipline tidak dikenal: {discipline} (pilih {', '.join(DISCIPLINES)})")
+        if servers < 1:
+            raise ValueError("Device harus punya minimal 1 server")
+        self.name = name
+        self.servers = servers
+        self.discipline = discipline
+        self.seek_time = seek_time
+        self.head = 0
+        self.busy = 0
+        self._fifo = deque()
+        # Elevator: posisi >= head (min-heap) dan < head (max-heap, kunci negatif)
+        self._up = []
+        self._down = []
+        self._ascending = True
+        self._seq = 0
+        # Statistik
+        self.requests = 0
+        self.busy_time = 0
+        self.queue_wait = 0
+        self.max_queue = 0
+
+    def __len__(self):
+        return len(self._fifo) + len(self._up) + len(self._down)
+
+    def enqueue(self, request):
+        """request = (posisi, waktu datang, proses)"""
+        position = request[0]
+        if self.discipline == 'fifo':
+            self._fifo.append(request)
+        else:
+            self._seq += 1
+            if position > self.head or (position == self.head and self._ascending):
+                heapq.heappush(self._up, (position, self._seq, request))
+            else:
+                heapq.heappush(self._down, (-position, self._seq, request))
+        if len(self) > self.max_queue:
+            self.max_queue = len(self)
+
+    def dequeue(self):
+        if self.discipline == 'fifo':
+            return self._fifo.popleft() if self._fifo else None
+        if self._ascending and not self._up and self._down:
+            self._ascending = False
+        elif not self._ascending and not self._down and self._up:
+            self._ascending = True
+        if self._ascending and self._up:
+            return heapq.heappop(self._up)[2]
+        if self._down:
+            return heapq.heappop(self._down)[2]
+        return None
+
+    def service_time(self, position, p):
+        distance = abs(position - self.head)
+        self.head = position
+        return p.io_burst + self.seek_time * distance
+
+
+class DeviceIO(IOSubsystem):
+    """Beberapa perangkat I/O dengan kontensi; permintaan menunggu jika semua server sibuk.
+
+    `assign(p)` memilih nama perangkat untuk satu permintaan (default:
+    atribut io_device proses jika ada, jika tidak hash PID) dan
+    `position(p)` posisi permintaan untuk elevator (default: hash PID
+    modulo `positions`). I/O mulai dihitung saat proses terblokir.
+    """
+
+    def __init__(self, devices, assign=None, position=None, positions=1024, rule=mlfq_io_rule):
+        if not devices:
+            raise ValueError("DeviceIO membutuhkan minimal satu Device")
+        super().__init__(rule)
+        self.devices = {device.name: device for device in devices}
+        self._names = [device.name for device in devices]
+        self._assign = assign or self._default_assign
+        self._position = position or (lambda p: zlib.crc32(str(p.pid).encode("utf-8")) % positions)
+        self._events = [] # (waktu selesai, urutan, proses, device, lama layanan)
+        self._seq = 0
+        self._waiting = 0
+        self._finished = [] # selesai tetapi belum diambil engine
+
+    def _default_assign(self, p):
+        name = getattr(p, 'io_device', None)
+        if name is not None:
+            return name
+        return self._names[zlib.crc32(str(p.pid).encode("utf-8")) % len(self._names)]
+
+    def _start(self, device, request, time):
+        position, arrived, p = request
+        device.busy += 1
+        device.queue_wait += time - arrived
+        duration = device.service_time(position, p)
+        self._seq += 1
+        heapq.heappush(self._events, (time + duration, self._seq, p, device, duration))
+
+    def submit(self, p, time, segment_start):
+        # Bebaskan dulu server yang layanannya sudah selesai sebelum permintaan ini datang
+        self._retire(time)
+        device = self.devices[self._assign(p)]
+        device.requests += 1
+        request = (self._position(p), time, p)
+        if device.busy < device.servers:
+            self._start(device, request, time)
+        else:
+            device.enqueue(request)
+            self._waiting += 1
+
+    def next_completion(self):
+        if self._finished:
+            return self._finished[0][0]
+        return self._events[0][0] if self._events else None
+
+    def pop_completed(self, time):
+        """(waktu selesai, proses) untuk semua I/O yang selesai <= time, urut menurut waktu selesai"""
+        self._retire(time)
+        finished = self._finished
+        self._finished = []
+        return finished
+
+    def _retire(self, time):
+        # Server yang bebas langsung mengambil permintaan berikutnya pada waktu selesai itu,
+        # jadi rantai layanan di dalam [.., time] ikut diproses
+        while self._events and self._events[0][0] <= time:
+            done_at, _, p, device, duration = heapq.heappop(self._events)
+            self._finished.append((done_at, p))
+            device.busy -= 1
+            device.busy_time += duration
+            request = device.dequeue()
+            if request is not None:
+                self._waiting -= 1
+                self._start(device, request, done_at)
+
+    def pending(self):
+        pending = list(self._finished) + [(event[0], event[2]) for event in self._events]
+        for device in self.devices.values():
+            queued = list(device._fifo) + [entry[2] for entry in device._up + device._down]
+            pending.extend((None, p) for _, _, p in queued)
+        return pending
+
+    def stats(self, end_time):
+        """Statistik per perangkat: jumlah permintaan, utilisasi (layanan yang sudah selesai), rata-rata tunggu antrian"""
+        stats = {}
+        for name, device in self.devices.items():
+            capacity = end_time * device.servers
+            stats[name] = {
+                'requests': device.requests,
+                'busy_time': device.busy_time,
+                'utilization': device.busy_time / capacity if capacity else 0.0,
+                'avg_queue_wait': device.queue_wait / device.requests if device.requests else 0.0,
+                'max_queue': device.max_queue,
+            }
+        return stats
+
+    def __len__(self):
+        return len(self._finished) + len(self._events) + self._waiting
@@ -1,14 +1,8 @@
 # main.py
-from process import Process
-from mlfq import mlfq_scheduler
-import matplotlib.pyplot as plt
-import pandas as pd
-# Anda perlu menginstal FPDF: pip install fpdf
-try:
-    from fpdf import FPDF
-except ImportError:
-    print("WARNING: FPDF library not found. PDF generation functionality is disabled. Install with: pip install fpdf")
-    FPDF = None
+from process import Process, ProcessTable
+from cache import cached_run
+# matplotlib, metrics (NumPy) dan fpdf di-import di dalam fungsi yang membutuhkannya,
+# sehingga modul ini bisa di-import dan disimulasikan tanpa biaya import library berat.
 
 # ----------------------------------------------------------------------
 # System Parameters (Sesuai Kebutuhan)
@@ -31,46 +25,29 @@ sample_processes = [
 # ----------------------------------------------------------------------
 # 1) Gantt Chart Drawer
 # ----------------------------------------------------------------------
-def draw_gantt_chart(timeline, title="Gantt Chart"):
-    # Filter timeline hingga MAX_TIME_UNITS
-    timeline_filtered = [(p, s, e) for p, s, e in timeline if s < MAX_TIME_UNITS]
+def draw_gantt_chart(timeline, title="Gantt Chart", output_path=None, t0=0, t1=MAX_TIME_UNITS):
+    import matplotlib.pyplot as plt
+    from gantt import render_gantt
 
+    # Jendela waktu [t0, t1] (default hingga MAX_TIME_UNITS); t1=None berarti sampai akhir timeline
     fig, gnt = plt.subplots(figsize=(15, 6))
-    gnt.set_title(title)
-    gnt.set_xlabel("Time (ms)")
-    gnt.set_ylabel("Processes")
+    render_gantt(gnt, timeline, t0, t1, title=title)
 
-    # Atur batas waktu
-    gnt.set_xlim(0, MAX_TIME_UNITS)
-
-    process_ids = list({item[0] for item in timeline_filtered})
-    process_ids.sort()
-
-    y_ticks = [15 + 10 * i for i in range(len(process_ids))]
-    gnt.set_yticks(y_ticks)
-    gnt.set_yticklabels(process_ids)
-    gnt.set_ylim(0, 10 * len(process_ids) + 10)
-    gnt.grid(True)
-
-    colors = plt.cm.get_cmap("tab20", len(process_ids))
-
-    for i, pid in enumerate(process_ids):
-        y_pos = 10 * i + 10
-        for start, end in [(s, min(e, MAX_TIME_UNITS)) for p, s, e in timeline_filtered if p == pid]:
-            # Hanya tampilkan bar jika durasinya > 0
-            if end > start:
-                gnt.broken_barh([(start, end - start)], (y_pos, 8), facecolors=colors(i))
-
-    plt.show()
+    if output_path:
+        plt.savefig(output_path, dpi=100)
+        plt.close(fig)
+    else:
+        plt.show()
 
 # ----------------------------------------------------------------------
 # 2) Dokumentasi Queue State Changes (Pretty Print)
 # ----------------------------------------------------------------------
-def print_queue_log(log):
+def print_queue_log(log, start=None, end=None):
+    # log adalah QueueLog: isi antrian direkonstruksi dari checkpoint + delta
     print("\n" + "="*50)
     print("2) DOKUMENTASI PERUBAHAN STATUS QUEUE (MLFQ)")
     print("="*50)
-    for entry in log:
+    for entry in log.entries(start, end):
         time = entry['time']
         action = entry['action']
         process = entry['process']
@@ -98,62 +75,139 @@ def print_queue_log(log):
 # ----------------------------------------------------------------------
 # 3) Kalkulasi Performance Metrics
 # ----------------------------------------------------------------------
-def calculate_metrics(processes):
+def calculate_metrics(processes, end_time=None, cores=1):
+    from metrics import ROW_HEADERS, compute_metrics, format_table, metric_rows, process_columns
+
     print("\n" + "="*50)
     print("3) KALKULASI PERFORMANCE METRICS")
     print("="*50)
 
-    completed_processes = [p for p in processes if p.completion_time is not None]
+    # Rumus TAT/WT/RT ada di metrics.py; ProcessTable dibaca langsung per kolom
+    columns = process_columns(processes)
+    # end_time = akhir simulasi (segmen terakhir); tanpa itu, run yang terpotong max_time
+    # dihitung hanya sampai completion terakhir dan utilisasi CPU bisa melebihi 100%
+    summary = compute_metrics(columns, end_time=end_time, cores=cores)
 
-    if not completed_processes:
+    if not summary['completed']:
         print("Tidak ada proses yang selesai dalam simulasi.")
         return
 
-    metrics_data = []
-
-    for p in completed_processes:
-        # Turnaround Time (TAT) = Completion Time - Arrival Time
-        tat = p.completion_time - p.arrival_time
-        # Waiting Time (WT) = Turnaround Time - Burst Time (total waktu CPU) - Total waktu I/O yang dilalui saat I/O selesai
-        # Dengan asumsi I/O Burst sudah dihitung secara internal oleh scheduler
-        # WT yang sudah dihitung di proses.py (p.wait_time) adalah waktu tunggu di queue.
-        # Mari kita hitung ulang dari formula dasar untuk WT:
-        wt = tat - p.burst_time
-        # Response Time (RT) = Start Time - Arrival Time
-        rt = p.start_time - p.arrival_time
-
-        metrics_data.append({
-            'Process': p.pid,
-            'Arrival Time': p.arrival_time,
-            'Burst Time': p.burst_time,
-            'Completion Time': p.completion_time,
-            'Start Time': p.start_time,
-            'Turnaround Time (TAT)': tat,
-            'Waiting Time (WT)': wt,
-            'Response Time (RT)': rt
-        })
-
-    df = pd.DataFrame(metrics_data)
-
-    # Hitung Rata-rata
-    avg_tat = df['Turnaround Time (TAT)'].mean()
-    avg_wt = df['Waiting Time (WT)'].mean()
-    avg_rt = df['Response Time (RT)'].mean()
-
-    print(df.to_string(index=False))
-    print(f"\nAverage Turnaround Time: {avg_tat:.2f} ms")
-    print(f"Average Waiting Time: {avg_wt:.2f} ms")
-    print(f"Average Response Time: {avg_rt:.2f} ms")
+    print(format_table(ROW_HEADERS, metric_rows(columns)))
+    print(f"\nAverage Turnaround Time: {summary['tat']['mean']:.2f} ms")
+    print(f"Average Waiting Time: {summary['wt']['mean']:.2f} ms")
+    print(f"Average Response Time: {summary['rt']['mean']:.2f} ms")
+    for key, label in (('tat', 'Turnaround Time'), ('wt', 'Waiting Time'), ('rt', 'Response Time')):
+        print(f"{label} p50/p95/p99: {summary[key]['p50']:.2f} / {summary[key]['p95']:.2f} / {summary[key]['p99']:.2f} ms")
+    print(f"CPU Utilization: {summary['cpu_utilization'] * 100:.2f}% | Throughput: {summary['throughput']:.4f} proses/ms")
+    for priority, group in sorted(summary['by_priority'].items()):
+        print(f"Prioritas {priority} ({group['count']} proses): "
+              f"TAT {group['tat']:.2f} ms, WT {group['wt']:.2f} ms, RT {group['rt']:.2f} ms")
     print("="*50)
 
 # ----------------------------------------------------------------------
 # FUNGSI GENERASI PDF
 # ----------------------------------------------------------------------
-def generate_pdf_report(timeline, log, processes, output_path="output/hasil.pdf"):
-    if FPDF is None:
-        print("\nPDF generation skipped. FPDF not installed.")
+LOG_MODES = ('auto', 'full', 'summary')
+
+
+def _format_log_entry(entry):
+    """Dua baris teks untuk satu event log (format laporan PDF)"""
+    base_msg = f"[T={entry['time']:02d}] {entry['action']}"
+    if entry['process']: base_msg += f" - P:{entry['process']}"
+    from_q, to_q = entry['from_q'], entry['to_q']
+    if from_q and to_q: base_msg += f" ({from_q} -> {to_q})"
+    elif from_q: base_msg += f" (From {from_q})"
+    elif to_q: base_msg += f" (To {to_q})"
+    q_str = ", ".join([f"{q}:{','.join(pids)}" for q, pids in entry['queues'].items()])
+    return base_msg, f"      -> Queues: {q_str} | IO:{','.join(entry['io_queue'])}"
+
+
+def _log_lines(log, mode='auto', limit=50, start=None, end=None):
+    """Baris bagian log untuk PDF, dihasilkan satu per satu.
+
+    mode 'full' menulis semua event di jendela [start, end] (satu "halaman"
+    log), 'summary' menulis jumlah event per action ditambah `limit` event
+    pertama dan terakhir, 'auto' memilih 'full' jika log cukup kecil.
+    """
+    if mode not in LOG_MODES:
+        raise ValueError(f"Mode log tidak dikenal: {mode} (pilih {', '.join(LOG_MODES)})")
+    windowed = start is not None or end is not None
+    if mode == 'auto':
+        mode = 'full' if windowed or len(log) <= 2 * limit else 'summary'
+
+    if mode == 'full':
+        for entry in log.entries(start, end):
+            yield from _format_log_entry(entry)
         return
 
+    yield f"Total event: {len(log)}"
+    for action, count in log.action_counts().most_common():
+        yield f"  {action}: {count}"
+    yield ""
+    yield f"{min(limit, len(log))} event pertama:"
+    for entry in log[:limit]:
+        yield from _format_log_entry(entry)
+    if len(log) > limit:
+        yield ""
+        yield f"{min(limit, len(log) - limit)} event terakhir:"
+        for entry in log[max(limit, len(log) - limit):]:
+            yield from _format_log_entry(entry)
+
+
+def _chart_png(timeline, max_time):
+    """Render Gantt chart ke buffer PNG di memori (tanpa file di direktori kerja)"""
+    import io
+    from matplotlib.figure import Figure
+    from gantt import render_gantt
+
+    # Figure tanpa pyplot: tidak bergantung backend GUI dan aman dipanggil paralel
+    fig = Figure(figsize=(15, 6))
+    gnt = fig.add_subplot()
+    render_gantt(gnt, timeline, 0, max_time, title=f"1) Gantt Chart (Max Time = {max_time}ms)")
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=100)
+    buffer.seek(0)
+    return buffer
+
+
+def _pdf_image(pdf, buffer, w):
+    """Sisipkan PNG dari buffer; fpdf 1.x hanya menerima nama file"""
+    import fpdf
+
+    if int(fpdf.FPDF_VERSION.split(".")[0]) >= 2:
+        pdf.image(buffer, w=w)
+        return
+    import os
+    import tempfile
+
+    # File sementara dengan nama unik, dihapus setelah gambar dibaca
+    fd, path = tempfile.mkstemp(suffix=".png")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buffer.getvalue())
+        pdf.image(path, w=w)
+    finally:
+        os.remove(path)
+
+
+def generate_pdf_report(timeline, log, processes, output_path="output/hasil.pdf",
+                        time_quantums=TIME_QUANTUMS, aging_threshold=AGING_THRESHOLD, max_time=MAX_TIME_UNITS,
+                        log_mode='auto', log_limit=50, log_start=None, log_end=None, table_limit=200, cores=1):
+    """Tulis laporan PDF (Gantt chart, log antrian, metrik, perbandingan Windows).
+
+    Chart dirender ke memori dan bagian log dibatasi lewat log_mode/log_limit
+    atau jendela [log_start, log_end], tabel metrik dibatasi table_limit baris.
+    Dokumen tetap dibangun utuh di memori oleh fpdf lalu ditulis sekali oleh
+    output(), jadi tidak ditulis ke disk secara bertahap.
+    """
+    # Anda perlu menginstal FPDF: pip install fpdf
+    try:
+        from fpdf import FPDF
+    except ImportError:
+        print("\nPDF generation skipped. FPDF not installed. Install with: pip install fpdf")
+        return
+    from metrics import compute_metrics, metric_rows, process_columns
+
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
@@ -162,43 +216,14 @@ def generate_pdf_report(timeline, log, processes, output_path="output/hasil.pdf"
     # Judul
     pdf.cell(0, 10, "Laporan Simulasi MLFQ Scheduler", 0, 1, "C")
     pdf.set_font("Arial", "", 10)
-    pdf.cell(0, 5, f"Parameter: TQ={TIME_QUANTUMS}, Aging={AGING_THRESHOLD}ms, Max Time={MAX_TIME_UNITS}ms", 0, 1)
+    pdf.cell(0, 5, f"Parameter: TQ={time_quantums}, Aging={aging_threshold}ms, Max Time={max_time}ms", 0, 1)
 
     # ----------------------------------------
     # 1) Gantt Chart
     # ----------------------------------------
-    gantt_chart_filename = "gantt_chart.png"
-
-    # Generate Gantt Chart PNG (perlu disimpan dulu)
-    fig, gnt = plt.subplots(figsize=(15, 6))
-    # ... (Isi dari draw_gantt_chart, tanpa plt.show()) ...
-    # Salin isi draw_gantt_chart ke sini untuk menyimpan gambar
-
-    timeline_filtered = [(p, s, e) for p, s, e in timeline if s < MAX_TIME_UNITS]
-    gnt.set_title(f"1) Gantt Chart (Max Time = {MAX_TIME_UNITS}ms)")
-    gnt.set_xlabel("Time (ms)")
-    gnt.set_ylabel("Processes")
-    gnt.set_xlim(0, MAX_TIME_UNITS)
-    process_ids = list({item[0] for item in timeline_filtered})
-    process_ids.sort()
-    y_ticks = [15 + 10 * i for i in range(len(process_ids))]
-    gnt.set_yticks(y_ticks)
-    gnt.set_yticklabels(process_ids)
-    gnt.set_ylim(0, 10 * len(process_ids) + 10)
-    gnt.grid(True)
-    colors = plt.cm.get_cmap("tab20", len(process_ids))
-    for i, pid in enumerate(process_ids):
-        y_pos = 10 * i + 10
-        for start, end in [(s, min(e, MAX_TIME_UNITS)) for p, s, e in timeline_filtered if p == pid]:
-            if end > start:
-                gnt.broken_barh([(start, end - start)], (y_pos, 8), facecolors=colors(i))
-
-    plt.savefig(gantt_chart_filename, dpi=100)
-    plt.close(fig)
-
     pdf.set_font("Arial", "B", 12)
     pdf.cell(0, 10, "1) Gantt Chart", 0, 1)
-    pdf.image(gantt_chart_filename, w=pdf.w - 20)
+    _pdf_image(pdf, _chart_png(timeline, max_time), w=pdf.w - 20)
     pdf.ln(5)
 
     # ----------------------------------------
@@ -208,47 +233,22 @@ def generate_pdf_report(timeline, log, processes, output_path="output/hasil.pdf"
     pdf.cell(0, 10, "2) Dokumentasi Perubahan Status Queue", 0, 1)
     pdf.set_font("Courier", "", 8)
 
-    for entry in log:
-        time = entry['time']
-        action = entry['action']
-        process = entry['process']
-        from_q = entry['from_q']
-        to_q = entry['to_q']
-        q_status = entry['queues']
-        io_queue = entry['io_queue']
-
-        base_msg = f"[T={time:02d}] {action}"
-        if process: base_msg += f" - P:{process}"
-        if from_q and to_q: base_msg += f" ({from_q} -> {to_q})"
-        elif from_q: base_msg += f" (From {from_q})"
-        elif to_q: base_msg += f" (To {to_q})"
-
-        pdf.cell(0, 4, base_msg, 0, 1)
-        q_str = ", ".join([f"{q}:{','.join(pids)}" for q, pids in q_status.items()])
-        io_str = f"IO:{','.join(io_queue)}"
-        pdf.cell(0, 4, f"      -> Queues: {q_str} | {io_str}", 0, 1)
+    for line in _log_lines(log, log_mode, log_limit, log_start, log_end):
+        pdf.cell(0, 4, line, 0, 1)
 
     # ----------------------------------------
     # 3) Performance Metrics
     # ----------------------------------------
-    completed_processes = [p for p in processes if p.completion_time is not None]
-    metrics_data = []
-    if completed_processes:
-        for p in completed_processes:
-            tat = p.completion_time - p.arrival_time
-            wt = tat - p.burst_time
-            rt = p.start_time - p.arrival_time
-            metrics_data.append({
-                'Process': p.pid, 'AT': p.arrival_time, 'BT': p.burst_time, 'CT': p.completion_time,
-                'ST': p.start_time, 'TAT': tat, 'WT': wt, 'RT': rt
-            })
-        df = pd.DataFrame(metrics_data)
-
+    columns = process_columns(processes)
+    # Sama seperti calculate_metrics: akhir simulasi = end segmen terbesar (timeline SMP tidak urut end)
+    end_time = max((end for _, _, end in timeline), default=None)
+    summary = compute_metrics(columns, end_time=end_time, cores=cores)
+    if summary['completed']:
         pdf.add_page()
         pdf.set_font("Arial", "B", 12)
         pdf.cell(0, 10, "3) Kalkulasi Performance Metrics", 0, 1)
 
-        # Tabel
+        # Tabel (hanya table_limit baris pertama; sisanya diwakili ringkasan persentil)
         col_width = pdf.w / 8.5
         pdf.set_font("Arial", "B", 8)
         headers = ['Process', 'AT', 'BT', 'CT', 'ST', 'TAT', 'WT', 'RT']
@@ -257,20 +257,28 @@ def generate_pdf_report(timeline, log, processes, output_path="output/hasil.pdf"
         pdf.ln()
 
         pdf.set_font("Arial", "", 8)
-        for row in df.itertuples():
-            for i, val in enumerate(row[1:]): # row[0] is index
+        rows = metric_rows(columns)
+        for row in rows[:table_limit]:
+            for val in row:
                 pdf.cell(col_width, 6, str(val), 1, 0, "C")
             pdf.ln()
+        if len(rows) > table_limit:
+            pdf.cell(0, 6, f"... {len(rows) - table_limit} proses lain tidak ditampilkan", 0, 1)
 
         # Rata-rata
         pdf.ln(2)
-        avg_tat = df['TAT'].mean()
-        avg_wt = df['WT'].mean()
-        avg_rt = df['RT'].mean()
+        avg_tat = summary['tat']['mean']
+        avg_wt = summary['wt']['mean']
+        avg_rt = summary['rt']['mean']
         pdf.set_font("Arial", "B", 10)
         pdf.cell(0, 5, f"Average Turnaround Time: {avg_tat:.2f} ms", 0, 1)
         pdf.cell(0, 5, f"Average Waiting Time: {avg_wt:.2f} ms", 0, 1)
         pdf.cell(0, 5, f"Average Response Time: {avg_rt:.2f} ms", 0, 1)
+        if len(rows) > table_limit:
+            pdf.set_font("Arial", "", 8)
+            for key, label in (('tat', 'Turnaround Time'), ('wt', 'Waiting Time'), ('rt', 'Response Time')):
+                pdf.cell(0, 5, f"{label} p50/p95/p99/max: {summary[key]['p50']:.2f} / {summary[key]['p95']:.2f} / "
+                               f"{summary[key]['p99']:.2f} / {summary[key]['max']:.2f} ms", 0, 1)
 
     # ----------------------------------------
     # 4) Comparison with Windows
@@ -299,38 +307,6 @@ def generate_pdf_report(timeline, log, processes, output_path="output/hasil.pdf"
 
 
 
-# ----------------------------------------------------------------------
-# Main Execution
-# ----------------------------------------------------------------------
-# ----------------------------------------------------------------------
-# Main Execution (Diubah untuk PDF dan Konsol)
-# ----------------------------------------------------------------------
-# ... (Proses Eksekusi di Konsol) ...
-# Clone proses agar bisa direset untuk berbagai skenario (walaupun di sini hanya MLFQ)
-processes_for_mlfq = [Process(p.pid, p.arrival_time, p.burst_time, p.io_burst, p.original_priority) for p in sample_processes]
-
-print(f"Running MLFQ with 3 Queues (TQs: {TIME_QUANTUMS}, Aging: {AGING_THRESHOLD}):")
-timeline_mlfq, log_mlfq = mlfq_scheduler(
-    processes_for_mlfq,
-    time_quantums=TIME_QUANTUMS,
-    aging_threshold=AGING_THRESHOLD,
-    max_time=MAX_TIME_UNITS
-)
-
-# 1) Gantt Chart (Akan muncul di window terpisah)
-draw_gantt_chart(timeline_mlfq, f"1) FCFS Scheduler (Max Time = {MAX_TIME_UNITS}ms)")
-
-# 2) Queue Log
-print_queue_log(log_mlfq)
-
-# 3) Performance Metrics
-calculate_metrics(processes_for_mlfq)
-
-# GENERASI PDF
-# generate_pdf_report(timeline_mlfq, log_mlfq, processes_for_mlfq, output_path="output/hasil.pdf")
-
-# *Catatan: Untuk menjalankan fungsi generate_pdf_report, Anda harus memastikan file .py yang lain
-# (process.py, mlfq.py) sudah dimodifikasi sesuai jawaban sebelumnya dan semua library (matplotlib, pandas, fpdf) sudah terinstal.*
 # ----------------------------------------------------------------------
 # 4) Comparison dengan Windows Task Manager priority behavior
 # ----------------------------------------------------------------------
@@ -353,4 +329,41 @@ def compare_with_windows_priority():
     print("- **Penanganan I/O**: Di Windows, proses yang beralih dari I/O menjadi *ready* sering menerima *priority boost* agar cepat mendapatkan CPU lagi dan terus memproses I/O berikutnya, mirip dengan proses di MLFQ yang kembali ke *queue* atas setelah I/O, untuk mendukung proses *I/O-bound*.")
     print("="*50)
 
-compare_with_windows_priority()
+
+# ----------------------------------------------------------------------
+# Main Execution (Diubah untuk PDF dan Konsol)
+# ----------------------------------------------------------------------
+def main():
+    # Simpan workload sebagai ProcessTable; skenario lain cukup memanggil .reset() (walaupun di sini hanya MLFQ)
+    processes_for_mlfq = ProcessTable.from_processes(sample_processes)
+
+    print(f"Running MLFQ with 3 Queues (TQs: {TIME_QUANTUMS}, Aging: {AGING_THRESHOLD}):")
+    # Hasil di-cache berdasarkan hash workload, parameter dan versi kode scheduler (disk hanya jika SCHED_SIM_CACHE di-set)
+    timeline_mlfq, log_mlfq = cached_run(
+        'mlfq',
+        processes_for_mlfq,
+        time_quantums=TIME_QUANTUMS,
+        aging_threshold=AGING_THRESHOLD,
+        max_time=MAX_TIME_UNITS
+    )
+
+    # 1) Gantt Chart (Akan muncul di window terpisah)
+    draw_gantt_chart(timeline_mlfq, f"1) FCFS Scheduler (Max Time = {MAX_TIME_UNITS}ms)")
+
+    # 2) Queue Log
+    print_queue_log(log_mlfq)
+
+    # 3) Performance Metrics
+    calculate_metrics(processes_for_mlfq, end_time=timeline_mlfq[-1][2] if timeline_mlfq else None)
+
+    # GENERASI PDF
+    # generate_pdf_report(timeline_mlfq, log_mlfq, processes_for_mlfq, output_path="output/hasil.pdf")
+
+    # 4) Comparison dengan Windows Task Manager priority behavior
+    compare_with_windows_priority()
+
+    # Subcommand simulate/metrics/gantt/report tersedia lewat: python cli.py --help
+
+
+if __name__ == "__main__":
+    main()
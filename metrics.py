@@ -0,0 +1,192 @@
+# metrics.py
+import operator
+
+from process import ProcessTable
+
+# NumPy dipakai jika tersedia; tanpa NumPy dihitung dengan Python murni
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PERCENTILES = (50, 95, 99)
+_NONE = -1 # Penanda start/completion yang belum ada
+
+ROW_HEADERS = ['Process', 'Arrival Time', 'Burst Time', 'Completion Time', 'Start Time',
+               'Turnaround Time (TAT)', 'Waiting Time (WT)', 'Response Time (RT)']
+
+
+def process_columns(processes):
+    """Kolom arrival/burst/start/completion/priority/remaining dari workload.
+
+    ProcessTable dipakai langsung tanpa membuat objek per proses; list
+    Process dikonversi sekali dengan None diganti penanda -1.
+    """
+    if isinstance(processes, ProcessTable):
+        return {
+            'pid': processes.pids,
+            'arrival': processes.arrival_time,
+            'burst': processes.burst_time,
+            'start': processes.start_time,
+            'completion': processes.completion_time,
+            'priority': processes.original_priority,
+            'remaining': processes.remaining_time,
+        }
+    processes = list(processes)
+    return {
+        'pid': [p.pid for p in processes],
+        'arrival': [p.arrival_time for p in processes],
+        'burst': [p.burst_time for p in processes],
+        'start': [_NONE if p.start_time is None else p.start_time for p in processes],
+        'completion': [_NONE if p.completion_time is None else p.completion_time for p in processes],
+        'priority': [p.original_priority for p in processes],
+        'remaining': [p.remaining_time for p in processes],
+    }
+
+
+# ----------------------------------------------------------------------
+# Operasi elemen-per-elemen (NumPy atau list Python)
+# ----------------------------------------------------------------------
+def _column(values):
+    return np.asarray(values) if np is not None else list(values)
+
+def _sub(x, y):
+    return x - y if np is not None else list(map(operator.sub, x, y))
+
+def _div(x, y):
+    if np is not None:
+        return x / np.where(y == 0, 1, y)
+    return [a / (b or 1) for a, b in zip(x, y)]
+
+def _select(values, mask):
+    if np is not None:
+        return values[mask]
+    return [v for v, keep in zip(values, mask) if keep]
+
+def _percentile(sorted_values, q):
+    # Interpolasi linear, sama seperti numpy.percentile bawaan
+    pos = (len(sorted_values) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+def _summary(values, percentiles):
+    n = len(values)
+    if n == 0:
+        return None
+    if np is not None:
+        result = {'mean': float(values.mean()), 'max': values.max().item()}
+        for q, v in zip(percentiles, np.percentile(values, percentiles)):
+            result[f'p{q}'] = float(v)
+        return result
+    ordered = sorted(values)
+    result = {'mean': sum(ordered) / n, 'max': ordered[-1]}
+    for q in percentiles:
+        result[f'p{q}'] = _percentile(ordered, q)
+    return result
+
+
+# ----------------------------------------------------------------------
+# Metrik per proses dan ringkasan
+# ----------------------------------------------------------------------
+def per_process(columns):
+    """TAT, WT, RT dan slowdown untuk proses yang selesai (satu-satunya tempat rumusnya)"""
+    completion = _column(columns['completion'])
+    done = completion >= 0 if np is not None else [c >= 0 for c in completion]
+
+    arrival = _select(_column(columns['arrival']), done)
+    burst = _select(_column(columns['burst']), done)
+    start = _select(_column(columns['start']), done)
+    completion = _select(completion, done)
+
+    # Turnaround Time (TAT) = Completion Time - Arrival Time
+    tat = _sub(completion, arrival)
+    # Waiting Time (WT) = Turnaround Time - Burst Time
+    wt = _sub(tat, burst)
+    # Response Time (RT) = Start Time - Arrival Time
+    rt = _sub(start, arrival)
+
+    return {
+        'done': done,
+        'arrival': arrival,
+        'burst': burst,
+        'completion': completion,
+        'start': start,
+        'priority': _select(_column(columns['priority']), done),
+        'tat': tat,
+        'wt': wt,
+        'rt': rt,
+        'slowdown': _div(tat, burst),
+    }
+
+def metric_rows(columns):
+    """Baris tabel metrik (urutan kolom sesuai ROW_HEADERS)"""
+    rows = per_process(columns)
+    pids = [pid for pid, keep in zip(columns['pid'], rows['done']) if keep]
+    return list(zip(pids, *(rows[k].tolist() if np is not None else rows[k]
+                            for k in ('arrival', 'burst', 'completion', 'start', 'tat', 'wt', 'rt'))))
+
+def compute_metrics(columns, end_time=None, percentiles=PERCENTILES, cores=1):
+    """Ringkasan metrik: rata-rata + persentil, utilisasi CPU (rata-rata per core), throughput, per prioritas"""
+    rows = per_process(columns)
+    completed = len(rows['tat'])
+    result = {
+        'count': len(columns['pid']),
+        'completed': completed,
+        'tat': _summary(rows['tat'], percentiles),
+        'wt': _summary(rows['wt'], percentiles),
+        'rt': _summary(rows['rt'], percentiles),
+        'slowdown': _summary(rows['slowdown'], percentiles),
+        'cpu_utilization': None,
+        'throughput': None,
+        'by_priority': _by_priority(rows),
+    }
+    if not result['count']:
+        return result
+
+    # Waktu CPU terpakai: burst penuh untuk yang selesai, sebagian untuk yang belum
+    burst = _column(columns['burst'])
+    used = _sub(burst, _column(columns['remaining']))
+    if np is not None:
+        busy = np.where(rows['done'], burst, used).sum().item()
+        first_arrival = _column(columns['arrival']).min().item()
+        last_completion = rows['completion'].max().item() if completed else first_arrival
+    else:
+        busy = sum(b if keep else u for b, u, keep in zip(burst, used, rows['done']))
+        first_arrival = min(columns['arrival'])
+        last_completion = max(rows['completion']) if completed else first_arrival
+    if end_time is None:
+        end_time = last_completion
+    span = end_time - first_arrival
+    if span > 0:
+        result['cpu_utilization'] = busy / (span * cores)
+        result['throughput'] = completed / span
+    return result
+
+def _by_priority(rows):
+    groups = {}
+    if np is not None and len(rows['priority']):
+        levels, inverse = np.unique(rows['priority'], return_inverse=True)
+        counts = np.bincount(inverse)
+        for key in ('tat', 'wt', 'rt'):
+            sums = np.bincount(inverse, weights=rows[key])
+            for level, count, total in zip(levels.tolist(), counts.tolist(), sums.tolist()):
+                groups.setdefault(level, {'count': count})[key] = total / count
+        return groups
+    for i, level in enumerate(rows['priority']):
+        group = groups.setdefault(level, {'count': 0, 'tat': 0, 'wt': 0, 'rt': 0})
+        group['count'] += 1
+        for key in ('tat', 'wt', 'rt'):
+            group[key] += rows[key][i]
+    for group in groups.values():
+        for key in ('tat', 'wt', 'rt'):
+            group[key] /= group['count']
+    return groups
+
+def format_table(headers, rows):
+    """Tabel teks rata kanan, mirip DataFrame.to_string(index=False)"""
+    cells = [[str(v) for v in row] for row in rows]
+    widths = [max([len(h)] + [len(row[i]) for row in cells]) for i, h in enumerate(headers)]
+    lines = ["  ".join(h.rjust(w) for h, w in zip(headers, widths))]
+    lines.extend("  ".join(v.rjust(w) for v, w in zip(row, widths)) for row in cells)
+    return "\n".join(lines)
@@ -1,39 +1,295 @@
 # mlfq.py
-from collections import deque
+import heapq
+import json
+import zlib
+from array import array
 
-def mlfq_scheduler(processes, time_quantums, aging_threshold, max_time):
-    # Asumsi: time_quantums = [tq_level1, tq_level2, tq_level3]
-    # Prioritas level: Level 3 (indeks 2) tertinggi, Level 1 (indeks 0) terendah.
-    # Kita menggunakan indeks 0, 1, 2 untuk Level 1, 2, 3 agar sesuai dengan list time_quantums.
-    NUM_QUEUES = 3
-    queues = [deque() for _ in range(NUM_QUEUES)]
+from process import _NONE, ProcessTable, arrival_order
+from queue_log import NullQueueLog, QueueLog
+from ready_queue import AgingIndex, LevelSet, level_thresholds
+from rr import max_full_rounds
+from stream import EVENT, SEGMENT, SPAN, expand_span
 
-    # Urutkan berdasarkan waktu kedatangan
-    all_processes = sorted(processes, key=lambda p: p.arrival_time)
+NUM_QUEUES = 3 # Jumlah level default (sample_processes memakai prioritas 1..3)
+SNAPSHOT_VERSION = 1
 
-    time = 0
-    process_idx = 0
+
+class MLFQState:
+    """State lengkap scheduler MLFQ di antara dua iterasi loop.
+
+    Berisi waktu simulasi, indeks kedatangan berikutnya, isi antrian per
+    level, io_queue, indeks aging, dan (lewat proses-prosesnya) state run
+    setiap proses. mlfq_stream memperbarui objek ini selama berjalan,
+    sehingga setelah stream habis state bisa di-snapshot, dilanjutkan
+    dengan max_time lebih besar, atau di-fork ke beberapa skenario.
+    """
+
+    def __init__(self, processes, num_levels=NUM_QUEUES):
+        # Urutkan berdasarkan waktu kedatangan
+        self.processes = arrival_order(processes)
+        self.time = 0
+        self.process_idx = 0
+        # Indeks 0..N-1 untuk Level 1..N (sesuai list time_quantums), dengan bitmask level berisi
+        self.queues = LevelSet(num_levels)
+        # Indeks aging per level, terurut menurut last_run_time
+        self.aging = AgingIndex(num_levels)
+        # Waktu priority boost berkala berikutnya (None: belum dijadwalkan)
+        self.next_boost = None
+        # Proses yang sedang I/O (dict terurut: urutan masuk dipertahankan untuk log)
+        self.io_queue = {}
+
+    @property
+    def num_levels(self):
+        return len(self.queues)
+
+    @property
+    def finished(self):
+        return not (any(self.queues) or self.process_idx < len(self.processes) or self.io_queue)
+
+    def snapshot(self):
+        """Snapshot ringkas berupa dict list/angka (bisa di-pickle atau di-JSON-kan).
+
+        Proses dirujuk lewat indeksnya di urutan kedatangan, kolom statis dan
+        state run disimpan per kolom seperti ProcessTable.
+        """
+        procs = self.processes
+        index = {p: i for i, p in enumerate(procs)}
+        return {
+            'version': SNAPSHOT_VERSION,
+            'time': self.time,
+            'process_idx': self.process_idx,
+            'pids': [p.pid for p in procs],
+            'static': {name: [getattr(p, name) for p in procs] for name in ProcessTable.STATIC_COLUMNS},
+            'run': {name: [getattr(p, name) for p in procs] for name in ProcessTable.RUN_COLUMNS},
+            'queues': [[index[p] for p in q] for q in self.queues],
+            'io_queue': [index[p] for p in self.io_queue],
+            'next_boost': self.next_boost,
+        }
+
+    @classmethod
+    def restore(cls, snapshot, processes=None):
+        """Bangun kembali state dari snapshot.
+
+        Tanpa `processes`, proses dibuat ulang sebagai ProcessTable baru
+        (independen dari run asal). Dengan `processes`, state run ditulis ke
+        proses yang PID-nya sama.
+        """
+        if snapshot.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"Versi snapshot MLFQ tidak didukung: {snapshot.get('version')}")
+        run = snapshot['run']
+        if processes is None:
+            static = snapshot['static']
+            table = ProcessTable(snapshot['pids'], static['arrival_time'], static['burst_time'],
+                                 static['io_burst'], static['original_priority'])
+            for name in ProcessTable.RUN_COLUMNS:
+                column = getattr(table, name)
+                setattr(table, name, array(column.typecode, [_NONE if v is None else v for v in run[name]]))
+            procs = list(table)
+        else:
+            by_pid = {p.pid: p for p in processes}
+            procs = [by_pid[pid] for pid in snapshot['pids']]
+            for name in ProcessTable.RUN_COLUMNS:
+                for p, value in zip(procs, run[name]):
+                    setattr(p, name, value)
+
+        num_levels = len(snapshot['queues'])
+        state = cls(procs, num_levels)
+        state.time = snapshot['time']
+        state.process_idx = snapshot['process_idx']
+        for level, members in enumerate(snapshot['queues']):
+            for i in members:
+                state.queues.append(level, procs[i])
+                if level < num_levels - 1:
+                    state.aging.add(procs[i], level)
+        state.io_queue = dict.fromkeys(procs[i] for i in snapshot['io_queue'])
+        state.next_boost = snapshot.get('next_boost')
+        return state
+
+    def fork(self):
+        """Salinan independen (proses baru) untuk skenario what-if"""
+        return MLFQState.restore(self.snapshot())
+
+    def seed_log(self, log):
+        """Catat isi antrian saat ini ke log baru, agar event setelah resume memuat antrian yang benar"""
+        for level, queue in enumerate(self.queues):
+            for p in queue:
+                log.append(level, p.pid)
+        for p in self.io_queue:
+            log.io_append(p.pid)
+
+
+def dump_snapshot(snapshot):
+    """Serialisasi snapshot ke bytes (JSON terkompresi zlib)"""
+    return zlib.compress(json.dumps(snapshot, separators=(',', ':')).encode("utf-8"))
+
+def load_snapshot(data):
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def mlfq_scheduler(processes, time_quantums, aging_threshold, max_time, checkpoint_interval=256, state=None,
+                   fast_forward=False, profile=None, boost_step=1, boost_interval=None):
+    """Jalankan MLFQ hingga max_time; mengembalikan (timeline, QueueLog).
+
+    Jika `state` (MLFQState) diberikan, simulasi dilanjutkan dari state itu
+    (processes diabaikan) dan timeline/log hanya berisi rentang waktu baru.
+    Dengan fast_forward=True, SPAN diurai kembali per slice (proses yang
+    berjalan sendirian tetap satu segmen gabungan) dan log mencatat satu
+    event "RR Fast-Forward L1" untuk setiap rentang yang dilompati.
+    Jika `profile` (instrument.SchedulerProfile) diberikan, statistik per
+    fase dicatat ke sana. boost_step dan boost_interval sama seperti di
+    mlfq_stream.
+    """
+    log = QueueLog(len(time_quantums), checkpoint_interval)
+    if state is not None:
+        state.seed_log(log)
     timeline = []
-    log = []
+    for kind, payload in mlfq_stream(processes, time_quantums, aging_threshold, max_time, log, state, fast_forward,
+                                     profile, boost_step, boost_interval):
+        if kind == SEGMENT:
+            timeline.append(payload)
+        elif kind == SPAN:
+            timeline.extend(expand_span(payload))
+    return timeline, log
+
+def mlfq_fork(state, time_quantum_grid, aging_threshold, max_time, checkpoint_interval=256):
+    """Lanjutkan satu state ke beberapa skenario time_quantums sekaligus.
+
+    State asal tidak diubah; mengembalikan list (time_quantums, timeline, log, state_baru).
+    """
+    snapshot = state.snapshot() if isinstance(state, MLFQState) else state
+    results = []
+    for time_quantums in time_quantum_grid:
+        branch = MLFQState.restore(snapshot)
+        timeline, log = mlfq_scheduler(None, time_quantums, aging_threshold, max_time, checkpoint_interval, branch)
+        results.append((time_quantums, timeline, log, branch))
+    return results
 
-    # Antrian untuk proses yang sedang I/O
-    io_queue = []
+def _stable_l1_rounds(queues, io_queue, time_quantum, aging_threshold, time, next_arrival, max_time, next_boost=None):
+    """Jumlah ronde RR penuh di Level 1 yang bisa dihitung sekaligus (0 jika tidak aman).
+
+    Aman jika hanya Level 1 yang berisi, tidak ada proses I/O, tidak ada
+    proses yang selesai, memicu I/O atau dipromosikan aging, dan tidak ada
+    kedatangan, priority boost atau max_time sebelum slice terakhir dimulai.
+    """
+    # Hanya bit Level 1 yang menyala di bitmask
+    if io_queue or queues.mask != 1:
+        return 0
+    level = queues[0]
+    n = len(level)
+    # aging_threshold None: Level 1 adalah level tertinggi, tidak ada aging
+    # Setelah ronde pertama, proses menunggu (n-1) slice sebelum jalan lagi
+    if aging_threshold is not None and (n - 1) * time_quantum >= aging_threshold:
+        return 0
+    rounds = None
+    for j, p in enumerate(level):
+        # io_count == 0: service < burst tidak pernah kelipatan burst, jadi I/O tidak terpicu
+        if p.io_burst > 0 and p.burst_time // (p.io_count + 1) != p.burst_time:
+            return 0
+        if aging_threshold is not None and time + j * time_quantum - p.last_run_time >= aging_threshold:
+            return 0
+        k = max_full_rounds(p.remaining_time, time_quantum)
+        rounds = k if rounds is None else min(rounds, k)
+        if not rounds:
+            return 0
+    for limit in (next_arrival, next_boost, max_time):
+        if limit is not None:
+            # Slice terakhir harus dimulai sebelum limit: (rounds*n - 1) * q < limit - time
+            rounds = min(rounds, max_full_rounds(limit - time + time_quantum, n * time_quantum))
+    return rounds
+
+def mlfq_stream(processes, time_quantums, aging_threshold, max_time, log=None, state=None, fast_forward=False,
+                profile=None, boost_step=1, boost_interval=None):
+    """Versi generator mlfq_scheduler: segmen dan event dihasilkan satu per satu.
+
+    Jika `log` (QueueLog) diberikan, perubahan antrian juga dicatat ke sana;
+    tanpa log, tidak ada yang diakumulasi selama simulasi. Jika `state`
+    diberikan, simulasi dilanjutkan dari state itu dan state diperbarui;
+    snapshot hanya konsisten setelah stream habis.
+
+    Dengan fast_forward=True, rentang di mana Level 1 berjalan sebagai RR
+    murni (lihat _stable_l1_rounds) dihitung sekaligus dan dihasilkan
+    sebagai satu SPAN (atau satu SEGMENT jika hanya ada satu proses),
+    diikuti satu event "RR Fast-Forward L1". State proses tetap sama
+    persis dengan simulasi per slice; urutan antrian tidak berubah.
+
+    Batas rentang fast-forward bergantung pada max_time, jadi run yang
+    dipotong lalu dilanjutkan dari state tidak stabil terhadap resume:
+    segmen solo bisa terbelah di titik potong dan event "Quantum Exceeded,
+    Requeue L1" / "RR Fast-Forward L1" bisa berbeda. Yang tetap dijamin
+    (sama seperti run per slice tanpa potongan): state akhir setiap
+    proses dan antrian, timeline setelah export.coalesce_timeline, dan
+    semua event log lainnya.
+
+    Jika `profile` (instrument.SchedulerProfile) diberikan, jumlah panggilan,
+    wall time dan alokasi per fase serta panjang maksimum antrian dicatat;
+    tanpa profile tidak ada pengukuran sama sekali.
+
+    Aging mempromosikan `boost_step` level sekaligus (None: langsung ke
+    level tertinggi). Dengan boost_interval, setiap kelipatan interval itu
+    semua proses yang menunggu di level bawah dipindah ke belakang level
+    tertinggi (event "Priority Boost"), level atas lebih dulu. Aturannya
+    sama dengan policies.MLFQPolicy.
+    """
+    if boost_step is not None and boost_step < 1:
+        raise ValueError("boost_step harus >= 1 (atau None untuk langsung ke level tertinggi)")
+    if boost_interval is not None and boost_interval <= 0:
+        raise ValueError("boost_interval harus positif")
+    stream = _mlfq_stream(processes, time_quantums, aging_threshold, max_time, log, state, fast_forward, profile,
+                          boost_step, boost_interval)
+    return profile.wrap(stream) if profile is not None else stream
+
+def _mlfq_stream(processes, time_quantums, aging_threshold, max_time, log, state, fast_forward, profile, boost_step,
+                 boost_interval):
+    # time_quantums = [tq_level1, ..., tq_levelN]; jumlah level = len(time_quantums)
+    # Prioritas level: Level N (indeks N-1) tertinggi, Level 1 (indeks 0) terendah.
+    # Kita menggunakan indeks 0..N-1 untuk Level 1..N agar sesuai dengan list time_quantums.
+    num_levels = len(time_quantums)
+    if state is None:
+        state = MLFQState(processes, num_levels)
+    elif state.num_levels != num_levels:
+        raise ValueError(f"State MLFQ memiliki {state.num_levels} level, time_quantums {num_levels}")
+    thresholds = level_thresholds(aging_threshold, num_levels)
+    # Bit level yang ikut aging (semua kecuali level tertinggi)
+    aging_mask = (1 << (num_levels - 1)) - 1
+    top = num_levels - 1
+    if boost_interval is None:
+        state.next_boost = None
+    elif state.next_boost is None:
+        state.next_boost = boost_interval
+    next_boost = state.next_boost
+    queues = state.queues
+    aging = state.aging
+    all_processes = state.processes
+    io_queue = state.io_queue
+
+    time = state.time
+    # Event selesai I/O: (waktu selesai absolut, urutan blok, proses). remaining_io di
+    # state diukur dari state.time; selama stream berjalan yang berlaku adalah heap ini.
+    io_events = [(time + p.remaining_io, seq, p) for seq, p in enumerate(io_queue)]
+    heapq.heapify(io_events)
+    io_seq = len(io_events)
+    # Waktu proses terakhir masuk ready queue: wait_time dihitung lazily saat proses
+    # dijalankan (wait_time di state sudah mencakup waktu sampai state.time)
+    enqueued_at = {p: time for q in queues for p in q}
+    process_idx = state.process_idx
+    if log is None:
+        log = NullQueueLog()
 
     def log_state(current_time, action, process=None, from_q=None, to_q=None):
-        """Mencatat perubahan status antrian"""
-        q_status = {f"L{i+1}": [p.pid for p in queues[i]] for i in range(NUM_QUEUES)}
-        log.append({
-            'time': current_time,
-            'action': action,
-            'process': process.pid if process else None,
-            'from_q': from_q,
-            'to_q': to_q,
-            'queues': q_status,
-            'io_queue': [p.pid for p in io_queue]
-        })
+        """Mencatat perubahan status antrian (isi antrian dicatat sebagai delta)"""
+        pid = process.pid if process else None
+        log.record(current_time, action, pid, from_q, to_q)
+        return (EVENT, {'time': current_time, 'action': action, 'process': pid, 'from_q': from_q, 'to_q': to_q})
+
+    # Instrumentasi: setiap fase hanya menguji `profiling` jika profile tidak diberikan
+    profiling = profile is not None
+    if profiling:
+        log_state = profile.wrap_log_state(log_state)
 
     while time < max_time and (any(queues) or process_idx < len(all_processes) or io_queue):
         # 1. Kedatangan Proses Baru
+        if profiling:
+            token = profile.start()
         while process_idx < len(all_processes) and all_processes[process_idx].arrival_time <= time:
             p = all_processes[process_idx]
             # Prioritas awal P1, P2, P3 di input diubah menjadi indeks 0, 1, 2.
@@ -41,55 +297,154 @@ def mlfq_scheduler(processes, time_quantums, aging_threshold, max_time):
             # Level prioritas di kode ini: indeks 0=terendah (Level 1), indeks 2=tertinggi (Level 3)
 
             queue_index = p.current_priority - 1
-            queues[queue_index].append(p)
-            log_state(time, "Arrival", p, to_q=f"L{queue_index+1}")
+            if not 0 <= queue_index < num_levels:
+                raise ValueError(f"Prioritas {p.current_priority} proses {p.pid} di luar 1..{num_levels}")
+            queues.append(queue_index, p)
+            log.append(queue_index, p.pid)
+            enqueued_at[p] = time
+            if queue_index < num_levels - 1:
+                aging.add(p, queue_index)
+            yield log_state(time, "Arrival", p, to_q=f"L{queue_index+1}")
             process_idx += 1
+        if profiling:
+            profile.stop('arrival', token)
 
         # 2. Pemrosesan I/O Selesai
-        for p in list(io_queue):
-            if p.remaining_io <= 0:
-                io_queue.remove(p)
-                p.in_io = False
-
-                # Masukkan kembali ke antrian tertinggi (Level 3) sesuai aturan umum MLFQ setelah I/O
-                # Namun, untuk menjaga prioritas awal, kita kembalikan ke level prioritas awal mereka.
-                # Kita akan menggunakan aturan "prioritas awal" untuk kesederhanaan.
-                # Prioritas 1 -> Index 0 (Level 1), Prioritas 2 -> Index 1 (Level 2), Prioritas 3 -> Index 2 (Level 3)
-                queue_index = p.original_priority - 1 # Kembali ke prioritas awal setelah I/O
-                queues[queue_index].append(p)
-                p.last_run_time = time
-                log_state(time, "IO Complete, Requeue", p, to_q=f"L{queue_index+1}")
+        if profiling:
+            token = profile.start()
+        # Hanya event yang sudah jatuh tempo yang diambil; urutan requeue = urutan masuk io_queue
+        finished_io = []
+        while io_events and io_events[0][0] <= time:
+            finished_io.append(heapq.heappop(io_events))
+        if len(finished_io) > 1:
+            finished_io.sort(key=lambda e: e[1])
+        for done_at, _, p in finished_io:
+            del io_queue[p]
+            log.io_remove(p.pid)
+            p.in_io = False
+            p.remaining_io = done_at - time
+
+            # Masukkan kembali ke antrian tertinggi (Level 3) sesuai aturan umum MLFQ setelah I/O
+            # Namun, untuk menjaga prioritas awal, kita kembalikan ke level prioritas awal mereka.
+            # Kita akan menggunakan aturan "prioritas awal" untuk kesederhanaan.
+            # Prioritas 1 -> Index 0 (Level 1), Prioritas 2 -> Index 1 (Level 2), Prioritas 3 -> Index 2 (Level 3)
+            queue_index = p.original_priority - 1 # Kembali ke prioritas awal setelah I/O
+            queues.append(queue_index, p)
+            log.append(queue_index, p.pid)
+            p.last_run_time = time
+            enqueued_at[p] = time
+            if queue_index < num_levels - 1:
+                aging.add(p, queue_index)
+            yield log_state(time, "IO Complete, Requeue", p, to_q=f"L{queue_index+1}")
+        if profiling:
+            profile.stop('io_complete', token)
 
         # 3. Aging (Hanya untuk proses yang menunggu)
-        for q_idx in range(NUM_QUEUES - 1): # Lakukan aging dari Level 1 ke Level 3
-            # Iterasi di setiap proses di level
-            for p in list(queues[q_idx]):
-                waiting_time = time - p.last_run_time
-                if waiting_time >= aging_threshold and q_idx < NUM_QUEUES - 1:
-                    # Promosikan ke level yang lebih tinggi
-                    queues[q_idx].remove(p)
-                    new_q_idx = q_idx + 1
-                    queues[new_q_idx].appendleft(p) # Sisipkan di depan
-                    p.current_priority = new_q_idx + 1
-                    p.last_run_time = time # Reset waktu tunggu
-                    log_state(time, "Aging Promotion", p, from_q=f"L{q_idx+1}", to_q=f"L{new_q_idx+1}")
+        # Indeks aging hanya mengembalikan proses yang sudah jatuh tempo
+        if profiling:
+            token = profile.start()
+        # Priority boost berkala: semua level bawah ke belakang level tertinggi, level atas lebih dulu
+        if next_boost is not None and time >= next_boost:
+            while next_boost <= time:
+                next_boost += boost_interval
+            state.next_boost = next_boost
+            q_idx = top
+            while True:
+                pending = queues.mask & aging_mask & ((1 << q_idx) - 1)
+                if not pending:
+                    break
+                q_idx = pending.bit_length() - 1
+                for p in list(queues[q_idx]):
+                    aging.discard(p)
+                    queues.remove(q_idx, p)
+                    log.remove(q_idx, p.pid)
+                    queues.append(top, p)
+                    log.append(top, p.pid)
+                    p.current_priority = top + 1
+                    p.last_run_time = time
+                    yield log_state(time, "Priority Boost", p, from_q=f"L{q_idx+1}", to_q=f"L{top+1}")
+        # Lakukan aging dari Level 1 ke atas, hanya level berisi (bit di bitmask) yang dikunjungi
+        q_idx = -1
+        while True:
+            pending = queues.mask & aging_mask & ~((1 << (q_idx + 1)) - 1)
+            if not pending:
+                break
+            q_idx = (pending & -pending).bit_length() - 1
+            if thresholds[q_idx] is None:
+                continue
+            due = aging.pop_due(q_idx, time - thresholds[q_idx])
+            due.sort(key=queues[q_idx].position) # Promosi mengikuti urutan antrian
+            # Promosikan boost_step level ke atas (dibatasi level tertinggi)
+            new_q_idx = top if boost_step is None else min(q_idx + boost_step, top)
+            for p in due:
+                queues.remove(q_idx, p)
+                log.remove(q_idx, p.pid)
+                queues.appendleft(new_q_idx, p) # Sisipkan di depan
+                log.appendleft(new_q_idx, p.pid)
+                p.current_priority = new_q_idx + 1
+                p.last_run_time = time # Reset waktu tunggu
+                if new_q_idx < num_levels - 1:
+                    aging.add(p, new_q_idx)
+                yield log_state(time, "Aging Promotion", p, from_q=f"L{q_idx+1}", to_q=f"L{new_q_idx+1}")
+        if profiling:
+            profile.stop('aging', token)
+            profile.sample_queues(queues, io_queue)
+
+        # 3b. Fast-forward Round Robin di Level 1 selama ready set stabil
+        if fast_forward:
+            if profiling:
+                token = profile.start()
+            next_arrival = all_processes[process_idx].arrival_time if process_idx < len(all_processes) else None
+            time_quantum = time_quantums[0]
+            rounds = _stable_l1_rounds(queues, io_queue, time_quantum, thresholds[0], time, next_arrival, max_time,
+                                       next_boost if top > 0 else None)
+            if rounds:
+                n = len(queues[0])
+                for j, p in enumerate(queues[0]):
+                    if p.start_time is None:
+                        p.start_time = time + j * time_quantum
+                    p.remaining_time -= rounds * time_quantum
+                    p.service_time += rounds * time_quantum
+                    # Dari rentang rounds*n*q, proses ini menunggu semuanya kecuali rounds slice miliknya
+                    enqueued_at[p] += rounds * time_quantum
+                    # Akhir slice terakhir proses ini; kunci aging tetap naik mengikuti urutan antrian
+                    p.last_run_time = time + ((rounds - 1) * n + j + 1) * time_quantum
+                    aging.discard(p)
+                    aging.add(p, 0)
+                if n == 1:
+                    yield (SEGMENT, (next(iter(queues[0])).pid, time, time + rounds * time_quantum))
+                else:
+                    yield (SPAN, (tuple(p.pid for p in queues[0]), time, time_quantum, rounds))
+                time += rounds * n * time_quantum
+                yield log_state(time, "RR Fast-Forward L1", from_q="L1", to_q="L1")
+                if profiling:
+                    profile.stop('fast_forward', token)
+                state.time = time
+                state.process_idx = process_idx
+                continue
+            if profiling:
+                profile.stop('fast_forward', token)
 
         # 4. Cari Proses untuk Dijalankan
+        if profiling:
+            token = profile.start()
         selected_p = None
         selected_q_idx = -1
-        for q_idx in reversed(range(NUM_QUEUES)): # Cek dari antrian tertinggi (Level 3)
-            if queues[q_idx]:
-                selected_p = queues[q_idx].popleft()
-                selected_q_idx = q_idx
-                break
+        q_idx = queues.highest() # Level tertinggi yang berisi, langsung dari bitmask
+        if q_idx >= 0:
+            selected_p = queues.popleft(q_idx)
+            log.remove(q_idx, selected_p.pid)
+            selected_q_idx = q_idx
+            aging.discard(selected_p)
 
         if selected_p:
             p = selected_p
+            p.wait_time += time - enqueued_at.pop(p)
             if p.start_time is None:
                 p.start_time = time
 
             # Aturan penjadwalan: Round Robin pada setiap level
-            tq_index = selected_q_idx # Indeks 0, 1, atau 2
+            tq_index = selected_q_idx # Indeks 0..N-1
             time_quantum = time_quantums[tq_index]
 
             exec_time = min(time_quantum, p.remaining_time)
@@ -97,65 +452,75 @@ def mlfq_scheduler(processes, time_quantums, aging_threshold, max_time):
             start_segment = time
             end_segment = time + exec_time
 
-            timeline.append((p.pid, start_segment, end_segment))
+            yield (SEGMENT, (p.pid, start_segment, end_segment))
             time = end_segment
             p.remaining_time -= exec_time
             p.service_time += exec_time
 
-            # Update waktu tunggu untuk proses yang lain di antrian
-            for q in queues:
-                for other_p in q:
-                    other_p.wait_time += exec_time
-
             # 5. Cek I/O dan Sisa Waktu
             if p.service_time % p.burst_time == 0 and p.remaining_time == 0:
                 # Proses Selesai
                 p.completion_time = time
-                log_state(time, "Completed", p, from_q=f"L{selected_q_idx+1}")
+                yield log_state(time, "Completed", p, from_q=f"L{selected_q_idx+1}")
             elif p.service_time % (p.burst_time // (p.io_count + 1)) == 0 and p.io_burst > 0 and p.remaining_time > 0:
                 # Simulasikan I/O setiap kali proses menghabiskan sebagian burst time-nya
                 p.in_io = True
                 p.remaining_io = p.io_burst
                 p.io_count += 1
-                io_queue.append(p)
-                log_state(time, "IO Blocked", p, from_q=f"L{selected_q_idx+1}")
+                io_queue[p] = None
+                log.io_append(p.pid)
+                # I/O dihitung sejak awal segmen (perilaku lama: remaining_io dikurangi durasi slice ini juga)
+                io_seq += 1
+                heapq.heappush(io_events, (start_segment + p.io_burst, io_seq, p))
+                yield log_state(time, "IO Blocked", p, from_q=f"L{selected_q_idx+1}")
             elif p.remaining_time > 0:
                 # Waktu quantum habis, masih ada sisa waktu CPU
                 p.last_run_time = time
+                enqueued_at[p] = time
 
                 # Degradasi (Move down) ke level prioritas yang lebih rendah (jika belum di level terendah)
                 if selected_q_idx > 0:
                     new_q_idx = selected_q_idx - 1
-                    queues[new_q_idx].append(p)
+                    queues.append(new_q_idx, p)
+                    log.append(new_q_idx, p.pid)
+                    aging.add(p, new_q_idx)
                     p.current_priority = new_q_idx + 1
-                    log_state(time, "Quantum Exceeded, Degradation", p, from_q=f"L{selected_q_idx+1}", to_q=f"L{new_q_idx+1}")
+                    yield log_state(time, "Quantum Exceeded, Degradation", p, from_q=f"L{selected_q_idx+1}", to_q=f"L{new_q_idx+1}")
                 else:
                     # Tetap di level terendah (Level 1), Round Robin
-                    queues[selected_q_idx].append(p)
-                    log_state(time, "Quantum Exceeded, Requeue L1", p, from_q=f"L{selected_q_idx+1}", to_q=f"L{selected_q_idx+1}")
+                    queues.append(selected_q_idx, p)
+                    log.append(selected_q_idx, p.pid)
+                    aging.add(p, selected_q_idx)
+                    yield log_state(time, "Quantum Exceeded, Requeue L1", p, from_q=f"L{selected_q_idx+1}", to_q=f"L{selected_q_idx+1}")
 
-            # Kurangi waktu I/O untuk proses yang terblokir
-            for p_io in io_queue:
-                p_io.remaining_io -= (time - start_segment)
+            if profiling:
+                profile.stop('dispatch', token)
 
         else:
+            if profiling:
+                profile.stop('dispatch', token)
+                token = profile.start()
             # CPU Idle, jika masih ada proses yang akan datang atau sedang I/O
             if process_idx < len(all_processes):
                 # Langsung lompat ke waktu kedatangan berikutnya
-                idle_time = all_processes[process_idx].arrival_time - time
                 time = all_processes[process_idx].arrival_time
-                for p_io in io_queue:
-                    p_io.remaining_io -= idle_time
-                log_state(time, "Idle Time End")
+                yield log_state(time, "Idle Time End")
             elif io_queue:
-                # Lompat ke waktu I/O tercepat selesai
-                next_io_finish = min(p.remaining_io for p in io_queue)
-                time += next_io_finish
-                for p_io in io_queue:
-                    p_io.remaining_io -= next_io_finish
-                log_state(time, "IO Time Advance")
+                # Lompat ke event I/O tercepat
+                time = io_events[0][0]
+                yield log_state(time, "IO Time Advance")
             else:
                 # Semua selesai/Tidak ada yang tersisa
                 break
+            if profiling:
+                profile.stop('idle', token)
 
-    return timeline, log
+        # Simpan posisi loop ke state (untuk snapshot/resume)
+        state.time = time
+        state.process_idx = process_idx
+
+    # Tutup akumulasi waktu tunggu dan sisa I/O pada saat simulasi berhenti
+    for p, since in enqueued_at.items():
+        p.wait_time += time - since
+    for done_at, _, p in io_events:
+        p.remaining_io = done_at - time
@@ -0,0 +1,23 @@
+# optional_deps.py
+"""Import library opsional saat dibutuhkan, dengan petunjuk instalasi jika tidak ada.
+
+Modul simulasi tidak meng-import NumPy/pyarrow di level modul, sehingga
+scheduler tetap bisa dipakai tanpa library tersebut.
+"""
+
+
+def require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy library not found. Install with: pip install numpy") from None
+    return numpy
+
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("pyarrow library not found (dibutuhkan untuk Parquet). Install with: pip install pyarrow") from None
+    return pyarrow
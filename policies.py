@@ -0,0 +1,341 @@
+# policies.py
+"""Policy penjadwalan untuk engine.simulate / engine.engine_stream.
+
+Policy hanya mengelola ready set: menerima proses (admit), memilih proses
+berikutnya (pick), menentukan panjang slice (time_slice), dan menaruh
+kembali proses yang slice-nya habis (requeue). Perubahan isi antrian
+dicatat sendiri oleh policy ke log yang diberikan engine lewat start().
+Label antrian memakai format "L1".."Ln" seperti log MLFQ.
+
+FCFS, RR dan MLFQ di sini adalah port dari fcfs_scheduler, rr_scheduler
+dan mlfq_scheduler; SJF, SRTF dan prioritas statis memakai ReadyHeap
+sehingga memilih proses O(log n).
+"""
+from abc import ABC, abstractmethod
+from collections import deque
+
+from ready_queue import AgingIndex, LevelSet, ReadyHeap, level_thresholds
+
+
+class Policy(ABC):
+    """Antarmuka policy; subclass wajib mengisi admit, pick, requeue dan __len__"""
+
+    name = None
+    num_levels = 1
+    # True: slice dipotong pada kedatangan/I-O selesai berikutnya
+    preemptive = False
+    # True: kedatangan selama slice masuk ready set sebelum proses yang slice-nya habis
+    admit_arrivals_first = True
+
+    def start(self, log):
+        self.log = log
+
+    @abstractmethod
+    def admit(self, p, time, from_io=False):
+        """Masukkan proses ke ready set; mengembalikan label antriannya"""
+
+    @abstractmethod
+    def pick(self, time):
+        """Keluarkan proses berikutnya: (proses, label antrian) atau None jika ready set kosong"""
+
+    def time_slice(self, p):
+        """Panjang slice maksimum; None berarti jalan sampai selesai (atau dipreempsi)"""
+        return None
+
+    @abstractmethod
+    def requeue(self, p, time):
+        """Kembalikan proses yang slice-nya habis; mengembalikan (action, label antrian)"""
+
+    def steal(self, time):
+        """Keluarkan satu proses menunggu untuk dipindah ke core lain (mode SMP); None jika kosong.
+
+        Opsional: hanya dibutuhkan smp.smp_simulate dengan work stealing.
+        Yang diambil adalah proses yang paling lama lagi akan dijalankan
+        di sini, kecuali policy berbasis heap (lihat HeapPolicy.steal).
+        """
+        raise NotImplementedError
+
+    def tick(self, time):
+        """Event bergantung waktu sebelum pick: iterable (action, proses, from_q, to_q).
+
+        Event dicatat saat diiterasi, jadi perubahan antrian sebaiknya
+        dilakukan lazily (generator) agar delta log tiap event tepat.
+        """
+        return ()
+
+    @abstractmethod
+    def __len__(self):
+        """Jumlah proses di ready set"""
+
+
+class FCFSPolicy(Policy):
+    """First Come First Served: satu antrian FIFO, tanpa preempsi"""
+
+    name = 'fcfs'
+
+    def __init__(self):
+        self.queue = deque()
+
+    def admit(self, p, time, from_io=False):
+        self.queue.append(p)
+        self.log.append(0, p.pid)
+        return "L1"
+
+    def pick(self, time):
+        if not self.queue:
+            return None
+        p = self.queue.popleft()
+        self.log.remove(0, p.pid)
+        return p, "L1"
+
+    def steal(self, time):
+        if not self.queue:
+            return None
+        p = self.queue.pop()
+        self.log.remove(0, p.pid)
+        return p
+
+    def requeue(self, p, time):
+        self.admit(p, time)
+        return "Quantum Exceeded, Requeue", "L1"
+
+    def __len__(self):
+        return len(self.queue)
+
+
+class RoundRobinPolicy(FCFSPolicy):
+    """Round Robin dengan satu time quantum"""
+
+    name = 'rr'
+
+    def __init__(self, time_quantum):
+        super().__init__()
+        self.time_quantum = time_quantum
+
+    def time_slice(self, p):
+        return self.time_quantum
+
+
+class MLFQPolicy(Policy):
+    """MLFQ N level dengan aturan yang sama seperti mlfq_scheduler.
+
+    Level 0 terendah; jumlah level = len(time_quantums). Proses masuk ke
+    level current_priority-1 (kembali ke original_priority setelah I/O),
+    turun satu level setiap quantum habis, dan dipromosikan `boost_step`
+    level (default 1) ke depan level tujuan setelah menunggu
+    aging_threshold (satu angka, atau list per level). boost_interval
+    opsional menaikkan semua proses yang menunggu ke level tertinggi
+    secara berkala. Level siap tertinggi dibaca dari bitmask LevelSet,
+    jadi pick O(1) berapa pun jumlah level.
+    """
+
+    name = 'mlfq'
+    admit_arrivals_first = False
+
+    def __init__(self, time_quantums, aging_threshold, boost_step=1, boost_interval=None):
+        self.time_quantums = list(time_quantums)
+        self.num_levels = len(self.time_quantums)
+        self.aging_threshold = aging_threshold
+        self.thresholds = level_thresholds(aging_threshold, self.num_levels)
+        if boost_step is not None and boost_step < 1:
+            raise ValueError("boost_step harus >= 1 (atau None untuk langsung ke level tertinggi)")
+        self.boost_step = boost_step
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("boost_interval harus positif")
+        self.boost_interval = boost_interval
+        self._next_boost = boost_interval
+        self.queues = LevelSet(self.num_levels)
+        self.aging = AgingIndex(self.num_levels)
+        # Bit level yang ikut aging (semua kecuali level tertinggi)
+        self._aging_mask = (1 << (self.num_levels - 1)) - 1
+        self._size = 0
+        self._running_level = None
+
+    def _enqueue(self, p, level, front=False):
+        if front:
+            self.queues.appendleft(level, p)
+            self.log.appendleft(level, p.pid)
+        else:
+            self.queues.append(level, p)
+            self.log.append(level, p.pid)
+        # Level tertinggi tidak pernah dipromosikan
+        if level < self.num_levels - 1:
+            self.aging.add(p, level)
+
+    def _promote(self, p, level, target, time, front=True):
+        # Pemanggil sudah mengeluarkan p dari indeks aging
+        self.queues.remove(level, p)
+        self.log.remove(level, p.pid)
+        p.current_priority = target + 1
+        p.last_run_time = time # Reset waktu tunggu
+        self._enqueue(p, target, front)
+
+    def admit(self, p, time, from_io=False):
+        level = (p.original_priority if from_io else p.current_priority) - 1
+        if not 0 <= level < self.num_levels:
+            raise ValueError(f"Prioritas {level + 1} proses {p.pid} di luar 1..{self.num_levels}")
+        self._enqueue(p, level)
+        self._size += 1
+        return f"L{level+1}"
+
+    def tick(self, time):
+        # Generator: setiap promosi dicatat engine sebelum promosi berikutnya (delta log per event)
+        top = self.num_levels - 1
+        if self._next_boost is not None and time >= self._next_boost:
+            while self._next_boost <= time:
+                self._next_boost += self.boost_interval
+            # Boost global ke belakang level tertinggi: level atas lebih dulu, urutan antrian terjaga
+            level = top
+            while True:
+                pending = self.queues.mask & self._aging_mask & ((1 << level) - 1)
+                if not pending:
+                    break
+                level = pending.bit_length() - 1
+                for p in list(self.queues[level]):
+                    self.aging.discard(p)
+                    self._promote(p, level, top, time, front=False)
+                    yield ("Priority Boost", p, f"L{level+1}", f"L{top+1}")
+        # Hanya level berisi (bit menyala) yang diperiksa, dari bawah ke atas
+        level = -1
+        while True:
+            pending = self.queues.mask & self._aging_mask & ~((1 << (level + 1)) - 1)
+            if not pending:
+                break
+            level = (pending & -pending).bit_length() - 1
+            threshold = self.thresholds[level]
+            if threshold is None:
+                continue
+            target = top if self.boost_step is None else min(level + self.boost_step, top)
+            due = self.aging.pop_due(level, time - threshold)
+            due.sort(key=self.queues[level].position) # Promosi mengikuti urutan antrian
+            for p in due:
+                self._promote(p, level, target, time)
+                yield ("Aging Promotion", p, f"L{level+1}", f"L{target+1}")
+
+    def pick(self, time):
+        level = self.queues.highest()
+        if level < 0:
+            return None
+        p = self.queues.popleft(level)
+        self.log.remove(level, p.pid)
+        self.aging.discard(p)
+        self._size -= 1
+        self._running_level = level
+        return p, f"L{level+1}"
+
+    def steal(self, time):
+        # Ekor level terendah: proses yang paling lama lagi akan dijalankan
+        level = self.queues.lowest()
+        if level < 0:
+            return None
+        p = self.queues.pop(level)
+        self.log.remove(level, p.pid)
+        self.aging.discard(p)
+        self._size -= 1
+        p.current_priority = level + 1 # admit di core tujuan memakai level yang sama
+        return p
+
+    def time_slice(self, p):
+        return self.time_quantums[self._running_level]
+
+    def requeue(self, p, time):
+        level = self._running_level
+        self._size += 1
+        if level > 0:
+            p.current_priority = level
+            self._enqueue(p, level - 1)
+            return "Quantum Exceeded, Degradation", f"L{level}"
+        self._enqueue(p, 0)
+        return "Quantum Exceeded, Requeue L1", "L1"
+
+    def __len__(self):
+        return self._size
+
+
+class HeapPolicy(Policy):
+    """Ready set berupa min-heap menurut key(p); seri diputus menurut urutan masuk"""
+
+    def __init__(self):
+        self.heap = ReadyHeap()
+
+    @abstractmethod
+    def key(self, p):
+        """Kunci urutan heap; nilai terkecil dijalankan lebih dulu"""
+
+    def admit(self, p, time, from_io=False):
+        self.heap.push(self.key(p), p)
+        self.log.append(0, p.pid)
+        return "L1"
+
+    def pick(self, time):
+        if not self.heap:
+            return None
+        p = self.heap.pop()
+        self.log.remove(0, p.pid)
+        return p, "L1"
+
+    def steal(self, time):
+        # Heap tidak mendukung ambil dari ekor; proses terdepan yang dipindah
+        picked = self.pick(time)
+        return picked[0] if picked is not None else None
+
+    def requeue(self, p, time):
+        self.admit(p, time)
+        return "Preempted", "L1"
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class SJFPolicy(HeapPolicy):
+    """Shortest Job First (non-preemptive) menurut burst_time"""
+
+    name = 'sjf'
+
+    def key(self, p):
+        return (p.burst_time, p.arrival_time)
+
+
+class SRTFPolicy(HeapPolicy):
+    """Shortest Remaining Time First: preempsi pada setiap kedatangan/I-O selesai"""
+
+    name = 'srtf'
+    preemptive = True
+
+    def key(self, p):
+        # Seri dimenangkan proses yang datang lebih dulu, jadi proses berjalan tidak dipreempsi oleh sisa yang sama
+        return (p.remaining_time, p.arrival_time)
+
+
+class PriorityPolicy(HeapPolicy):
+    """Prioritas statis (original_priority, 3 tertinggi); preemptive opsional"""
+
+    name = 'priority'
+
+    def __init__(self, preemptive=False):
+        super().__init__()
+        self.preemptive = preemptive
+
+    def key(self, p):
+        return (-p.original_priority, p.arrival_time)
+
+
+POLICIES = {
+    'fcfs': FCFSPolicy,
+    'rr': RoundRobinPolicy,
+    'mlfq': MLFQPolicy,
+    'sjf': SJFPolicy,
+    'srtf': SRTFPolicy,
+    'priority': PriorityPolicy,
+}
+
+
+def make_policy(name, time_quantums=None, aging_threshold=None, rr_quantum=None, boost_step=1, boost_interval=None):
+    """Buat policy menurut nama dengan parameter yang relevan saja"""
+    if name not in POLICIES:
+        raise ValueError(f"Policy tidak dikenal: {name} (pilih {', '.join(POLICIES)})")
+    if name == 'rr':
+        return RoundRobinPolicy(rr_quantum)
+    if name == 'mlfq':
+        return MLFQPolicy(time_quantums, aging_threshold, boost_step, boost_interval)
+    return POLICIES[name]()
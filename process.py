@@ -1,4 +1,6 @@
 # process.py
+from array import array
+
 class Process:
     def __init__(self, pid, arrival_time, burst_time, io_burst, priority):
         self.pid = pid
@@ -32,3 +34,213 @@ class Process:
 
     def __repr__(self):
         return f"Process(ID={self.pid}, AT={self.arrival_time}, BT={self.burst_time}, P={self.current_priority})"
+
+
+# ----------------------------------------------------------------------
+# ProcessTable: penyimpanan kolom (typed array) untuk workload besar
+# ----------------------------------------------------------------------
+_NONE = -1 # Penanda None untuk start_time/completion_time di kolom integer
+
+def _typecode(values):
+    return 'd' if any(isinstance(v, float) for v in values) else 'q'
+
+def column_typecode(column):
+    """Typecode kolom: array.array memakai .typecode, memoryview (mis. kolom trace mmap) memakai .format"""
+    return column.typecode if isinstance(column, array) else column.format
+
+def arrival_order(processes):
+    """Proses terurut menurut kedatangan.
+
+    Workload yang sudah ditandai terurut (sorted_by_arrival) dipakai apa
+    adanya, sehingga cursor kedatangan scheduler membaca baris satu per
+    satu tanpa menyalin seluruh workload ke list.
+    """
+    if getattr(processes, 'sorted_by_arrival', False):
+        return processes
+    return sorted(processes, key=lambda p: p.arrival_time)
+
+def _column(name, nullable=False):
+    def fget(view):
+        value = getattr(view._table, name)[view._index]
+        if nullable and value == _NONE:
+            return None
+        return value
+
+    def fset(view, value):
+        if nullable and value is None:
+            value = _NONE
+        try:
+            getattr(view._table, name)[view._index] = value
+        except TypeError:
+            # Waktu pecahan (mis. seek_time DeviceIO) pada tabel integer: kolom waktu dilebarkan ke 'd'
+            if not isinstance(value, float) or name not in ProcessTable.TIME_RUN_COLUMNS:
+                raise
+            view._table.widen_times()
+            getattr(view._table, name)[view._index] = value
+
+    return property(fget, fset)
+
+
+class ProcessView:
+    """Tampilan ringan satu baris ProcessTable dengan atribut seperti Process.
+
+    Dua view dengan tabel dan indeks yang sama dianggap proses yang sama,
+    sehingga view bisa dipakai sebagai key dict/antrian oleh scheduler.
+    """
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    @property
+    def pid(self):
+        return self._table.pids[self._index]
+
+    arrival_time = _column('arrival_time')
+    burst_time = _column('burst_time')
+    io_burst = _column('io_burst')
+    original_priority = _column('original_priority')
+    current_priority = _column('current_priority')
+    remaining_time = _column('remaining_time')
+    remaining_io = _column('remaining_io')
+    wait_time = _column('wait_time')
+    last_run_time = _column('last_run_time')
+    start_time = _column('start_time', nullable=True)
+    completion_time = _column('completion_time', nullable=True)
+    service_time = _column('service_time')
+    io_count = _column('io_count')
+
+    @property
+    def in_io(self):
+        return bool(self._table.in_io[self._index])
+
+    @in_io.setter
+    def in_io(self, value):
+        self._table.in_io[self._index] = 1 if value else 0
+
+    def reset(self):
+        self._table.reset_row(self._index)
+
+    def __eq__(self, other):
+        return isinstance(other, ProcessView) and self._table is other._table and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._table), self._index))
+
+    def __repr__(self):
+        return f"Process(ID={self.pid}, AT={self.arrival_time}, BT={self.burst_time}, P={self.current_priority})"
+
+
+class ProcessTable:
+    """Workload dalam bentuk kolom array bertipe, bukan satu objek per proses.
+
+    Iterasi menghasilkan ProcessView, sehingga fcfs_scheduler, rr_scheduler,
+    mlfq_scheduler dan calculate_metrics bisa menerima tabel ini langsung.
+    State run di-reset sekaligus per kolom dengan reset().
+    """
+
+    STATIC_COLUMNS = ('arrival_time', 'burst_time', 'io_burst', 'original_priority')
+    RUN_COLUMNS = ('current_priority', 'remaining_time', 'remaining_io', 'in_io', 'wait_time',
+                   'last_run_time', 'start_time', 'completion_time', 'service_time', 'io_count')
+    # Kolom run yang berisi waktu (ikut time_code)
+    TIME_RUN_COLUMNS = ('remaining_time', 'remaining_io', 'wait_time', 'last_run_time', 'start_time',
+                        'completion_time', 'service_time')
+    # True jika baris dijamin terurut menurut arrival_time (lihat arrival_order)
+    sorted_by_arrival = False
+
+    def __init__(self, pids, arrival_time, burst_time, io_burst, priority):
+        self.pids = list(pids)
+        n = len(self.pids)
+        if not (len(arrival_time) == len(burst_time) == len(io_burst) == len(priority) == n):
+            raise ValueError("Semua kolom ProcessTable harus sama panjang")
+        time_code = _typecode(list(arrival_time) + list(burst_time) + list(io_burst))
+        self.time_code = time_code
+        self.arrival_time = array(time_code, arrival_time)
+        self.burst_time = array(time_code, burst_time)
+        self.io_burst = array(time_code, io_burst)
+        self.original_priority = array('h', priority)
+        self.reset()
+
+    @classmethod
+    def from_arrays(cls, pids, arrival_time, burst_time, io_burst, priority):
+        """Bangun tabel langsung dari array bertipe tanpa konversi per elemen"""
+        table = cls.__new__(cls)
+        table.pids = list(pids)
+        table.time_code = column_typecode(arrival_time)
+        table.arrival_time = arrival_time
+        table.burst_time = burst_time
+        table.io_burst = io_burst
+        table.original_priority = priority
+        table.reset()
+        return table
+
+    @classmethod
+    def from_processes(cls, processes):
+        processes = list(processes)
+        return cls([p.pid for p in processes],
+                   [p.arrival_time for p in processes],
+                   [p.burst_time for p in processes],
+                   [p.io_burst for p in processes],
+                   [p.original_priority for p in processes])
+
+    def clone(self):
+        """Salinan workload (kolom statis) dengan state run yang masih bersih"""
+        table = ProcessTable(self.pids, self.arrival_time, self.burst_time, self.io_burst, self.original_priority)
+        table.sorted_by_arrival = self.sorted_by_arrival
+        return table
+
+    def reset(self):
+        """Reset state run semua proses dengan satu pengisian array per kolom"""
+        n = len(self.pids)
+        tc = self.time_code
+        self.current_priority = array('h', self.original_priority)
+        self.remaining_time = array(tc, self.burst_time)
+        self.remaining_io = array(tc, [0]) * n
+        self.in_io = array('b', [0]) * n
+        self.wait_time = array(tc, [0]) * n
+        self.last_run_time = array(tc, [0]) * n
+        self.start_time = array(tc, [_NONE]) * n
+        self.completion_time = array(tc, [_NONE]) * n
+        self.service_time = array(tc, [0]) * n
+        self.io_count = array('q', [0]) * n
+
+    def widen_times(self):
+        """Ubah kolom waktu state run ke float ('d'); kolom statis tidak berubah"""
+        if self.time_code == 'd':
+            return
+        self.time_code = 'd'
+        for name in self.TIME_RUN_COLUMNS:
+            setattr(self, name, array('d', getattr(self, name)))
+
+    def reset_row(self, i):
+        self.current_priority[i] = self.original_priority[i]
+        self.remaining_time[i] = self.burst_time[i]
+        for name in ('remaining_io', 'in_io', 'wait_time', 'last_run_time', 'service_time', 'io_count'):
+            getattr(self, name)[i] = 0
+        self.start_time[i] = _NONE
+        self.completion_time[i] = _NONE
+
+    def sort(self, key=None, reverse=False):
+        """Urutkan baris in-place (stabil), seperti list.sort pada daftar Process"""
+        self.sorted_by_arrival = False
+        views = [ProcessView(self, i) for i in range(len(self))]
+        order = sorted(range(len(self)), key=(lambda i: key(views[i])) if key else None, reverse=reverse)
+        self.pids = [self.pids[i] for i in order]
+        for name in self.STATIC_COLUMNS + self.RUN_COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, array(column_typecode(column), [column[i] for i in order]))
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ProcessTable index out of range")
+        return ProcessView(self, index)
+
+    def __iter__(self):
+        for i in range(len(self.pids)):
+            yield ProcessView(self, i)
@@ -0,0 +1,237 @@
+# queue_log.py
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+
+# Kode operasi delta antrian
+OP_APPEND = 0
+OP_APPENDLEFT = 1
+OP_REMOVE = 2
+
+
+class QueueLog:
+    """Log perubahan status antrian MLFQ yang disimpan sebagai delta.
+
+    Setiap event hanya menyimpan operasi antrian yang terjadi sejak event
+    sebelumnya; snapshot penuh diambil setiap `checkpoint_interval` event
+    (dan tidak sebelum jumlah delta sejak checkpoint terakhir menyamai isi
+    antrian, sehingga memori checkpoint tetap sebanding dengan jumlah delta).
+    Isi antrian pada waktu tertentu direkonstruksi dengan bisect ke
+    checkpoint terdekat lalu memutar ulang delta sesudahnya.
+
+    Iterasi menghasilkan dict dengan format yang sama seperti log lama
+    (time, action, process, from_q, to_q, queues, io_queue).
+    """
+
+    def __init__(self, num_levels, checkpoint_interval=256):
+        self.num_levels = num_levels
+        self.checkpoint_interval = checkpoint_interval
+        # Level ke-num_levels dipakai untuk io_queue
+        self._live = [OrderedDict() for _ in range(num_levels + 1)]
+        self._pending = []
+
+        self._times = []
+        self._actions = []
+        self._processes = []
+        self._from_q = []
+        self._to_q = []
+        self._ops = []
+        self._op_end = []
+        self._checkpoints = []
+        self._checkpoint_index = []
+        self._size = 0
+
+    # ------------------------------------------------------------------
+    # Perekaman (dipanggil scheduler)
+    # ------------------------------------------------------------------
+    def append(self, level, pid):
+        self._live[level][pid] = None
+        self._size += 1
+        self._pending.append((OP_APPEND, level, pid))
+
+    def appendleft(self, level, pid):
+        self._live[level][pid] = None
+        self._live[level].move_to_end(pid, last=False)
+        self._size += 1
+        self._pending.append((OP_APPENDLEFT, level, pid))
+
+    def remove(self, level, pid):
+        del self._live[level][pid]
+        self._size -= 1
+        self._pending.append((OP_REMOVE, level, pid))
+
+    def io_append(self, pid):
+        self.append(self.num_levels, pid)
+
+    def io_remove(self, pid):
+        self.remove(self.num_levels, pid)
+
+    def record(self, time, action, process=None, from_q=None, to_q=None):
+        index = len(self._times)
+        self._times.append(time)
+        self._actions.append(action)
+        self._processes.append(process)
+        self._from_q.append(from_q)
+        self._to_q.append(to_q)
+        self._ops.extend(self._pending)
+        self._op_end.append(len(self._ops))
+        self._pending = []
+        if self._needs_checkpoint(index):
+            self._checkpoints.append(tuple(tuple(q) for q in self._live))
+            self._checkpoint_index.append(index)
+
+    @classmethod
+    def from_columns(cls, num_levels, columns, checkpoint_interval=256):
+        """Bangun ulang log dari hasil to_columns() (mis. setelah dimuat dari file)"""
+        log = cls(num_levels, checkpoint_interval)
+        ops = zip(columns['op_code'], columns['op_level'], columns['op_pid'])
+        start = 0
+        for i, time in enumerate(columns['time']):
+            for _ in range(start, columns['op_end'][i]):
+                code, level, pid = next(ops)
+                if code == OP_APPEND:
+                    log.append(level, pid)
+                elif code == OP_APPENDLEFT:
+                    log.appendleft(level, pid)
+                else:
+                    log.remove(level, pid)
+            start = columns['op_end'][i]
+            log.record(time, columns['action'][i], columns['process'][i], columns['from_q'][i], columns['to_q'][i])
+        return log
+
+    def _needs_checkpoint(self, index):
+        if not self._checkpoint_index:
+            return True
+        last = self._checkpoint_index[-1]
+        if index - last < self.checkpoint_interval:
+            return False
+        return len(self._ops) - self._op_end[last] >= self._size
+
+    # ------------------------------------------------------------------
+    # Pembacaan
+    # ------------------------------------------------------------------
+    def __len__(self):
+        return len(self._times)
+
+    def _replay(self, index):
+        """State antrian (list OrderedDict) setelah event ke-index"""
+        k = bisect_right(self._checkpoint_index, index) - 1
+        state = [OrderedDict.fromkeys(q) for q in self._checkpoints[k]]
+        self._apply(state, self._op_end[self._checkpoint_index[k]], self._op_end[index])
+        return state
+
+    def _apply(self, state, op_start, op_stop):
+        for i in range(op_start, op_stop):
+            code, level, pid = self._ops[i]
+            if code == OP_REMOVE:
+                del state[level][pid]
+            else:
+                state[level][pid] = None
+                if code == OP_APPENDLEFT:
+                    state[level].move_to_end(pid, last=False)
+
+    def _format_state(self, state):
+        queues = {f"L{i+1}": list(state[i]) for i in range(self.num_levels)}
+        return queues, list(state[self.num_levels])
+
+    def _entry(self, index, state):
+        queues, io_queue = self._format_state(state)
+        return {
+            'time': self._times[index],
+            'action': self._actions[index],
+            'process': self._processes[index],
+            'from_q': self._from_q[index],
+            'to_q': self._to_q[index],
+            'queues': queues,
+            'io_queue': io_queue
+        }
+
+    def state_at(self, time):
+        """Isi antrian setelah event terakhir dengan waktu <= time"""
+        index = bisect_right(self._times, time) - 1
+        if index < 0:
+            state = [OrderedDict() for _ in range(self.num_levels + 1)]
+        else:
+            state = self._replay(index)
+        queues, io_queue = self._format_state(state)
+        return {'time': time, 'queues': queues, 'io_queue': io_queue}
+
+    def entries(self, start=None, end=None):
+        """Iterasi event dengan start <= time <= end tanpa menyimpan semua snapshot"""
+        first = 0 if start is None else bisect_left(self._times, start)
+        last = len(self._times) if end is None else bisect_right(self._times, end)
+        return self._iter_range(first, last)
+
+    def _iter_range(self, first, last):
+        if first >= last:
+            return
+        state = self._replay(first)
+        yield self._entry(first, state)
+        for index in range(first + 1, last):
+            self._apply(state, self._op_end[index - 1], self._op_end[index])
+            yield self._entry(index, state)
+
+    def __iter__(self):
+        return self.entries()
+
+    def to_columns(self):
+        """Event dan delta antrian sebagai kolom (list), tanpa checkpoint"""
+        return {
+            'time': self._times,
+            'action': self._actions,
+            'process': self._processes,
+            'from_q': self._from_q,
+            'to_q': self._to_q,
+            'op_code': [code for code, _, _ in self._ops],
+            'op_level': [level for _, level, _ in self._ops],
+            'op_pid': [pid for _, _, pid in self._ops],
+            'op_end': self._op_end,
+        }
+
+    def copy(self):
+        """Salinan independen; event yang dicatat ke salinan tidak mengubah log ini"""
+        log = type(self).__new__(type(self))
+        log.__dict__.update(self.__dict__)
+        # Isi list berupa tuple/str/angka (immutable), jadi salinan dangkal per list cukup
+        for name in ('_pending', '_times', '_actions', '_processes', '_from_q', '_to_q', '_ops', '_op_end',
+                     '_checkpoints', '_checkpoint_index'):
+            setattr(log, name, list(getattr(self, name)))
+        log._live = [OrderedDict(q) for q in self._live]
+        return log
+
+    def action_counts(self):
+        """Jumlah event per action, tanpa merekonstruksi isi antrian"""
+        return Counter(self._actions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            first, last, step = index.indices(len(self))
+            if step == 1:
+                return list(self._iter_range(first, last))
+            return [self[i] for i in range(first, last, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("QueueLog index out of range")
+        return self._entry(index, self._replay(index))
+
+
+class NullQueueLog:
+    """Pengganti QueueLog yang tidak menyimpan apa pun (dipakai mode streaming)"""
+
+    def append(self, level, pid):
+        pass
+
+    def appendleft(self, level, pid):
+        pass
+
+    def remove(self, level, pid):
+        pass
+
+    def io_append(self, pid):
+        pass
+
+    def io_remove(self, pid):
+        pass
+
+    def record(self, time, action, process=None, from_q=None, to_q=None):
+        pass
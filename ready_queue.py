@@ -0,0 +1,211 @@
+# ready_queue.py
+import heapq
+from collections import OrderedDict
+
+
+class LevelQueue:
+    """Antrian satu level MLFQ dengan append/appendleft/popleft/remove O(1).
+
+    Setiap proses diberi posisi numerik (append menaikkan counter belakang,
+    appendleft menurunkan counter depan), sehingga urutan antrian beberapa
+    proses bisa dipulihkan cukup dengan mengurutkan posisinya.
+    """
+
+    def __init__(self):
+        self._items = OrderedDict()
+        self._front = 0
+        self._back = 0
+
+    def append(self, p):
+        self._items[p] = self._back
+        self._back += 1
+
+    def appendleft(self, p):
+        self._front -= 1
+        self._items[p] = self._front
+        self._items.move_to_end(p, last=False)
+
+    def popleft(self):
+        return self._items.popitem(last=False)[0]
+
+    def pop(self):
+        """Keluarkan proses paling belakang"""
+        return self._items.popitem()[0]
+
+    def remove(self, p):
+        del self._items[p]
+
+    def position(self, p):
+        return self._items[p]
+
+    def __contains__(self, p):
+        return p in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+
+class LevelSet:
+    """Antrian MLFQ untuk N level dengan bitmask level yang tidak kosong.
+
+    Bit ke-i menyala selama level i berisi, sehingga level tertinggi yang
+    siap didapat dengan satu operasi bit (mask.bit_length() - 1) alih-alih
+    memindai semua level. Semua perubahan isi harus lewat method LevelSet
+    agar mask tetap sinkron.
+    """
+
+    def __init__(self, num_levels):
+        self.levels = [LevelQueue() for _ in range(num_levels)]
+        self.mask = 0
+
+    def append(self, level, p):
+        self.levels[level].append(p)
+        self.mask |= 1 << level
+
+    def appendleft(self, level, p):
+        self.levels[level].appendleft(p)
+        self.mask |= 1 << level
+
+    def remove(self, level, p):
+        queue = self.levels[level]
+        queue.remove(p)
+        if not queue:
+            self.mask &= ~(1 << level)
+
+    def popleft(self, level):
+        queue = self.levels[level]
+        p = queue.popleft()
+        if not queue:
+            self.mask &= ~(1 << level)
+        return p
+
+    def pop(self, level):
+        queue = self.levels[level]
+        p = queue.pop()
+        if not queue:
+            self.mask &= ~(1 << level)
+        return p
+
+    def highest(self):
+        """Level tertinggi yang berisi, atau -1 jika semua kosong"""
+        return self.mask.bit_length() - 1
+
+    def lowest(self):
+        """Level terendah yang berisi, atau -1 jika semua kosong"""
+        return (self.mask & -self.mask).bit_length() - 1
+
+    def __getitem__(self, level):
+        return self.levels[level]
+
+    def __iter__(self):
+        return iter(self.levels)
+
+    def __len__(self):
+        return len(self.levels)
+
+    def __bool__(self):
+        return self.mask != 0
+
+
+class AgingIndex:
+    """Indeks aging: proses tiap level diurutkan menurut last_run_time.
+
+    Hampir semua proses masuk antrian dengan last_run_time = waktu sekarang,
+    jadi kuncinya naik monoton dan cukup disimpan di OrderedDict (urutan
+    sisip = urutan kunci). Proses yang masuk dengan kunci lebih kecil dari
+    ekor (misalnya kedatangan baru dengan last_run_time = 0) disimpan di heap
+    kecil per level. Mengambil proses yang jatuh tempo O(k) untuk k proses
+    yang dipromosikan, dan menghapus proses O(1).
+    """
+
+    def __init__(self, num_levels):
+        self._ordered = [OrderedDict() for _ in range(num_levels)]
+        self._late = [[] for _ in range(num_levels)]
+        self._where = {}
+        self._seq = 0
+
+    def add(self, p, level):
+        key = p.last_run_time
+        ordered = self._ordered[level]
+        if not ordered or key >= next(reversed(ordered.values())):
+            ordered[p] = key
+            self._where[p] = (level, None)
+        else:
+            self._seq += 1
+            heapq.heappush(self._late[level], (key, self._seq, p))
+            self._where[p] = (level, self._seq)
+
+    def discard(self, p):
+        entry = self._where.pop(p, None)
+        if entry is not None and entry[1] is None:
+            del self._ordered[entry[0]][p]
+        # Entri di heap dihapus secara lazy saat jatuh tempo
+
+    def pop_due(self, level, cutoff):
+        """Keluarkan semua proses di level dengan last_run_time <= cutoff"""
+        due = []
+        ordered = self._ordered[level]
+        while ordered:
+            p, key = next(iter(ordered.items()))
+            if key > cutoff:
+                break
+            del ordered[p]
+            del self._where[p]
+            due.append(p)
+
+        late = self._late[level]
+        while late and late[0][0] <= cutoff:
+            _, seq, p = heapq.heappop(late)
+            if self._where.get(p) == (level, seq):
+                del self._where[p]
+                due.append(p)
+        return due
+
+
+class ReadyHeap:
+    """Ready set berbasis min-heap: push dan pop proses dengan kunci terkecil O(log n).
+
+    Kunci yang sama diputus menurut urutan masuk, sehingga proses sendiri
+    tidak pernah dibandingkan.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._seq = 0
+
+    def push(self, key, p):
+        self._seq += 1
+        heapq.heappush(self._heap, (key, self._seq, p))
+
+    def pop(self):
+        return heapq.heappop(self._heap)[2]
+
+    def __iter__(self):
+        return (entry[2] for entry in self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+
+def level_thresholds(aging_threshold, num_levels):
+    """Aging threshold per level dari satu angka (semua level) atau list per level.
+
+    Level tertinggi tidak pernah dipromosikan, jadi selalu None; None di
+    list mematikan aging untuk level itu.
+    """
+    if isinstance(aging_threshold, (list, tuple)):
+        if len(aging_threshold) not in (num_levels - 1, num_levels):
+            raise ValueError(f"aging_threshold per level harus berisi {num_levels - 1} atau {num_levels} nilai")
+        thresholds = list(aging_threshold[:num_levels - 1])
+    else:
+        thresholds = [aging_threshold] * (num_levels - 1)
+    return thresholds + [None]
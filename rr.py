@@ -1,10 +1,53 @@
+import math
 from collections import deque
 
-def rr_scheduler(processes, time_quantum):
+from process import arrival_order
+from stream import SEGMENT, SPAN, expand_span
+
+def rr_scheduler(processes, time_quantum, fast_forward=False):
+    # fast_forward: SPAN diurai kembali per slice; proses yang berjalan sendirian tetap satu segmen gabungan
+    timeline = []
+    for kind, payload in rr_stream(processes, time_quantum, fast_forward):
+        if kind == SPAN:
+            timeline.extend(expand_span(payload))
+        else:
+            timeline.append(payload)
+    return timeline
+
+def max_full_rounds(available, round_length):
+    """Jumlah ronde k terbesar dengan k * round_length < available (0 jika tidak ada)"""
+    if available <= 0:
+        return 0
+    if isinstance(available, int) and isinstance(round_length, int):
+        return (available - 1) // round_length
+    k = max(math.ceil(available / round_length) - 1, 0)
+    while k > 0 and k * round_length >= available:
+        k -= 1
+    return k
+
+def _stable_rounds(queue, time_quantum, time, next_arrival):
+    """Ronde RR penuh yang bisa dilompati: tidak ada proses selesai dan tidak ada kedatangan.
+
+    Kedatangan dimasukkan setelah setiap slice, jadi akhir ronde terakhir
+    harus sebelum kedatangan berikutnya.
+    """
+    rounds = min(max_full_rounds(p.remaining_time, time_quantum) for p in queue)
+    if next_arrival is not None and rounds:
+        rounds = min(rounds, max_full_rounds(next_arrival - time, len(queue) * time_quantum))
+    return rounds
+
+def rr_stream(processes, time_quantum, fast_forward=False):
+    """Versi generator: segmen dihasilkan satu per satu tanpa menyimpan timeline.
+
+    Dengan fast_forward=True, selama himpunan proses siap tidak bisa berubah
+    (tidak ada kedatangan dan tidak ada yang selesai) k ronde penuh dihitung
+    sekaligus: satu proses menghasilkan satu SEGMENT gabungan, beberapa
+    proses menghasilkan satu SPAN (pids, start, quantum, rounds). State
+    setiap proses tetap sama persis dengan simulasi per slice.
+    """
     queue = deque()
-    processes = sorted(processes, key=lambda p: p.arrival_time)
+    processes = arrival_order(processes)
     time = 0
-    timeline = []
     i = 0
 
     while queue or i < len(processes):
@@ -16,12 +59,27 @@ def rr_scheduler(processes, time_quantum):
             time = processes[i].arrival_time
             continue
 
+        if fast_forward:
+            next_arrival = processes[i].arrival_time if i < len(processes) else None
+            rounds = _stable_rounds(queue, time_quantum, time, next_arrival)
+            if rounds:
+                for j, p in enumerate(queue):
+                    if p.start_time is None:
+                        p.start_time = time + j * time_quantum
+                    p.remaining_time -= rounds * time_quantum
+                if len(queue) == 1:
+                    yield (SEGMENT, (queue[0].pid, time, time + rounds * time_quantum))
+                else:
+                    yield (SPAN, (tuple(p.pid for p in queue), time, time_quantum, rounds))
+                time += rounds * len(queue) * time_quantum
+                continue
+
         p = queue.popleft()
         if p.start_time is None:
             p.start_time = time
 
         execution_time = min(time_quantum, p.remaining_time)
-        timeline.append((p.pid, time, time + execution_time))
+        yield (SEGMENT, (p.pid, time, time + execution_time))
         time += execution_time
         p.remaining_time -= execution_time
 
@@ -33,5 +91,3 @@ def rr_scheduler(processes, time_quantum):
             queue.append(p)
         else:
             p.completion_time = time
-
-    return timeline
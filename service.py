@@ -0,0 +1,437 @@
+# service.py
+"""Layanan simulasi lokal: HTTP (TCP atau Unix socket) di depan pool worker.
+
+Setiap worker adalah proses yang sudah mengimpor scheduler, metrics dan
+matplotlib serta menjalankan satu simulasi dan satu render Gantt saat start,
+sehingga request tidak membayar biaya cold start interpreter. Worker juga
+menyimpan ResultCache di memori, jadi query what-if yang berulang langsung
+dijawab dari cache.
+
+Request yang datang bersamaan di-batch: dispatcher hanya mengirim satu batch
+per worker yang sedang bebas, dan semua request yang menumpuk selama worker
+sibuk dikirim sebagai satu task (satu round-trip pickle untuk banyak
+simulasi). Saat sepi setiap request langsung dikirim tanpa jendela tunggu.
+
+    POST /simulate   {"scheduler": "mlfq", "processes": [{"pid": "P1", "arrival_time": 0,
+                      "burst_time": 12, "io_burst": 3, "priority": 2}, ...],
+                      "tq": [2, 4, 8], "aging": 10, "max_time": 50, "rr_quantum": 4, "gantt": false}
+                     body berupa list request juga diterima (hasilnya list, urutan sama)
+    GET  /stats      jumlah request, ukuran batch, latensi p50/p95/p99 (ms)
+    GET  /health
+
+Jalankan:  python service.py --port 8765 --workers 4   (atau --unix-socket /tmp/sched-sim.sock)
+"""
+import argparse
+import base64
+import http.client
+import io
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import main as defaults
+
+SERVICE_SCHEDULERS = ('fcfs', 'rr', 'mlfq')
+MAX_BODY = 16 * 1024 * 1024
+LATENCY_WINDOW = 10000 # Jumlah latensi terakhir yang dipakai untuk persentil /stats
+
+# ResultCache milik worker, dibuat oleh _init_worker
+_worker_cache = None
+
+
+# ----------------------------------------------------------------------
+# Sisi worker
+# ----------------------------------------------------------------------
+def _init_worker(cache_entries, ready):
+    global _worker_cache
+    from cache import ResultCache
+
+    # Ctrl+C ditangani proses utama, yang menutup pool dengan rapi
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _worker_cache = ResultCache(directory=None, max_entries=cache_entries)
+    # Pemanasan: import modul berat, source scheduler (versi cache) dan font matplotlib
+    sample = [{'pid': p.pid, 'arrival_time': p.arrival_time, 'burst_time': p.burst_time,
+               'io_burst': p.io_burst, 'priority': p.original_priority} for p in defaults.sample_processes]
+    for scheduler in SERVICE_SCHEDULERS:
+        simulate_request({'scheduler': scheduler, 'processes': sample, 'gantt': scheduler == 'mlfq'})
+    ready.put(os.getpid())
+
+
+def _gantt_png(timeline, title):
+    """Gantt chart sebagai PNG base64 (Figure tanpa pyplot, seperti laporan PDF)"""
+    from matplotlib.figure import Figure
+    from gantt import render_gantt
+
+    fig = Figure(figsize=(10, 4))
+    gnt = fig.add_subplot()
+    render_gantt(gnt, timeline, 0, max((end for _, _, end in timeline), default=1), title=title)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=80)
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def _positive_int(value, name):
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise ValueError(f"{name} harus bilangan bulat positif")
+    return value
+
+
+def simulate_request(request):
+    """Jalankan satu request JSON (dict); mengembalikan dict hasil yang siap di-serialisasi.
+
+    Parameter tidak valid menghasilkan ValueError.
+    """
+    from cache import cached_run
+    from metrics import compute_metrics, process_columns
+    from process import _NONE
+    from trace_file import load_records
+
+    if not isinstance(request, dict):
+        raise ValueError("Request harus objek JSON")
+    scheduler = request.get('scheduler', 'mlfq')
+    if scheduler not in SERVICE_SCHEDULERS:
+        raise ValueError(f"Scheduler tidak dikenal: {scheduler} (pilih {', '.join(SERVICE_SCHEDULERS)})")
+    records = request.get('processes')
+    if not isinstance(records, list) or not records:
+        raise ValueError("processes harus list proses yang tidak kosong")
+    table = load_records(records, 'processes')
+    if min(table.burst_time) <= 0 or min(table.arrival_time) < 0 or min(table.io_burst) < 0:
+        raise ValueError("burst_time harus positif; arrival_time dan io_burst tidak boleh negatif")
+
+    tq = request.get('tq', defaults.TIME_QUANTUMS)
+    if not isinstance(tq, list) or not tq:
+        raise ValueError("tq harus list time quantum")
+    for quantum in tq:
+        _positive_int(quantum, 'tq')
+    # Aging: satu nilai, atau satu nilai per level (None = tanpa aging); panjang list dicek mlfq
+    aging = request.get('aging', defaults.AGING_THRESHOLD)
+    for threshold in aging if isinstance(aging, list) else [aging]:
+        if threshold is not None:
+            _positive_int(threshold, 'aging')
+    max_time = _positive_int(request.get('max_time', defaults.MAX_TIME_UNITS), 'max_time')
+    rr_quantum = _positive_int(request.get('rr_quantum', 4), 'rr_quantum')
+
+    timeline, _ = cached_run(scheduler, table, time_quantums=tq, aging_threshold=aging, max_time=max_time,
+                             rr_quantum=rr_quantum, cache=_worker_cache)
+    end_time = max((end for _, _, end in timeline), default=None)
+    result = {
+        'scheduler': scheduler,
+        'timeline': [list(segment) for segment in timeline],
+        'metrics': compute_metrics(process_columns(table), end_time=end_time),
+        'processes': [
+            {'pid': pid, 'start_time': None if start == _NONE else start,
+             'completion_time': None if completion == _NONE else completion,
+             'remaining_time': remaining}
+            for pid, start, completion, remaining in zip(table.pids, table.start_time, table.completion_time,
+                                                         table.remaining_time)
+        ],
+    }
+    if request.get('gantt'):
+        result['gantt_png'] = _gantt_png(timeline, f"Gantt Chart {scheduler.upper()}")
+    return result
+
+
+def _run_batch(requests):
+    """Satu task pool: list request -> list (status HTTP, body)"""
+    results = []
+    for request in requests:
+        try:
+            results.append((200, simulate_request(request)))
+        except ValueError as e:
+            results.append((400, {'error': str(e)}))
+        except Exception as e:
+            results.append((500, {'error': f"{type(e).__name__}: {e}"}))
+    return results
+
+
+# ----------------------------------------------------------------------
+# Pool + dispatcher batch
+# ----------------------------------------------------------------------
+class SimulationService:
+    """Pool worker hangat dengan batching request.
+
+    Paling banyak satu batch per worker sedang berjalan; request yang
+    menunggu slot worker dikumpulkan (maksimal max_batch) menjadi satu task.
+    """
+
+    def __init__(self, workers=None, max_batch=32, cache_entries=256):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max_batch
+        # Pool dibuat sebelum thread apa pun berjalan; worker langsung start dan memanaskan diri
+        self._ready = multiprocessing.SimpleQueue()
+        self.pool = multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                         initargs=(cache_entries, self._ready))
+        self._pending = queue.SimpleQueue()
+        self._slots = threading.Semaphore(self.workers)
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self.request_count = 0
+        self.batch_count = 0
+        self._dispatcher = threading.Thread(target=self._dispatch, name="dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def warm_up(self):
+        """Tunggu sampai semua worker selesai pemanasan"""
+        for _ in range(self.workers):
+            self._ready.get()
+
+    def submit(self, request):
+        """Antrikan request; Future berisi (status HTTP, body)"""
+        future = Future()
+        self._pending.put((request, future))
+        return future
+
+    def run(self, request, timeout=None):
+        return self.submit(request).result(timeout)
+
+    def record_latency(self, seconds):
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def _dispatch(self):
+        while True:
+            self._slots.acquire()
+            item = self._pending.get()
+            if item is None:
+                return
+            batch = [item]
+            # Ambil semua yang sudah menunggu, tanpa jendela tunggu tambahan
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._pending.put(None)
+                    break
+                batch.append(item)
+            with self._lock:
+                self.request_count += len(batch)
+                self.batch_count += 1
+            futures = [future for _, future in batch]
+            self.pool.apply_async(_run_batch, ([request for request, _ in batch],),
+                                  callback=partial(self._finish, futures),
+                                  error_callback=partial(self._fail, futures))
+
+    def _finish(self, futures, results):
+        self._slots.release()
+        for future, result in zip(futures, results):
+            future.set_result(result)
+
+    def _fail(self, futures, error):
+        self._slots.release()
+        for future in futures:
+            future.set_exception(error)
+
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            requests, batches = self.request_count, self.batch_count
+        result = {
+            'workers': self.workers,
+            'requests': requests,
+            'batches': batches,
+            'mean_batch': requests / batches if batches else None,
+            'latency_ms': None,
+        }
+        if latencies:
+            n = len(latencies)
+            result['latency_ms'] = {f'p{q}': 1000 * latencies[min(n - 1, q * n // 100)] for q in (50, 95, 99)}
+            result['latency_ms']['max'] = 1000 * latencies[-1]
+        return result
+
+    def close(self):
+        """Selesaikan request yang sudah diantrikan, lalu hentikan worker"""
+        self._pending.put(None)
+        self._dispatcher.join()
+        self.pool.close()
+        self.pool.join()
+
+
+# ----------------------------------------------------------------------
+# HTTP
+# ----------------------------------------------------------------------
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "SchedSim/1.0"
+    # Keep-alive: klien dashboard memakai ulang koneksi, tanpa handshake per query
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def address_string(self):
+        # Klien Unix socket tidak memiliki alamat (client_address = '')
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == "/health":
+            self._send_json(200, {'status': 'ok', 'workers': service.workers})
+        elif self.path == "/stats":
+            self._send_json(200, service.stats())
+        else:
+            self._send_json(404, {'error': f"Path tidak dikenal: {self.path}"})
+
+    def do_POST(self):
+        started = time.perf_counter()
+        if self.path != "/simulate":
+            self._send_json(404, {'error': f"Path tidak dikenal: {self.path}"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            self.close_connection = True
+            self._send_json(413, {'error': f"Body melebihi {MAX_BODY} byte"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            self._send_json(400, {'error': f"JSON tidak valid: {e}"})
+            return
+
+        service = self.server.service
+        many = isinstance(payload, list)
+        futures = [service.submit(request) for request in (payload if many else [payload])]
+        try:
+            results = [future.result(self.server.request_timeout) for future in futures]
+        except FutureTimeout:
+            self._send_json(504, {'error': f"Simulasi melebihi {self.server.request_timeout} s"})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': f"{type(e).__name__}: {e}"})
+            return
+        if many:
+            self._send_json(200, [body for _, body in results])
+        else:
+            self._send_json(*results[0])
+        service.record_latency(time.perf_counter() - started)
+
+
+class _UnixHandler(_Handler):
+    disable_nagle_algorithm = False # TCP_NODELAY tidak berlaku untuk AF_UNIX
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        # Sisa socket dari run sebelumnya dihapus; file biasa tidak disentuh
+        try:
+            if stat.S_ISSOCK(os.stat(self.server_address).st_mode):
+                os.unlink(self.server_address)
+        except FileNotFoundError:
+            pass
+        super().server_bind()
+
+
+def make_server(service, host="127.0.0.1", port=8765, unix_socket=None, request_timeout=30, verbose=False):
+    """Server HTTP untuk `service`; jalankan dengan serve_forever()"""
+    if unix_socket:
+        server = _UnixServer(unix_socket, _UnixHandler)
+    else:
+        server = _TCPServer((host, port), _Handler)
+    server.service = service
+    server.request_timeout = request_timeout
+    server.verbose = verbose
+    return server
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout):
+        super().__init__("localhost", timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+class SimulationClient:
+    """Klien keep-alive kecil untuk service ini (TCP atau Unix socket)"""
+
+    def __init__(self, host="127.0.0.1", port=8765, unix_socket=None, timeout=60):
+        if unix_socket:
+            self.connection = _UnixConnection(unix_socket, timeout)
+        else:
+            self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _request(self, method, path, payload=None):
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    def simulate(self, request):
+        """(status HTTP, body); request boleh dict atau list dict"""
+        return self._request("POST", "/simulate", request)
+
+    def stats(self):
+        return self._request("GET", "/stats")[1]
+
+    def close(self):
+        self.connection.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan simulasi lokal dengan pool worker hangat")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", metavar="PATH", help="Dengarkan di Unix socket alih-alih TCP")
+    parser.add_argument("--workers", type=int, help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument("--max-batch", type=int, default=32, help="Jumlah request maksimum per task worker")
+    parser.add_argument("--cache-entries", type=int, default=256, help="Ukuran cache hasil per worker (0 = mati)")
+    parser.add_argument("--timeout", type=float, default=30, help="Batas waktu satu request (detik)")
+    parser.add_argument("--verbose", action="store_true", help="Log setiap request")
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers minimal 1")
+    if args.max_batch < 1:
+        parser.error("--max-batch minimal 1")
+
+    service = SimulationService(args.workers, args.max_batch, args.cache_entries)
+    service.warm_up()
+    server = make_server(service, args.host, args.port, args.unix_socket, args.timeout, args.verbose)
+    where = args.unix_socket or f"http://{args.host}:{server.server_address[1]}"
+    print(f"Layanan simulasi siap di {where} ({service.workers} worker)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.unix_socket:
+            os.unlink(args.unix_socket)
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+# smp.py
+"""Mode multi-CPU (SMP): N core, masing-masing dengan run queue sendiri.
+
+Setiap core memegang satu instance policy (lihat policies.py) sebagai run
+queue. Simulasi digerakkan event: heap waktu selesai slice per core,
+cursor kedatangan, dan subsistem I/O bersama (io_devices). Core yang
+menganggur dan core yang punya proses menunggu disimpan sebagai bitmask,
+sehingga memilih core tujuan, membangunkan core, dan mencari korban work
+stealing tidak pernah memindai semua core; hanya core yang state-nya
+berubah pada suatu waktu yang dikunjungi.
+
+Penempatan proses baru: core menganggur dengan run queue kosong jika
+ada, jika tidak power-of-two-choices (dua core acak, pilih yang lebih
+ringan). Proses yang kembali dari I/O atau dicuri mengingat core
+terakhirnya; berjalan di core lain dikenai biaya migrasi (lihat
+socket_migration_cost) sebelum slice dimulai. Core yang kosong mencuri
+satu proses dari core sibuk terdekat (nomor core berikutnya, melingkar),
+yang pada topologi socket berarti korban satu socket lebih dulu.
+
+Kedatangan dan I/O selesai di tengah slice masuk ready set tepat pada
+waktunya (agar core lain yang menganggur bisa langsung mengambilnya),
+bukan saat slice berakhir seperti di engine. Dengan 1 core, timeline
+policy yang memasukkan kedatangan lebih dulu (FCFS, RR, SJF, SRTF,
+prioritas) sama dengan engine.simulate; wait_time dihitung sejak waktu
+datang sebenarnya. MLFQPolicy bisa berbeda urutan karena engine
+menaruh proses yang quantum-nya habis sebelum kedatangan itu.
+"""
+import heapq
+import random
+
+from io_devices import UnlimitedIO
+from process import arrival_order
+from queue_log import NullQueueLog
+from stream import EVENT, SEGMENT
+
+
+def socket_migration_cost(cores_per_socket, local, remote):
+    """Biaya migrasi berbasis topologi: `local` antar core satu socket, `remote` antar socket"""
+    def cost(src, dst):
+        return local if src // cores_per_socket == dst // cores_per_socket else remote
+    return cost
+
+
+def _lowest(mask):
+    return (mask & -mask).bit_length() - 1
+
+
+def _nearest(mask, core):
+    """Core di mask dengan nomor terdekat setelah `core` (melingkar), atau -1"""
+    if not mask:
+        return -1
+    after = mask >> (core + 1)
+    if after:
+        return core + 1 + _lowest(after)
+    return _lowest(mask)
+
+
+def smp_stream(processes, policy_factory, cores, max_time=None, io=None, migration_cost=0,
+               affinity_slack=2, steal=True, seed=0, stats=None):
+    """Jalankan `cores` core; menghasilkan (core, item) dengan item stream biasa (SEGMENT/EVENT).
+
+    `policy_factory()` membuat run queue satu core. migration_cost berupa
+    angka atau fungsi (core asal, core tujuan) -> biaya. Proses yang
+    kembali dari I/O tetap di core terakhirnya jika core itu menganggur
+    atau run queue-nya lebih pendek dari affinity_slack (dan tidak ada
+    core kosong). Jika `stats` (list dict per core) diberikan, statistik
+    per core diakumulasikan di sana.
+    """
+    if cores < 1:
+        raise ValueError("Jumlah core minimal 1")
+    if not callable(migration_cost):
+        fixed_cost = migration_cost
+        migration_cost = lambda src, dst: fixed_cost
+    arrivals = arrival_order(processes)
+    count = len(arrivals)
+    limit = float('inf') if max_time is None else max_time
+    if io is None:
+        io = UnlimitedIO()
+    if stats is None:
+        stats = [_core_stats() for _ in range(cores)]
+    rng = random.Random(seed)
+
+    null_log = NullQueueLog()
+    policies = [policy_factory() for _ in range(cores)]
+    for policy in policies:
+        policy.start(null_log)
+
+    time = 0
+    idx = 0
+    running = [None] * cores # (proses, label antrian, awal slice)
+    free = [] # heap (waktu selesai slice, core)
+    idle_mask = (1 << cores) - 1 # core tanpa slice berjalan
+    waiting_mask = 0 # core dengan proses menunggu di run queue
+    wake = 0 # core menganggur yang perlu mencoba dispatch pada waktu ini
+    last_core = {}
+    enqueued_at = {}
+
+    def event(core, current_time, action, process=None, from_q=None, to_q=None):
+        pid = process.pid if process is not None else None
+        return core, (EVENT, {'time': current_time, 'action': action, 'process': pid, 'from_q': from_q, 'to_q': to_q})
+
+    def sync(core):
+        nonlocal waiting_mask
+        if policies[core]:
+            waiting_mask |= 1 << core
+        else:
+            waiting_mask &= ~(1 << core)
+
+    def place(p, prev):
+        """Core tujuan proses yang masuk ready set"""
+        empty = idle_mask & ~waiting_mask
+        if prev is not None:
+            if idle_mask >> prev & 1 or (not empty and len(policies[prev]) < affinity_slack):
+                return prev
+            if empty:
+                return _nearest(empty, prev)
+        elif empty:
+            return _lowest(empty)
+        a, b = rng.randrange(cores), rng.randrange(cores)
+        load_a = len(policies[a]) + (running[a] is not None)
+        load_b = len(policies[b]) + (running[b] is not None)
+        return a if load_a <= load_b else b
+
+    def enqueue(p, core, from_io=False):
+        nonlocal wake
+        to_q = policies[core].admit(p, time, from_io)
+        sync(core)
+        if idle_mask >> core & 1:
+            wake |= 1 << core
+        elif steal:
+            # Core lain yang kosong bisa mencuri proses ini
+            empty = idle_mask & ~waiting_mask & ~wake
+            if empty:
+                wake |= 1 << _nearest(empty, core)
+        return to_q
+
+    def admit_arrivals():
+        nonlocal idx
+        while idx < count and arrivals[idx].arrival_time <= time:
+            p = arrivals[idx]
+            idx += 1
+            enqueued_at[p] = time
+            core = place(p, None)
+            yield event(core, time, "Arrival", p, to_q=enqueue(p, core))
+
+    def finish(core):
+        nonlocal idle_mask, wake
+        p, from_q, start = running[core]
+        running[core] = None
+        idle_mask |= 1 << core
+        wake |= 1 << core
+        if p.remaining_time <= 0:
+            p.completion_time = time
+            yield event(core, time, "Completed", p, from_q=from_q)
+        elif io.needs_io(p):
+            p.in_io = True
+            p.remaining_io = p.io_burst
+            p.io_count += 1
+            io.submit(p, time, start)
+            yield event(core, time, "IO Blocked", p, from_q=from_q)
+        else:
+            policy = policies[core]
+            if policy.admit_arrivals_first:
+                yield from admit_arrivals()
+            p.last_run_time = time
+            enqueued_at[p] = time
+            action, to_q = policy.requeue(p, time)
+            sync(core)
+            yield event(core, time, action, p, from_q=from_q, to_q=to_q)
+
+    def dispatch(core):
+        nonlocal idle_mask
+        policy = policies[core]
+        for action, p, from_q, to_q in policy.tick(time):
+            yield event(core, time, action, p, from_q, to_q)
+        picked = policy.pick(time)
+        if picked is None and steal:
+            victim = _nearest(waiting_mask & ~idle_mask & ~(1 << core), core)
+            if victim >= 0:
+                p = policies[victim].steal(time)
+                sync(victim)
+                stats[core]['steals'] += 1
+                policy.admit(p, time)
+                yield event(core, time, "Work Steal", p, from_q=f"C{victim}", to_q=f"C{core}")
+                picked = policy.pick(time)
+        sync(core)
+        if picked is None:
+            return
+
+        p, from_q = picked
+        core_stats = stats[core]
+        p.wait_time += time - enqueued_at.pop(p)
+        if p.start_time is None:
+            p.start_time = time
+        begin = time
+        prev = last_core.get(p)
+        if prev is not None and prev != core:
+            cost = migration_cost(prev, core)
+            begin += cost
+            core_stats['migrations'] += 1
+            core_stats['migration_time'] += cost
+            yield event(core, time, "Migration", p, from_q=f"C{prev}", to_q=f"C{core}")
+        last_core[p] = core
+
+        run = p.remaining_time
+        time_slice = policy.time_slice(p)
+        if time_slice is not None and time_slice < run:
+            run = time_slice
+        io_limit = io.run_limit(p)
+        if io_limit is not None and io_limit < run:
+            run = io_limit
+        if policy.preemptive:
+            # Dipotong pada kedatangan/I-O selesai berikutnya (jika jatuh setelah biaya migrasi)
+            if idx < count and begin < arrivals[idx].arrival_time < begin + run:
+                run = arrivals[idx].arrival_time - begin
+            next_io = io.next_completion()
+            if next_io is not None and begin < next_io < begin + run:
+                run = next_io - begin
+
+        end = begin + run
+        p.remaining_time -= run
+        p.service_time += run
+        core_stats['busy_time'] += run
+        core_stats['slices'] += 1
+        running[core] = (p, from_q, begin)
+        idle_mask &= ~(1 << core)
+        heapq.heappush(free, (end, core))
+        yield core, (SEGMENT, (p.pid, begin, end))
+
+    while True:
+        # 1. Slice yang selesai pada waktu ini (urut nomor core)
+        while free and free[0][0] <= time:
+            _, core = heapq.heappop(free)
+            yield from finish(core)
+
+        # 2. Kedatangan Proses Baru
+        yield from admit_arrivals()
+
+        # 3. I/O selesai: kembali ke core terakhir jika afinitasnya masih layak
+        next_io = io.next_completion()
+        if next_io is not None and next_io <= time:
+            for done_at, p in io.pop_completed(time):
+                p.in_io = False
+                p.remaining_io = done_at - time
+                p.last_run_time = time
+                enqueued_at[p] = time
+                core = place(p, last_core.get(p))
+                yield event(core, time, "IO Complete, Requeue", p, to_q=enqueue(p, core, from_io=True))
+
+        # 4. Core yang menganggur atau baru bebas memilih proses (atau mencuri)
+        while wake:
+            core = _lowest(wake)
+            wake &= ~(1 << core)
+            if idle_mask >> core & 1:
+                yield from dispatch(core)
+
+        # 5. Maju ke event berikutnya
+        candidates = []
+        if free:
+            candidates.append(free[0][0])
+        if idx < count:
+            candidates.append(arrivals[idx].arrival_time)
+        next_io = io.next_completion()
+        if next_io is not None:
+            candidates.append(next_io)
+        if not candidates:
+            break
+        time = min(candidates)
+        if time >= limit:
+            # Slice yang sudah berjalan tetap diselesaikan, tanpa dispatch baru
+            while free:
+                time, core = heapq.heappop(free)
+                yield from finish(core)
+            break
+
+    # Tutup akumulasi waktu tunggu dan sisa I/O pada saat simulasi berhenti
+    for p, since in enqueued_at.items():
+        p.wait_time += time - since
+    for done_at, p in io.pending():
+        p.remaining_io = p.io_burst if done_at is None else done_at - time
+
+
+def _core_stats():
+    return {'busy_time': 0, 'slices': 0, 'migrations': 0, 'migration_time': 0, 'steals': 0}
+
+
+def smp_simulate(processes, policy_factory, cores, max_time=None, io=None, migration_cost=0,
+                 affinity_slack=2, steal=True, seed=0):
+    """Jalankan mode SMP; mengembalikan (timeline per core, statistik per core).
+
+    Statistik tiap core: busy_time, utilization (terhadap akhir simulasi),
+    slices, migrations, migration_time dan steals.
+    """
+    timelines = [[] for _ in range(cores)]
+    stats = [_core_stats() for _ in range(cores)]
+    for core, (kind, payload) in smp_stream(processes, policy_factory, cores, max_time, io, migration_cost,
+                                            affinity_slack, steal, seed, stats):
+        if kind == SEGMENT:
+            timelines[core].append(payload)
+    end_time = max((timeline[-1][2] for timeline in timelines if timeline), default=0)
+    for core_stats in stats:
+        core_stats['utilization'] = core_stats['busy_time'] / end_time if end_time else 0.0
+    return timelines, stats
+
+
+def merge_timelines(timelines):
+    """Gabungkan timeline per core menjadi satu timeline (pid, start, end) terurut menurut start"""
+    return sorted((segment for timeline in timelines for segment in timeline), key=lambda s: (s[1], s[2]))
+
+
+def smp_mlfq_scheduler(processes, time_quantums, aging_threshold, max_time, cores, **options):
+    """MLFQ di `cores` core: run queue MLFQ per core (opsi lain diteruskan ke smp_simulate)"""
+    from policies import MLFQPolicy
+    return smp_simulate(processes, lambda: MLFQPolicy(time_quantums, aging_threshold), cores, max_time, **options)
+
+
+def smp_rr_scheduler(processes, time_quantum, cores, max_time=None, **options):
+    """Round Robin di `cores` core: run queue RR per core (opsi lain diteruskan ke smp_simulate)"""
+    from policies import RoundRobinPolicy
+    return smp_simulate(processes, lambda: RoundRobinPolicy(time_quantum), cores, max_time, **options)
@@ -0,0 +1,185 @@
+# stream.py
+import json
+
+from process import arrival_order
+
+# Jenis item yang dihasilkan oleh *_stream scheduler:
+#   (SEGMENT, (pid, start, end))
+#   (EVENT, {'time', 'action', 'process', 'from_q', 'to_q'})
+#   (SPAN, (pids, start, quantum, rounds)) -- `rounds` ronde Round Robin penuh
+#       berturut-turut atas `pids` (mode fast_forward); lihat expand_span
+SEGMENT = "segment"
+EVENT = "event"
+SPAN = "span"
+
+
+def expand_span(payload):
+    """Segmen (pid, start, end) yang diringkas oleh satu SPAN"""
+    pids, start, quantum, rounds = payload
+    n = len(pids)
+    for r in range(rounds):
+        for j, pid in enumerate(pids):
+            slice_start = start + (r * n + j) * quantum
+            yield (pid, slice_start, slice_start + quantum)
+
+
+def consume(stream, *sinks):
+    """Alirkan item dari scheduler ke setiap sink tanpa menyimpan timeline.
+
+    SPAN diteruskan ke sink.span jika ada; jika tidak, diurai menjadi segmen.
+    """
+    for kind, payload in stream:
+        if kind == SEGMENT:
+            pid, start, end = payload
+            for sink in sinks:
+                sink.segment(pid, start, end)
+        elif kind == SPAN:
+            for sink in sinks:
+                if hasattr(sink, 'span'):
+                    sink.span(*payload)
+                else:
+                    for pid, start, end in expand_span(payload):
+                        sink.segment(pid, start, end)
+        else:
+            for sink in sinks:
+                sink.event(payload)
+    for sink in sinks:
+        sink.close()
+    return sinks
+
+
+class MetricsSink:
+    """Akumulasi TAT, WT dan RT secara inkremental.
+
+    Hanya proses yang belum selesai yang disimpan; begitu total segmen
+    sebuah proses mencapai burst_time, metriknya ditambahkan ke jumlah
+    berjalan dan state-nya dibuang. Arrival/burst dibaca dari workload
+    (urut kedatangan) baru saat PID-nya pertama kali muncul di segmen.
+    """
+
+    def __init__(self, processes):
+        self._arrivals = iter(arrival_order(processes))
+        self._info = {} # pid -> (arrival_time, burst_time), hanya proses yang sudah datang dan belum selesai
+        self._active = {} # pid -> [start_time, service_time]
+        self.completed = 0
+        self.total_tat = 0
+        self.total_wt = 0
+        self.total_rt = 0
+        self.last_end = 0
+
+    def _admit(self, pid):
+        # Segmen terurut waktu: workload dibaca hanya sampai PID ini, jadi _info berisi proses yang sudah datang
+        while pid not in self._info:
+            p = next(self._arrivals)
+            self._info[p.pid] = (p.arrival_time, p.burst_time)
+
+    def segment(self, pid, start, end):
+        state = self._active.get(pid)
+        if state is None:
+            self._admit(pid)
+            state = self._active[pid] = [start, 0]
+        state[1] += end - start
+        self.last_end = max(self.last_end, end)
+
+        self._finish(pid, state, end)
+
+    def span(self, pids, start, quantum, rounds):
+        # Selama SPAN tidak ada proses yang selesai: cukup tambah waktu layanan
+        for j, pid in enumerate(pids):
+            state = self._active.get(pid)
+            if state is None:
+                self._admit(pid)
+                state = self._active[pid] = [start + j * quantum, 0]
+            state[1] += rounds * quantum
+        self.last_end = max(self.last_end, start + rounds * len(pids) * quantum)
+
+    def _finish(self, pid, state, end):
+        arrival, burst = self._info[pid]
+        if state[1] >= burst:
+            tat = end - arrival
+            self.completed += 1
+            self.total_tat += tat
+            self.total_wt += tat - burst
+            self.total_rt += state[0] - arrival
+            del self._active[pid]
+            del self._info[pid]
+
+    def event(self, entry):
+        pass
+
+    def close(self):
+        pass
+
+    def averages(self):
+        if not self.completed:
+            return None
+        return {
+            'Average Turnaround Time': self.total_tat / self.completed,
+            'Average Waiting Time': self.total_wt / self.completed,
+            'Average Response Time': self.total_rt / self.completed,
+        }
+
+
+class FileSink:
+    """Tulis setiap segmen dan event sebagai satu baris JSON (JSON Lines)"""
+
+    def __init__(self, path):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def segment(self, pid, start, end):
+        self._file.write(json.dumps({'type': SEGMENT, 'pid': pid, 'start': start, 'end': end}) + "\n")
+
+    def event(self, entry):
+        self._file.write(json.dumps(dict(entry, type=EVENT)) + "\n")
+
+    def span(self, pids, start, quantum, rounds):
+        self._file.write(json.dumps({'type': SPAN, 'pids': list(pids), 'start': start,
+                                     'quantum': quantum, 'rounds': rounds}) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class GanttSink:
+    """Kumpulkan bar Gantt per PID dalam jendela [0, max_time].
+
+    Segmen berurutan dari proses yang sama digabung, sehingga memori
+    sebanding dengan jumlah bar yang terlihat, bukan panjang trace.
+    """
+
+    def __init__(self, max_time=None):
+        self.max_time = max_time
+        self.bars = {} # pid -> [(start, durasi), ...]
+
+    def segment(self, pid, start, end):
+        if self.max_time is not None:
+            if start >= self.max_time:
+                return
+            end = min(end, self.max_time)
+        if end <= start:
+            return
+        bars = self.bars.setdefault(pid, [])
+        if bars and bars[-1][0] + bars[-1][1] == start:
+            bars[-1] = (bars[-1][0], end - bars[-1][0])
+        else:
+            bars.append((start, end - start))
+
+    def span(self, pids, start, quantum, rounds):
+        # Hanya ronde yang mulai sebelum max_time yang terlihat di chart
+        if self.max_time is not None:
+            rounds = min(rounds, int(-(-(self.max_time - start) // (len(pids) * quantum))))
+        for pid, seg_start, seg_end in expand_span((pids, start, quantum, max(rounds, 0))):
+            self.segment(pid, seg_start, seg_end)
+
+    def event(self, entry):
+        pass
+
+    def close(self):
+        pass
+
+    def draw(self, gnt, title=None):
+        """Gambar bar yang terkumpul dengan renderer Gantt bersama (gantt.render_gantt)"""
+        from gantt import render_gantt
+
+        timeline = [(pid, start, start + width) for pid, bars in self.bars.items() for start, width in bars]
+        render_gantt(gnt, timeline, 0, self.max_time, title=title)
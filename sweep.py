@@ -0,0 +1,149 @@
+# sweep.py
+import itertools
+import os
+import pickle
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from cache import apply_run_state, cache_key, workload_hash
+from metrics import compute_metrics, format_table, process_columns
+from mlfq import mlfq_stream
+from process import ProcessTable, column_typecode
+from stream import SEGMENT
+
+SWEEP_HEADERS = ['TQ', 'Aging', 'Max Time', 'Completed', 'Avg TAT', 'Avg WT', 'Avg RT',
+                 'p95 TAT', 'p95 WT', 'CPU Util', 'Throughput']
+
+# Workload milik worker, diisi sekali oleh _init_worker
+_worker_table = None
+
+
+def _share_workload(table):
+    """Salin kolom statis workload ke satu blok shared memory.
+
+    Mengembalikan (SharedMemory, layout); layout kecil dan hanya dikirim
+    sekali ke setiap worker lewat initializer.
+    """
+    parts = [
+        # PID boleh bertipe apa saja dan boleh berisi "\n", jadi disimpan sebagai pickle
+        ('pids', pickle.dumps(list(table.pids)), None),
+        ('arrival_time', table.arrival_time.tobytes(), column_typecode(table.arrival_time)),
+        ('burst_time', table.burst_time.tobytes(), column_typecode(table.burst_time)),
+        ('io_burst', table.io_burst.tobytes(), column_typecode(table.io_burst)),
+        ('original_priority', table.original_priority.tobytes(), column_typecode(table.original_priority)),
+    ]
+    size = sum(len(data) for _, data, _ in parts)
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    layout = {'count': len(table), 'columns': []}
+    offset = 0
+    for name, data, typecode in parts:
+        shm.buf[offset:offset + len(data)] = data
+        layout['columns'].append((name, offset, len(data), typecode))
+        offset += len(data)
+    return shm, layout
+
+
+def _init_worker(shm_name, layout):
+    global _worker_table
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        columns = {}
+        for name, offset, length, typecode in layout['columns']:
+            data = bytes(shm.buf[offset:offset + length])
+            if typecode is None:
+                columns[name] = pickle.loads(data)
+            else:
+                column = array(typecode)
+                column.frombytes(data)
+                columns[name] = column
+    finally:
+        shm.close()
+    _worker_table = ProcessTable.from_arrays(columns['pids'], columns['arrival_time'], columns['burst_time'],
+                                             columns['io_burst'], columns['original_priority'])
+
+
+def _run_point(point):
+    time_quantums, aging_threshold, max_time = point
+    table = _worker_table
+    table.reset()
+    # Tanpa QueueLog: hanya state akhir proses dan akhir segmen terakhir yang dibutuhkan
+    end_time = None
+    for kind, payload in mlfq_stream(table, list(time_quantums), aging_threshold, max_time):
+        if kind == SEGMENT:
+            end_time = payload[2]
+    return _summary_row(point, compute_metrics(process_columns(table), end_time=end_time))
+
+
+def _summary_row(point, summary):
+    time_quantums, aging_threshold, max_time = point
+    row = {
+        'TQ': list(time_quantums),
+        'Aging': aging_threshold,
+        'Max Time': max_time,
+        'Completed': summary['completed'],
+    }
+    for header, key, stat in (('Avg TAT', 'tat', 'mean'), ('Avg WT', 'wt', 'mean'), ('Avg RT', 'rt', 'mean'),
+                              ('p95 TAT', 'tat', 'p95'), ('p95 WT', 'wt', 'p95')):
+        row[header] = summary[key][stat] if summary[key] else None
+    row['CPU Util'] = summary['cpu_utilization']
+    row['Throughput'] = summary['throughput']
+    return row
+
+
+def sweep_grid(quantum_grid, aging_grid, max_time_grid):
+    return [(tuple(tq), aging, max_time)
+            for tq, aging, max_time in itertools.product(quantum_grid, aging_grid, max_time_grid)]
+
+
+def _cached_rows(cache, table, points):
+    """Baris sweep untuk titik grid yang hasil mlfq-nya sudah ada di cache"""
+    rows = {}
+    digest = workload_hash(table)
+    scratch = table.clone()
+    for point in points:
+        time_quantums, aging_threshold, max_time = point
+        value = cache.get(cache_key('mlfq', table, list(time_quantums), aging_threshold, max_time, workload=digest))
+        if value is None:
+            continue
+        timeline, _, run = value
+        apply_run_state(scratch, run)
+        end_time = timeline[-1][2] if timeline else None
+        rows[point] = _summary_row(point, compute_metrics(process_columns(scratch), end_time=end_time))
+    return rows
+
+
+def run_sweep(processes, quantum_grid, aging_grid, max_time_grid, workers=None, chunksize=None, cache=None):
+    """Jalankan mlfq untuk setiap titik grid secara paralel.
+
+    Workload dikirim ke worker sekali lewat shared memory; setiap task hanya
+    membawa parameter (TQ, aging, max_time). Hasilnya satu tabel metrik
+    (list of dict, urutan sama dengan grid). Jika `cache` (ResultCache)
+    diberikan, titik yang hasilnya sudah di-cache tidak disimulasikan ulang;
+    worker berjalan tanpa QueueLog sehingga hasil sweep sendiri tidak disimpan.
+    """
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    points = sweep_grid(quantum_grid, aging_grid, max_time_grid)
+    cached = _cached_rows(cache, table, points) if cache is not None else {}
+    pending = [point for point in points if point not in cached]
+    if not pending:
+        return [cached[point] for point in points]
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(pending) // (workers * 4))
+
+    shm, layout = _share_workload(table)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shm.name, layout)) as executor:
+            computed = dict(zip(pending, executor.map(_run_point, pending, chunksize=chunksize)))
+    finally:
+        shm.close()
+        shm.unlink()
+    return [cached[point] if point in cached else computed[point] for point in points]
+
+
+def format_sweep(rows):
+    def fmt(value):
+        return f"{value:.2f}" if isinstance(value, float) else str(value)
+    return format_table(SWEEP_HEADERS, [[fmt(row[h]) for h in SWEEP_HEADERS] for row in rows])
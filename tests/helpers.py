@@ -0,0 +1,26 @@
+# tests/helpers.py
+"""Fixture bersama untuk test: workload acak dan pembanding state run"""
+from process import Process
+
+RUN_FIELDS = ('remaining_time', 'wait_time', 'last_run_time', 'start_time', 'completion_time', 'service_time',
+              'current_priority', 'io_count', 'remaining_io', 'in_io')
+
+
+def random_workload(rng, n, levels=3, arrival_spans=(5, 50), burst_spans=(5, 50, 200), io_bursts=(0, 0, 3)):
+    """n proses acak; rentang kedatangan/burst dipilih per proses dari *_spans"""
+    return [Process(f"P{i}", rng.randint(0, rng.choice(arrival_spans)), rng.randint(1, rng.choice(burst_spans)),
+                    rng.choice(io_bursts), rng.randint(1, levels)) for i in range(n)]
+
+
+def copy_processes(processes):
+    """Salinan segar (state run awal) dari list Process atau ProcessTable"""
+    return [Process(p.pid, p.arrival_time, p.burst_time, p.io_burst, p.original_priority) for p in processes]
+
+
+def run_state(processes, fields=RUN_FIELDS):
+    return [tuple(getattr(p, name) for name in fields) for p in processes]
+
+
+def reset(processes):
+    for p in processes:
+        p.reset()
@@ -0,0 +1,68 @@
+# tests/test_batch.py
+import importlib.util
+import random
+import unittest
+
+from helpers import copy_processes, random_workload as _random_workload
+from mlfq import mlfq_scheduler
+from workload import generate_workload
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def random_workload(rng, levels):
+    return _random_workload(rng, rng.randint(5, 50), levels, arrival_spans=(100,), burst_spans=(40,),
+                            io_bursts=(0, 2, 5))
+
+
+@unittest.skipUnless(HAS_NUMPY, "batch.py membutuhkan NumPy")
+class MLFQBatchTest(unittest.TestCase):
+    def assert_matches_loop(self, workloads, tq, aging, max_time):
+        from batch import mlfq_batch
+
+        result = mlfq_batch(workloads, tq, aging, max_time)
+        for w, workload in enumerate(workloads):
+            fresh = copy_processes(workload)
+            mlfq_scheduler(fresh, tq, aging, max_time)
+            order = sorted(range(len(fresh)), key=lambda i: fresh[i].arrival_time)
+            for column, i in enumerate(order):
+                p = fresh[i]
+                got = tuple(int(result[name][w, column])
+                            for name in ('start', 'completion', 'wait', 'remaining', 'priority'))
+                expected = (-1 if p.start_time is None else p.start_time,
+                            -1 if p.completion_time is None else p.completion_time,
+                            p.wait_time, p.remaining_time, p.current_priority)
+                self.assertEqual(got, expected, (w, p.pid))
+
+    def test_matches_mlfq_scheduler(self):
+        rng = random.Random(23)
+        for tq, aging, max_time in (([2, 4, 8], 10, 10**6), ([2, 4, 8], 10, 120),
+                                    ([1, 2, 3, 5, 8], [5, 7, None, 12], 10**6), ([3], None, 10**6),
+                                    ([2, 4, 8], 1, 10**6)):
+            workloads = [random_workload(rng, len(tq)) for _ in range(40)]
+            self.assert_matches_loop(workloads, tq, aging, max_time)
+
+    def test_non_positive_aging_threshold(self):
+        # Proses yang baru dipromosikan langsung naik lagi selama threshold level barunya <= 0
+        rng = random.Random(5)
+        for tq, aging in (([2, 4, 8], 0), ([2, 4, 8], -3), ([2, 4, 8], [0, 6]), ([1, 2, 4, 8], [5, 0, 0])):
+            workloads = [random_workload(rng, len(tq)) for _ in range(40)]
+            self.assert_matches_loop(workloads, tq, aging, 10**6)
+
+    def test_process_tables(self):
+        workloads = [generate_workload(n, seed=n) for n in range(5, 50, 3)]
+        self.assert_matches_loop(workloads, [2, 4, 8], 10, 10**6)
+
+    def test_summary_has_confidence_intervals(self):
+        from batch import batch_metrics, mlfq_batch, summarize
+
+        rng = random.Random(0)
+        summary = summarize(batch_metrics(mlfq_batch([random_workload(rng, 3) for _ in range(30)], [2, 4, 8], 10,
+                                                     10**6)))
+        for mean, lower, upper in summary.values():
+            self.assertLessEqual(lower, mean)
+            self.assertLessEqual(mean, upper)
+
+
+if __name__ == "__main__":
+    unittest.main()
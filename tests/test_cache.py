@@ -0,0 +1,125 @@
+# tests/test_cache.py
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import cache
+from cache import ENGINE_POLICIES, ResultCache, cache_key, cached_run, scheduler_modules, workload_hash
+from helpers import copy_processes, reset, run_state
+from mlfq import mlfq_scheduler
+from process import Process
+from workload import generate_workload
+
+
+class CodeVersionTest(unittest.TestCase):
+    def test_modules_follow_imports(self):
+        self.assertIn('rr', scheduler_modules('mlfq'))
+        for scheduler in ENGINE_POLICIES:
+            self.assertTrue({'engine', 'policies', 'io_devices', 'ready_queue'} <= set(scheduler_modules(scheduler)))
+
+    def test_external_modules_are_not_hashed(self):
+        for scheduler in ('fcfs', 'mlfq'):
+            self.assertFalse({'array', 'json', 'numpy'} & set(scheduler_modules(scheduler)))
+
+
+class WorkloadHashTest(unittest.TestCase):
+    def test_non_string_pids(self):
+        processes = [Process(1, 0, 3, 0, 1), Process(2, 1, 5, 2, 2), Process(3, 2, 4, 0, 3)]
+        expected = mlfq_scheduler(copy_processes(processes), [2, 4, 8], 10, 50)
+        cache = ResultCache(directory=None)
+        self.assertEqual(cached_run('mlfq', processes, [2, 4, 8], 10, 50, cache=cache)[0], expected[0])
+        reset(processes)
+        self.assertEqual(cached_run('mlfq', processes, [2, 4, 8], 10, 50, cache=cache)[0], expected[0])
+
+    def test_pid_boundaries_are_unambiguous(self):
+        first = [Process("a\nb", 0, 3, 0, 1), Process("c", 0, 3, 0, 1)]
+        second = [Process("a", 0, 3, 0, 1), Process("b\nc", 0, 3, 0, 1)]
+        self.assertNotEqual(workload_hash(first), workload_hash(second))
+
+
+class CacheKeyTest(unittest.TestCase):
+    def setUp(self):
+        self.processes = generate_workload(20, io_probability=0.3, seed=14)
+
+    def key(self, scheduler='mlfq', **parameters):
+        arguments = dict(time_quantums=[2, 4, 8], aging_threshold=10, max_time=10**6, rr_quantum=4)
+        arguments.update(parameters)
+        return cache_key(scheduler, self.processes, **arguments)
+
+    def test_parameters_change_key(self):
+        base = self.key()
+        self.assertEqual(self.key(), base)
+        for parameters in ({'time_quantums': [2, 4, 16]}, {'aging_threshold': 5}, {'max_time': 500},
+                           {'boost_step': 'top'}, {'boost_interval': 20}):
+            self.assertNotEqual(self.key(**parameters), base, parameters)
+        self.assertNotEqual(self.key('rr'), self.key('rr', rr_quantum=2))
+        # Parameter yang tidak dipakai scheduler tidak mengubah kunci
+        self.assertEqual(self.key('fcfs'), self.key('fcfs', rr_quantum=2, aging_threshold=5))
+        self.processes[3].burst_time += 1
+        self.assertNotEqual(self.key(), base)
+
+    def test_code_change_invalidates(self):
+        modules = scheduler_modules('mlfq')
+        base = self.key()
+        changed = dict(modules, mlfq=modules['mlfq'] + b"\n# perubahan\n")
+        with mock.patch.dict(cache._code_versions, clear=True), \
+                mock.patch.object(cache, 'scheduler_modules', return_value=changed):
+            self.assertNotEqual(self.key(), base)
+        with mock.patch.dict(cache._code_versions, clear=True):
+            self.assertEqual(self.key(), base)
+
+
+class CachedRunTest(unittest.TestCase):
+    def setUp(self):
+        self.processes = generate_workload(60, io_probability=0.5, seed=21)
+
+    def run_cached(self, result_cache):
+        reset(self.processes)
+        return cached_run('mlfq', self.processes, [2, 4, 8], 10, 10**6, cache=result_cache)
+
+    def test_hit_restores_run_state(self):
+        direct = copy_processes(self.processes)
+        expected = mlfq_scheduler(direct, [2, 4, 8], 10, 10**6)
+        result_cache = ResultCache(directory=None)
+        for _ in range(2):
+            timeline, log = self.run_cached(result_cache)
+            self.assertEqual(timeline, expected[0])
+            self.assertEqual(list(log), list(expected[1]))
+            self.assertEqual(run_state(self.processes), run_state(direct))
+        self.assertEqual((result_cache.hits, result_cache.misses), (1, 1))
+
+    def test_results_are_copies(self):
+        result_cache = ResultCache(directory=None)
+        timeline, log = self.run_cached(result_cache)
+        expected_timeline, expected_log = list(timeline), list(log)
+        timeline.append(("X", 0, 1))
+        log.append(0, "X")
+        log.record(10**7, "Arrival", "X", None, 0)
+        timeline, second = self.run_cached(result_cache)
+        self.assertEqual(timeline, expected_timeline)
+        self.assertEqual(list(second), expected_log)
+
+    def test_memory_only_by_default(self):
+        environment = {name: value for name, value in os.environ.items() if name != "SCHED_SIM_CACHE"}
+        output = subprocess.run([sys.executable, "-c", "import cache; print(cache.default_cache().directory)"],
+                                cwd=os.path.dirname(os.path.abspath(cache.__file__)), env=environment,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "None")
+
+    def test_disk_layer(self):
+        with tempfile.TemporaryDirectory() as directory:
+            expected = self.run_cached(ResultCache(directory=directory))
+            self.assertEqual(len(os.listdir(directory)), 1)
+            # Cache baru (memori kosong) membaca hasil dari disk
+            fresh = ResultCache(directory=directory)
+            with mock.patch.object(cache, '_compute', side_effect=AssertionError("tidak boleh dihitung ulang")):
+                timeline, log = self.run_cached(fresh)
+            self.assertEqual(timeline, expected[0])
+            self.assertEqual(list(log), list(expected[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# tests/test_cli.py
+import contextlib
+import io
+import unittest
+
+import cli
+
+
+def run_cli(*argv):
+    """Jalankan cli.main tanpa cache disk; mengembalikan (kode keluar, stdout, stderr)"""
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            code = cli.main(list(argv) + ["--no-cache"])
+        except SystemExit as e:
+            code = e.code
+    return code, out.getvalue(), err.getvalue()
+
+
+class ArgumentValidationTest(unittest.TestCase):
+    def assert_rejected(self, message, *argv):
+        code, _, err = run_cli("simulate", "--quiet", *argv)
+        self.assertEqual(code, 2)
+        self.assertIn(message, err)
+
+    def test_aging_count_must_match_levels(self):
+        self.assert_rejected("--aging butuh 1, 2 atau 3 nilai untuk 3 level", "--aging", "1", "2", "3", "4")
+        self.assert_rejected("--aging butuh 1, 4 atau 5 nilai untuk 5 level",
+                             "--tq", "1", "2", "3", "4", "5", "--aging", "1", "2")
+        self.assert_rejected("--aging butuh 1 nilai untuk 1 level", "--tq", "4", "--aging", "1", "2")
+
+    def test_boost_parameters(self):
+        self.assert_rejected("--boost-step", "--boost-step", "0")
+        self.assert_rejected("--boost-step", "--boost-step", "atas")
+        self.assert_rejected("--boost-interval harus positif", "--boost-interval", "0")
+
+    def test_cores_and_profile(self):
+        self.assert_rejected("--cores minimal 1", "--cores", "0")
+        self.assert_rejected("--profile hanya tersedia untuk --scheduler mlfq", "--scheduler", "rr", "--profile")
+        self.assert_rejected("--profile hanya tersedia untuk satu core", "--cores", "2", "--profile")
+
+    def test_accepted_arguments(self):
+        for argv in (["--aging", "5", "10"], ["--tq", "2", "4", "8", "16", "--aging", "5", "10", "15"],
+                     ["--boost-step", "top", "--boost-interval", "20"], ["--boost-step", "2", "--cores", "2"]):
+            code, out, _ = run_cli("simulate", "--quiet", *argv)
+            self.assertEqual(code, 0, argv)
+            self.assertIn("mlfq: 5 proses", out)
+
+    def test_boost_changes_result(self):
+        plain = run_cli("simulate", "--generate", "30", "--aging", "5")[1]
+        boosted = run_cli("simulate", "--generate", "30", "--aging", "5", "--boost-step", "top",
+                          "--boost-interval", "10")[1]
+        self.assertNotEqual(plain, boosted)
+
+
+if __name__ == "__main__":
+    unittest.main()
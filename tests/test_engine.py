@@ -0,0 +1,103 @@
+# tests/test_engine.py
+import random
+import unittest
+
+from engine import simulate
+from fcfs import fcfs_stream
+from mlfq import mlfq_scheduler
+from policies import (FCFSPolicy, HeapPolicy, MLFQPolicy, Policy, PriorityPolicy, RoundRobinPolicy, SJFPolicy,
+                      SRTFPolicy, make_policy)
+from helpers import random_workload as _random_workload, reset, run_state
+from process import ProcessTable
+from rr import rr_scheduler
+
+
+def random_workload(rng, n):
+    return _random_workload(rng, n, arrival_spans=(5, 50, 500), burst_spans=(5, 50, 400))
+
+
+class EngineLegacyTest(unittest.TestCase):
+    """Policy di engine harus sama persis dengan scheduler lama"""
+
+    def test_mlfq_policy_matches_mlfq_scheduler(self):
+        rng = random.Random(19)
+        for _ in range(200):
+            processes = random_workload(rng, rng.randint(1, 15))
+            tq = [rng.choice([1, 2, 4]), rng.choice([2, 4]), rng.choice([4, 8])]
+            aging = rng.choice([3, 10, 50])
+            max_time = rng.choice([50, 300, 10000])
+
+            timeline, log = mlfq_scheduler(processes, tq, aging, max_time)
+            expected = run_state(processes)
+            reset(processes)
+            engine_timeline, engine_log = simulate(processes, MLFQPolicy(tq, aging), max_time)
+            self.assertEqual(engine_timeline, timeline)
+            self.assertEqual(run_state(processes), expected)
+            self.assertEqual(list(engine_log), list(log))
+
+            table = ProcessTable.from_processes(processes)
+            self.assertEqual(simulate(table, MLFQPolicy(tq, aging), max_time)[0], timeline)
+            self.assertEqual(run_state(table), expected)
+
+    def test_rr_and_fcfs_policies_match_legacy(self):
+        rng = random.Random(20)
+        fields = ('start_time', 'completion_time', 'remaining_time')
+        for _ in range(200):
+            processes = random_workload(rng, rng.randint(1, 15))
+            quantum = rng.choice([1, 2, 3, 5])
+
+            timeline = rr_scheduler(processes, quantum)
+            expected = run_state(processes, fields)
+            reset(processes)
+            self.assertEqual(simulate(processes, RoundRobinPolicy(quantum))[0], timeline)
+            self.assertEqual(run_state(processes, fields), expected)
+
+            reset(processes)
+            timeline = [segment for _, segment in fcfs_stream(processes)]
+            expected = run_state(processes, fields[:2])
+            reset(processes)
+            self.assertEqual(simulate(processes, FCFSPolicy())[0], timeline)
+            self.assertEqual(run_state(processes, fields[:2]), expected)
+
+    def test_heap_policies_run_every_process_to_completion(self):
+        rng = random.Random(21)
+        for _ in range(100):
+            processes = random_workload(rng, rng.randint(1, 15))
+            for policy in (SJFPolicy(), SRTFPolicy(), PriorityPolicy(), PriorityPolicy(preemptive=True),
+                           make_policy('sjf')):
+                reset(processes)
+                timeline, _ = simulate(processes, policy)
+                self.assertTrue(all(p.completion_time is not None for p in processes))
+                self.assertEqual(sum(end - start for _, start, end in timeline),
+                                 sum(p.burst_time for p in processes))
+                self.assertTrue(all(a[2] <= b[1] for a, b in zip(timeline, timeline[1:])))
+
+
+
+class PolicyInterfaceTest(unittest.TestCase):
+    def test_abstract_methods_are_required(self):
+        for base in (Policy, HeapPolicy):
+            with self.assertRaises(TypeError):
+                base()
+
+        class Incomplete(Policy):
+            def admit(self, p, time, from_io=False):
+                return "L1"
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+        class LongestFirst(HeapPolicy):
+            name = 'ljf'
+
+            def key(self, p):
+                return -p.burst_time
+
+        processes = random_workload(random.Random(3), 10)
+        timeline, _ = simulate(processes, LongestFirst())
+        self.assertTrue(all(p.completion_time is not None for p in processes))
+        self.assertEqual(sum(end - start for _, start, end in timeline), sum(p.burst_time for p in processes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# tests/test_export.py
+import importlib.util
+import os
+import tempfile
+import unittest
+
+from export import coalesce_timeline, encode_timeline
+from helpers import copy_processes
+from mlfq import mlfq_scheduler
+from process import Process
+from workload import generate_workload
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+HAS_PYARROW = HAS_NUMPY and importlib.util.find_spec("pyarrow") is not None
+
+
+def int_pid_workload():
+    return [Process(int(p.pid[1:]), p.arrival_time, p.burst_time, p.io_burst, p.original_priority)
+            for p in generate_workload(200, io_probability=0.5, seed=16)]
+
+
+def mixed_pid_workload():
+    return [Process(i if i % 2 else f"P{i}", i, 3 + i % 5, i % 3, 1 + i % 3) for i in range(20)]
+
+
+class CoalesceTest(unittest.TestCase):
+    def test_merges_only_contiguous_segments_of_one_pid(self):
+        timeline = [("A", 0, 2), ("A", 2, 4), ("B", 4, 6), ("A", 6, 8), ("A", 9, 10)]
+        self.assertEqual(coalesce_timeline(timeline), [("A", 0, 4), ("B", 4, 6), ("A", 6, 8), ("A", 9, 10)])
+        columns = encode_timeline(timeline)
+        self.assertEqual(columns.pids, ["A", "B"])
+        self.assertEqual(columns.tolist(), coalesce_timeline(timeline))
+        self.assertEqual(encode_timeline(timeline, coalesce=False).tolist(), timeline)
+
+
+@unittest.skipUnless(HAS_NUMPY, "export membutuhkan NumPy")
+class ExportRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self._directory.name, name)
+
+    def timeline_round_trip(self, timeline, name):
+        from export import load_timeline, save_timeline
+
+        path = self.path(name)
+        count = save_timeline(timeline, path)
+        self.assertEqual(count, len(coalesce_timeline(timeline)))
+        for mmap in (True, False):
+            loaded = load_timeline(path, mmap=mmap)
+            rows = [(pid, int(start), int(end)) for pid, start, end in loaded]
+            self.assertEqual(rows, coalesce_timeline(timeline))
+        return loaded
+
+    def test_timeline_string_pids(self):
+        timeline, _ = mlfq_scheduler(generate_workload(200, io_probability=0.5, seed=16), [2, 4, 8], 10, 10**6)
+        self.timeline_round_trip(timeline, "timeline.npz")
+
+    def test_timeline_int_pids_keep_int_type(self):
+        timeline, _ = mlfq_scheduler(int_pid_workload(), [2, 4, 8], 10, 10**6)
+        loaded = self.timeline_round_trip(timeline, "timeline.npz")
+        self.assertTrue(all(type(pid) is int for pid in loaded.pids))
+
+    def test_timeline_mixed_pids_become_strings(self):
+        timeline, _ = mlfq_scheduler(mixed_pid_workload(), [2, 4, 8], 10, 10**6)
+        from export import load_timeline, save_timeline
+
+        save_timeline(timeline, self.path("timeline.npz"))
+        loaded = load_timeline(self.path("timeline.npz"))
+        self.assertEqual([(pid, int(s), int(e)) for pid, s, e in loaded],
+                         [(str(pid), s, e) for pid, s, e in coalesce_timeline(timeline)])
+
+    def test_fractional_times(self):
+        from export import load_timeline, save_timeline
+
+        timeline = [("A", 0.5, 1.25), ("B", 1.25, 3.0)]
+        save_timeline(timeline, self.path("timeline.npz"))
+        self.assertEqual([(pid, float(s), float(e)) for pid, s, e in load_timeline(self.path("timeline.npz"))],
+                         timeline)
+
+    @unittest.skipUnless(HAS_PYARROW, "Parquet membutuhkan pyarrow")
+    def test_parquet_timeline(self):
+        for processes in (generate_workload(100, seed=2), int_pid_workload()):
+            timeline, _ = mlfq_scheduler(processes, [2, 4, 8], 10, 10**6)
+            loaded = self.timeline_round_trip(timeline, "timeline.parquet")
+            self.assertEqual({type(pid) for pid in loaded.pids}, {type(processes[0].pid)})
+
+    def test_log_round_trip(self):
+        from export import load_log, save_log
+
+        for processes in (generate_workload(150, io_probability=0.5, seed=6), int_pid_workload(),
+                          mixed_pid_workload()):
+            _, log = mlfq_scheduler(copy_processes(processes), [2, 4, 8], 10, 10**6, checkpoint_interval=16)
+            save_log(log, self.path("log.npz"))
+            loaded = load_log(self.path("log.npz"))
+            expected = list(log)
+            if not all(type(p.pid) is int for p in processes) and any(type(p.pid) is int for p in processes):
+                # Campuran int/str disimpan sebagai string
+                expected = [dict(entry, process=None if entry['process'] is None else str(entry['process']),
+                                 queues={q: [str(pid) for pid in pids] for q, pids in entry['queues'].items()},
+                                 io_queue=[str(pid) for pid in entry['io_queue']]) for entry in expected]
+            self.assertEqual(list(loaded), expected)
+            self.assertEqual(list(loaded.entries(20, 60)), [e for e in expected if 20 <= e['time'] <= 60])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# tests/test_fcfs.py
+import importlib.util
+import random
+import unittest
+
+from fcfs import fcfs_scheduler, fcfs_stream
+from helpers import copy_processes, random_workload
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def stream_times(processes):
+    """(start, end) per proses dalam urutan input menurut fcfs_stream"""
+    processes = copy_processes(processes)
+    for _ in fcfs_stream(processes):
+        pass
+    return [(p.start_time, p.completion_time) for p in processes]
+
+
+class FCFSStreamTest(unittest.TestCase):
+    def test_stream_does_not_sort_input(self):
+        processes = random_workload(random.Random(1), 30)
+        order = [p.pid for p in processes]
+        timeline = [payload for _, payload in fcfs_stream(processes)]
+        self.assertEqual([p.pid for p in processes], order)
+        self.assertEqual(timeline, fcfs_scheduler(copy_processes(processes)))
+
+
+@unittest.skipUnless(HAS_NUMPY, "fcfs_vectorized membutuhkan NumPy")
+class FCFSVectorizedTest(unittest.TestCase):
+    def test_vectorized_matches_stream(self):
+        from fcfs import fcfs_vectorized
+
+        rng = random.Random(6)
+        for _ in range(200):
+            processes = random_workload(rng, rng.randint(1, 40), arrival_spans=(5, 50, 500))
+            start, end = fcfs_vectorized([p.arrival_time for p in processes], [p.burst_time for p in processes])
+            self.assertEqual(list(zip(start.tolist(), end.tolist())), stream_times(processes))
+
+    def test_batched_rows_are_independent(self):
+        import numpy as np
+
+        from fcfs import fcfs_batched
+
+        rng = random.Random(9)
+        workloads = [random_workload(rng, 25) for _ in range(50)]
+        arrivals = np.array([[p.arrival_time for p in w] for w in workloads])
+        bursts = np.array([[p.burst_time for p in w] for w in workloads])
+        start, end = fcfs_batched(arrivals, bursts)
+        for i, processes in enumerate(workloads):
+            self.assertEqual(list(zip(start[i].tolist(), end[i].tolist())), stream_times(processes))
+        with self.assertRaises(ValueError):
+            fcfs_batched(arrivals, bursts[:, :-1])
+        with self.assertRaises(ValueError):
+            fcfs_batched(arrivals[0], bursts[0])
+
+    def test_ties_keep_input_order(self):
+        from fcfs import fcfs_vectorized
+
+        start, end = fcfs_vectorized([3, 0, 3, 0], [2, 1, 4, 5])
+        self.assertEqual(start.tolist(), [6, 0, 8, 1])
+        self.assertEqual(end.tolist(), [8, 1, 12, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# tests/test_gantt.py
+import importlib.util
+import unittest
+
+from gantt import TimelineIndex, render_gantt
+from mlfq import mlfq_scheduler
+from workload import generate_workload
+
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+
+class TimelineIndexTest(unittest.TestCase):
+    def test_merges_contiguous_segments_and_clips_window(self):
+        index = TimelineIndex([("A", 0, 2), ("B", 2, 3), ("A", 3, 5), ("A", 5, 7), ("B", 7, 7), ("B", 9, 12)])
+        self.assertEqual((index.start, index.end), (0, 12))
+        self.assertEqual(index.window("A", 0, 100), [(0, 2), (3, 7)])
+        self.assertEqual(index.window("A", 1, 4), [(1, 2), (3, 4)])
+        self.assertEqual(index.window("B", 3, 9), [])
+        self.assertEqual(index.window("B", 8, 10), [(9, 10)])
+        self.assertEqual(index.window("C", 0, 10), [])
+
+    def test_window_matches_filtering(self):
+        timeline, _ = mlfq_scheduler(generate_workload(200, io_probability=0.3, seed=11), [2, 4, 8], 10, 10**6)
+        index = TimelineIndex(timeline)
+        for t0, t1 in ((0, 50), (100, 400), (index.end - 30, index.end)):
+            for pid in index.pids:
+                busy = sum(min(e, t1) - max(s, t0) for p, s, e in timeline if p == pid and s < t1 and e > t0)
+                self.assertEqual(sum(e - s for s, e in index.window(pid, t0, t1)), busy)
+
+    def test_mixed_pid_types(self):
+        index = TimelineIndex([("P2", 0, 1), (10, 1, 2), ("P1", 2, 3), (2, 3, 4)])
+        self.assertEqual(index.pids, [2, 10, "P1", "P2"])
+
+
+@unittest.skipUnless(HAS_MATPLOTLIB, "render_gantt membutuhkan matplotlib")
+class RenderGanttTest(unittest.TestCase):
+    def axes(self, width=8, height=4):
+        from matplotlib.figure import Figure
+
+        return Figure(figsize=(width, height), dpi=50).subplots()
+
+    def test_one_bar_collection_per_pid(self):
+        timeline, _ = mlfq_scheduler(generate_workload(30, seed=4), [2, 4, 8], 10, 10**6)
+        gnt = render_gantt(self.axes(), timeline)
+        self.assertEqual(len(gnt.collections), len(TimelineIndex(timeline).pids))
+
+    def test_dense_trace_is_bounded_by_pixels(self):
+        # Ribuan slice 1 ms untuk tiga PID: bar digabung menjadi pita selebar piksel
+        timeline = [(("A", "B", 3)[i % 3], i, i + 1) for i in range(30000)]
+        gnt = render_gantt(self.axes(), timeline, pixel_width=200)
+        self.assertEqual(len(gnt.collections), 3)
+        self.assertTrue(all(len(c.get_paths()) <= 200 for c in gnt.collections))
+        self.assertEqual([label.get_text() for label in gnt.get_yticklabels()], ["3", "A", "B"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# tests/test_instrument.py
+import json
+import os
+import tempfile
+import unittest
+
+from helpers import copy_processes, run_state
+from instrument import PHASES, SchedulerProfile
+from mlfq import mlfq_scheduler, mlfq_stream
+from workload import generate_workload
+
+
+class SchedulerProfileTest(unittest.TestCase):
+    def setUp(self):
+        self.processes = generate_workload(150, io_probability=0.5, seed=18)
+
+    def test_profile_does_not_change_result(self):
+        for fast_forward in (False, True):
+            plain = copy_processes(self.processes)
+            expected = mlfq_scheduler(plain, [2, 4, 8], 10, 10**6, fast_forward=fast_forward)
+            profiled = copy_processes(self.processes)
+            profile = SchedulerProfile()
+            timeline, log = mlfq_scheduler(profiled, [2, 4, 8], 10, 10**6, fast_forward=fast_forward,
+                                           profile=profile)
+            self.assertEqual(timeline, expected[0])
+            self.assertEqual(list(log), list(expected[1]))
+            self.assertEqual(run_state(profiled), run_state(plain))
+
+            # Setiap event log dicatat lewat fase 'log'; queue di-sample sekali per iterasi
+            self.assertEqual(profile.calls['log'], len(log))
+            self.assertEqual(profile.iterations, profile.calls['aging'])
+            self.assertEqual(profile.calls['arrival'], profile.iterations)
+            self.assertGreater(profile.calls['dispatch'], 0)
+            longest = {name: max(len(entry['queues'][name]) for entry in log) for name in ('L1', 'L2', 'L3')}
+            for name, size in longest.items():
+                self.assertLessEqual(profile.high_water.get(name, 0), size)
+
+    def test_consumer_time_is_excluded(self):
+        now = [0.0]
+        profile = SchedulerProfile(clock=lambda: now[0])
+        for _ in profile.wrap(mlfq_stream(copy_processes(self.processes), [2, 4, 8], 10, 10**6)):
+            now[0] += 100.0
+        self.assertEqual(profile.total_wall, 0.0)
+        self.assertEqual(set(profile.wall.values()), {0.0})
+        stream = mlfq_stream(copy_processes(self.processes), [2, 4, 8], 10, 10**6, profile=profile)
+        for _ in stream:
+            now[0] += 100.0
+        self.assertEqual(profile.total_wall, 0.0)
+        self.assertEqual(set(profile.wall.values()), {0.0})
+        self.assertGreater(profile.calls['dispatch'], 0)
+
+    def test_stats_and_allocations(self):
+        profile = SchedulerProfile(trace_allocations=True, top_allocations=3)
+        mlfq_scheduler(copy_processes(self.processes), [2, 4, 8], 10, 10**6, profile=profile)
+        stats = profile.stats()
+        self.assertEqual(list(stats['phases']), list(PHASES))
+        self.assertTrue(all('alloc_bytes' in entry for entry in stats['phases'].values()))
+        self.assertLessEqual(len(stats['allocations']), 3)
+        self.assertTrue(all(site['file'].endswith(".py") for site in stats['allocations']))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            profile.dump(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f), json.loads(profile.to_json()))
+        self.assertIn(f"{profile.iterations} iterasi", profile.summary_lines()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
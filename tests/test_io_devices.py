@@ -0,0 +1,42 @@
+# tests/test_io_devices.py
+import unittest
+
+from engine import simulate
+from helpers import copy_processes
+from io_devices import Device, DeviceIO, PeriodicIORule
+from policies import MLFQPolicy
+from workload import generate_workload
+
+
+def readme_io():
+    # Contoh README: seek_time pecahan membuat waktu selesai I/O bernilai float
+    return DeviceIO([Device("disk", servers=1, discipline="elevator", seek_time=0.01),
+                     Device("net", servers=4)],
+                    rule=PeriodicIORule(4))
+
+
+class DeviceIOTableTest(unittest.TestCase):
+    def test_fractional_seek_time_on_integer_table(self):
+        table = generate_workload(300, io_probability=0.8)
+        processes = copy_processes(table)
+
+        timeline, log = simulate(table, MLFQPolicy([2, 4, 8], 10), io=readme_io())
+        expected_timeline, expected_log = simulate(processes, MLFQPolicy([2, 4, 8], 10), io=readme_io())
+
+        self.assertEqual(timeline, expected_timeline)
+        self.assertEqual(list(log), list(expected_log))
+        self.assertEqual(table.time_code, 'd')
+        for view, p in zip(table, processes):
+            self.assertEqual((view.start_time, view.completion_time, view.wait_time, view.remaining_io),
+                             (p.start_time, p.completion_time, p.wait_time, p.remaining_io))
+        self.assertTrue(all(p.completion_time is not None for p in table))
+
+    def test_integer_io_keeps_integer_columns(self):
+        table = generate_workload(100, io_probability=0.8)
+        simulate(table, MLFQPolicy([2, 4, 8], 10), io=DeviceIO([Device("disk")], rule=PeriodicIORule(4)))
+        self.assertEqual(table.time_code, 'q')
+        self.assertEqual(table.completion_time.typecode, 'q')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+# tests/test_mlfq.py
+import random
+import unittest
+
+from engine import simulate
+from export import coalesce_timeline
+from helpers import random_workload, reset, run_state
+from mlfq import MLFQState, dump_snapshot, load_snapshot, mlfq_fork, mlfq_scheduler
+from policies import MLFQPolicy
+from process import Process, ProcessTable
+
+# Event yang boleh berbeda antara fast-forward dan run per slice
+FAST_FORWARD_ACTIONS = ('RR Fast-Forward L1', 'Quantum Exceeded, Requeue L1')
+
+
+def comparable_log(log):
+    return [entry for entry in log if entry['action'] not in FAST_FORWARD_ACTIONS]
+
+
+class FastForwardTest(unittest.TestCase):
+    def test_matches_per_slice_run(self):
+        rng = random.Random(17)
+        for _ in range(300):
+            processes = random_workload(rng, rng.randint(1, 10))
+            tq = [rng.choice([1, 2, 4]), rng.choice([2, 4]), rng.choice([4, 8])]
+            aging = rng.choice([3, 10, 50, 1000])
+            max_time = rng.choice([50, 300, 10000])
+
+            timeline, log = mlfq_scheduler(processes, tq, aging, max_time)
+            expected = run_state(processes)
+            reset(processes)
+            fast_timeline, fast_log = mlfq_scheduler(processes, tq, aging, max_time, fast_forward=True)
+            self.assertEqual(run_state(processes), expected)
+            self.assertEqual(coalesce_timeline(fast_timeline), coalesce_timeline(timeline))
+            self.assertEqual(comparable_log(fast_log), comparable_log(log))
+
+            table = ProcessTable.from_processes(processes)
+            table_timeline, _ = mlfq_scheduler(table, tq, aging, max_time, fast_forward=True)
+            self.assertEqual(table_timeline, fast_timeline)
+            self.assertEqual(run_state(table), expected)
+
+    def test_resume_keeps_state_and_coalesced_timeline(self):
+        # Sebagian seed di rentang ini membelah segmen solo di titik potong (timeline mentah berbeda)
+        for seed in range(200, 400):
+            rng = random.Random(seed)
+            processes = random_workload(rng, rng.randint(1, 10))
+            tq = [rng.choice([1, 2, 4]), 4, 8]
+            aging = rng.choice([10, 50, 1000])
+            max_time = rng.choice([100, 400, 3000])
+            cut = rng.randint(1, max_time)
+
+            timeline, log = mlfq_scheduler(processes, tq, aging, max_time)
+            expected = run_state(processes)
+            reset(processes)
+            state = MLFQState(processes, len(tq))
+            first, first_log = mlfq_scheduler(None, tq, aging, cut, state=state, fast_forward=True)
+            second, second_log = mlfq_scheduler(None, tq, aging, max_time, state=state, fast_forward=True)
+
+            self.assertEqual(run_state(processes), expected, seed)
+            self.assertEqual(coalesce_timeline(first + second), coalesce_timeline(timeline), seed)
+            self.assertEqual(comparable_log(list(first_log) + list(second_log)), comparable_log(log), seed)
+
+
+class SnapshotTest(unittest.TestCase):
+    def run_in_two_parts(self, processes, tq, aging, cut, max_time, **options):
+        state = MLFQState(processes, len(tq))
+        first, first_log = mlfq_scheduler(None, tq, aging, cut, state=state, **options)
+        # Lanjutkan dari snapshot yang diserialisasi, dengan proses baru
+        resumed = MLFQState.restore(load_snapshot(dump_snapshot(state.snapshot())))
+        second, second_log = mlfq_scheduler(None, tq, aging, max_time, state=resumed, **options)
+        return first + second, list(first_log) + list(second_log), resumed
+
+    def test_resume_from_snapshot_matches_single_run(self):
+        rng = random.Random(13)
+        for _ in range(200):
+            processes = random_workload(rng, rng.randint(1, 12), io_bursts=(0, 2, 4))
+            tq = [rng.choice([1, 2, 4]), 4, 8]
+            aging = rng.choice([5, 20, None])
+            max_time = rng.choice([100, 600])
+            options = rng.choice(({}, {'boost_interval': 15}, {'boost_step': None}))
+            timeline, log = mlfq_scheduler(processes, tq, aging, max_time, **options)
+            expected = sorted(zip((p.pid for p in processes), run_state(processes)))
+
+            reset(processes)
+            parts, parts_log, resumed = self.run_in_two_parts(processes, tq, aging, rng.randint(1, max_time),
+                                                              max_time, **options)
+            self.assertEqual(parts, timeline)
+            self.assertEqual(parts_log, list(log))
+            self.assertEqual(sorted(zip((p.pid for p in resumed.processes), run_state(resumed.processes))),
+                             expected)
+
+    def test_restore_into_existing_processes(self):
+        processes = random_workload(random.Random(2), 15)
+        state = MLFQState(processes, 3)
+        mlfq_scheduler(None, [2, 4, 8], 10, 60, state=state)
+        snapshot = state.snapshot()
+        fresh = [Process(p.pid, p.arrival_time, p.burst_time, p.io_burst, p.original_priority) for p in processes]
+        restored = MLFQState.restore(snapshot, fresh)
+        self.assertEqual(run_state(fresh), run_state(processes))
+        self.assertEqual(restored.snapshot(), snapshot)
+        self.assertTrue(all(p in fresh for q in restored.queues for p in q))
+
+    def test_fork_leaves_state_untouched(self):
+        processes = random_workload(random.Random(4), 20)
+        state = MLFQState(processes, 3)
+        mlfq_scheduler(None, [2, 4, 8], 10, 80, state=state)
+        snapshot = state.snapshot()
+        grid = [[2, 4, 8], [1, 2, 3], [8, 8, 8]]
+        for tq, timeline, log, branch in mlfq_fork(state, grid, 10, 10**6):
+            expected, expected_log = mlfq_scheduler(None, tq, 10, 10**6, state=MLFQState.restore(snapshot))
+            self.assertEqual(timeline, expected)
+            self.assertEqual(list(log), list(expected_log))
+            self.assertTrue(branch.finished)
+        self.assertEqual(state.snapshot(), snapshot)
+        self.assertIsNot(state.fork().processes[0], state.processes[0])
+
+    def test_rejects_unknown_version(self):
+        snapshot = MLFQState(random_workload(random.Random(1), 3), 3).snapshot()
+        snapshot['version'] += 1
+        with self.assertRaises(ValueError):
+            MLFQState.restore(snapshot)
+
+
+class WaitAccountingTest(unittest.TestCase):
+    def test_lazy_wait_time_without_io(self):
+        # Tanpa I/O, proses yang sudah masuk antrian selalu sedang jalan atau menunggu di ready queue
+        rng = random.Random(1)
+        for _ in range(200):
+            processes = random_workload(rng, rng.randint(1, 15), io_bursts=(0,))
+            tq = [rng.choice([1, 2, 4]), rng.choice([2, 4]), rng.choice([4, 8])]
+            aging = rng.choice([3, 10, 50])
+            state = MLFQState(processes)
+            _, log = mlfq_scheduler(None, tq, aging, rng.choice([50, 300, 10000]), state=state,
+                                    fast_forward=rng.random() < 0.5)
+            # Proses yang datang di tengah slice baru masuk antrian saat slice itu selesai
+            admitted = {entry['process']: entry['time'] for entry in log if entry['action'] == "Arrival"}
+            for p in state.processes[:state.process_idx]:
+                end = state.time if p.completion_time is None else p.completion_time
+                self.assertEqual(p.wait_time, end - admitted[p.pid] - p.service_time, p.pid)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class BoostTest(unittest.TestCase):
+    def workload(self):
+        # Proses Level 1 menunggu selama proses Level 2/3 berjalan, jadi aging terpicu
+        return [Process("A", 0, 40, 0, 1), Process("B", 0, 40, 0, 1), Process("C", 0, 30, 0, 3),
+                Process("D", 0, 30, 0, 3), Process("E", 0, 30, 0, 2)]
+
+    def test_boost_step_and_interval_change_schedule(self):
+        base, base_log = mlfq_scheduler(self.workload(), [2, 4, 8], 20, 1000)
+        stepped, stepped_log = mlfq_scheduler(self.workload(), [2, 4, 8], 20, 1000, boost_step=2)
+        boosted, boosted_log = mlfq_scheduler(self.workload(), [2, 4, 8], None, 1000, boost_interval=30)
+        unboosted, _ = mlfq_scheduler(self.workload(), [2, 4, 8], None, 1000)
+
+        promotions = [(e['from_q'], e['to_q']) for e in base_log if e['action'] == "Aging Promotion"]
+        self.assertIn(("L1", "L2"), promotions)
+        self.assertNotIn(("L1", "L3"), promotions)
+        self.assertIn(("L1", "L3"), [(e['from_q'], e['to_q']) for e in stepped_log if e['action'] == "Aging Promotion"])
+        self.assertNotEqual(stepped, base)
+
+        boosts = [e for e in boosted_log if e['action'] == "Priority Boost"]
+        self.assertTrue(boosts)
+        self.assertTrue(all(e['time'] >= 30 and e['to_q'] == "L3" for e in boosts))
+        self.assertNotEqual(boosted, unboosted)
+
+    def test_matches_mlfq_policy(self):
+        rng = random.Random(21)
+        for _ in range(200):
+            levels = rng.choice([2, 3, 5])
+            processes = random_workload(rng, rng.randint(1, 12), levels=levels)
+            tq = [rng.choice([1, 2, 4, 8]) for _ in range(levels)]
+            aging = rng.choice([3, 10, 50, None])
+            boost_step = rng.choice([1, 2, None])
+            boost_interval = rng.choice([None, 7, 25, 100])
+            max_time = rng.choice([50, 300, 10000])
+
+            timeline, log = mlfq_scheduler(processes, tq, aging, max_time, boost_step=boost_step,
+                                           boost_interval=boost_interval)
+            expected = run_state(processes)
+            reset(processes)
+            policy_timeline, policy_log = simulate(processes, MLFQPolicy(tq, aging, boost_step, boost_interval),
+                                                   max_time)
+            self.assertEqual(policy_timeline, timeline)
+            self.assertEqual(list(policy_log), list(log))
+            self.assertEqual(run_state(processes), expected)
+
+            reset(processes)
+            fast_timeline, _ = mlfq_scheduler(processes, tq, aging, max_time, fast_forward=True,
+                                              boost_step=boost_step, boost_interval=boost_interval)
+            self.assertEqual(coalesce_timeline(fast_timeline), coalesce_timeline(timeline))
+            self.assertEqual(run_state(processes), expected)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            mlfq_scheduler(self.workload(), [2, 4, 8], 10, 100, boost_step=0)
+        with self.assertRaises(ValueError):
+            mlfq_scheduler(self.workload(), [2, 4, 8], 10, 100, boost_interval=0)
@@ -0,0 +1,83 @@
+# tests/test_process.py
+import random
+import unittest
+
+from fcfs import fcfs_scheduler
+from helpers import RUN_FIELDS, copy_processes, random_workload, run_state
+from main import calculate_metrics
+from mlfq import mlfq_scheduler
+from process import Process, ProcessTable, ProcessView
+from rr import rr_scheduler
+
+
+def static_rows(processes):
+    return [(p.pid, p.arrival_time, p.burst_time, p.io_burst, p.original_priority) for p in processes]
+
+
+class ProcessTableTest(unittest.TestCase):
+    def setUp(self):
+        self.processes = random_workload(random.Random(5), 60, io_bursts=(0, 2, 5))
+
+    def test_views_behave_like_processes(self):
+        table = ProcessTable.from_processes(self.processes)
+        self.assertEqual(static_rows(table), static_rows(self.processes))
+        self.assertEqual(run_state(table), run_state(self.processes))
+        view = table[-1]
+        self.assertEqual(view, ProcessView(table, len(table) - 1))
+        self.assertEqual(len({view, table[len(table) - 1], table[0]}), 2)
+        view.start_time = 7
+        view.in_io = True
+        self.assertEqual((view.start_time, view.in_io), (7, True))
+        view.start_time = None
+        self.assertIsNone(view.start_time)
+        with self.assertRaises(IndexError):
+            table[len(table)]
+
+    def test_schedulers_match_process_lists(self):
+        for run in (lambda ps: fcfs_scheduler(ps), lambda ps: rr_scheduler(ps, 3),
+                    lambda ps: mlfq_scheduler(ps, [2, 4, 8], 10, 10**6)[0]):
+            processes = copy_processes(self.processes)
+            table = ProcessTable.from_processes(self.processes)
+            self.assertEqual(run(table), run(processes))
+            self.assertEqual(run_state(table), run_state(processes))
+            self.assertEqual(calculate_metrics(table), calculate_metrics(processes))
+
+    def test_reset_and_clone(self):
+        table = ProcessTable.from_processes(self.processes)
+        fresh = run_state(table)
+        clone = table.clone()
+        mlfq_scheduler(table, [2, 4, 8], 10, 10**6)
+        self.assertNotEqual(run_state(table), fresh)
+        self.assertEqual(run_state(clone), fresh)
+        table[3].reset()
+        self.assertEqual(run_state([table[3]]), [fresh[3]])
+        table.reset()
+        self.assertEqual(run_state(table), fresh)
+
+    def test_sort_is_stable_and_moves_run_state(self):
+        table = ProcessTable.from_processes(self.processes)
+        rr_scheduler(table, 3)
+        expected = sorted(zip(static_rows(table), run_state(table)), key=lambda row: row[0][4])
+        table.sorted_by_arrival = True
+        table.sort(key=lambda p: p.original_priority)
+        self.assertFalse(table.sorted_by_arrival)
+        self.assertEqual(list(zip(static_rows(table), run_state(table))), expected)
+
+    def test_fractional_times_widen_run_columns(self):
+        table = ProcessTable.from_processes([Process("A", 0, 4, 0, 1), Process("B", 1, 2, 0, 1)])
+        self.assertEqual(table.time_code, 'q')
+        table[0].wait_time = 1.5
+        self.assertEqual(table.time_code, 'd')
+        self.assertEqual(table[0].wait_time, 1.5)
+        self.assertEqual(table.burst_time.typecode, 'q')
+        with self.assertRaises(TypeError):
+            table[0].io_count = 0.5
+
+    def test_columns_must_have_same_length(self):
+        with self.assertRaises(ValueError):
+            ProcessTable(["A", "B"], [0, 1], [3], [0, 0], [1, 1])
+        self.assertEqual(len(RUN_FIELDS), len(ProcessTable.RUN_COLUMNS))
+
+
+if __name__ == "__main__":
+    unittest.main()
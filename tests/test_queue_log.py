@@ -0,0 +1,98 @@
+# tests/test_queue_log.py
+import random
+import unittest
+
+from helpers import reset
+from mlfq import mlfq_scheduler
+from queue_log import QueueLog
+from workload import generate_workload
+
+
+def random_log(rng, events, num_levels=3, checkpoint_interval=4):
+    """QueueLog acak + daftar snapshot penuh (format log lama) sebagai pembanding"""
+    log = QueueLog(num_levels, checkpoint_interval)
+    live = [[] for _ in range(num_levels + 1)]
+    expected = []
+    time = 0
+    counter = 0
+    for _ in range(events):
+        for _ in range(rng.randint(0, 4)):
+            level = rng.randint(0, num_levels)
+            if live[level] and rng.random() < 0.4:
+                pid = rng.choice(live[level])
+                live[level].remove(pid)
+                log.remove(level, pid)
+            else:
+                pid = f"P{counter}"
+                counter += 1
+                if rng.random() < 0.3:
+                    live[level].insert(0, pid)
+                    log.appendleft(level, pid)
+                else:
+                    live[level].append(pid)
+                    log.append(level, pid)
+        time += rng.choice((0, 1, 3))
+        action = rng.choice(("Arrival", "Execution", "Aging Promotion"))
+        process = f"P{rng.randint(0, counter)}"
+        log.record(time, action, process, "L1", "L2")
+        expected.append({
+            'time': time, 'action': action, 'process': process, 'from_q': "L1", 'to_q': "L2",
+            'queues': {f"L{i+1}": list(live[i]) for i in range(num_levels)},
+            'io_queue': list(live[num_levels]),
+        })
+    return log, expected
+
+
+class QueueLogTest(unittest.TestCase):
+    def test_replay_matches_full_snapshots(self):
+        rng = random.Random(3)
+        for interval in (1, 4, 256):
+            log, expected = random_log(rng, 300, checkpoint_interval=interval)
+            self.assertEqual(len(log), len(expected))
+            self.assertEqual(list(log), expected)
+            for index in (0, 1, 57, 150, len(expected) - 1, -1):
+                self.assertEqual(log[index], expected[index])
+            self.assertEqual(log[40:90], expected[40:90])
+            self.assertEqual(log[10:200:7], expected[10:200:7])
+            with self.assertRaises(IndexError):
+                log[len(expected)]
+
+    def test_state_at_and_entries(self):
+        log, expected = random_log(random.Random(8), 200)
+        self.assertEqual(log.state_at(-1), {'time': -1, 'queues': {'L1': [], 'L2': [], 'L3': []}, 'io_queue': []})
+        for time in range(0, expected[-1]['time'] + 2):
+            last = [e for e in expected if e['time'] <= time][-1]
+            self.assertEqual(log.state_at(time),
+                             {'time': time, 'queues': last['queues'], 'io_queue': last['io_queue']})
+        self.assertEqual(list(log.entries(20, 60)), [e for e in expected if 20 <= e['time'] <= 60])
+        self.assertEqual(list(log.entries(10**6)), [])
+
+    def test_checkpoints_are_sparse(self):
+        log, _ = random_log(random.Random(5), 1000, checkpoint_interval=64)
+        self.assertLessEqual(len(log._checkpoints), 1000 // 64 + 1)
+        self.assertEqual(log._checkpoint_index[0], 0)
+
+    def test_columns_round_trip(self):
+        log, expected = random_log(random.Random(11), 150)
+        self.assertEqual(list(QueueLog.from_columns(3, log.to_columns(), checkpoint_interval=16)), expected)
+
+    def test_copy_is_independent(self):
+        log, expected = random_log(random.Random(2), 50)
+        copy = log.copy()
+        copy.append(0, "X")
+        copy.record(10**6, "Arrival", "X", None, "L1")
+        self.assertEqual(list(log), expected)
+        self.assertEqual(len(copy), len(expected) + 1)
+        self.assertEqual(copy[-1]['queues']['L1'][-1], "X")
+
+    def test_checkpoint_interval_does_not_change_mlfq_log(self):
+        processes = generate_workload(100, io_probability=0.5, seed=9)
+        _, dense = mlfq_scheduler(processes, [2, 4, 8], 10, 10**6, checkpoint_interval=1)
+        reset(processes)
+        _, sparse = mlfq_scheduler(processes, [2, 4, 8], 10, 10**6, checkpoint_interval=1000)
+        self.assertEqual(list(dense), list(sparse))
+        self.assertEqual(dense.action_counts(), sparse.action_counts())
+
+
+if __name__ == "__main__":
+    unittest.main()
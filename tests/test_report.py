@@ -0,0 +1,74 @@
+# tests/test_report.py
+import importlib.util
+import os
+import tempfile
+import unittest
+
+import main
+from mlfq import mlfq_scheduler
+from workload import generate_workload
+
+HAS_PDF = all(importlib.util.find_spec(name) is not None for name in ("fpdf", "matplotlib"))
+
+
+def large_log():
+    table = generate_workload(300, io_probability=0.5, seed=12)
+    return (table,) + mlfq_scheduler(table, [2, 4, 8], 10, 10**6)
+
+
+class LogLinesTest(unittest.TestCase):
+    def setUp(self):
+        _, _, self.log = large_log()
+        self.entries = list(self.log)
+
+    def test_full_window_writes_every_event_in_range(self):
+        lines = list(main._log_lines(self.log, 'full', start=100, end=200))
+        window = [e for e in self.entries if 100 <= e['time'] <= 200]
+        self.assertTrue(window)
+        self.assertEqual(lines, [line for e in window for line in main._format_log_entry(e)])
+
+    def test_summary_counts_and_head_tail(self):
+        limit = 5
+        lines = list(main._log_lines(self.log, 'summary', limit=limit))
+        self.assertEqual(lines[0], f"Total event: {len(self.entries)}")
+        counts = {}
+        for e in self.entries:
+            counts[e['action']] = counts.get(e['action'], 0) + 1
+        for action, count in counts.items():
+            self.assertIn(f"  {action}: {count}", lines)
+        head = [line for e in self.entries[:limit] for line in main._format_log_entry(e)]
+        tail = [line for e in self.entries[-limit:] for line in main._format_log_entry(e)]
+        self.assertEqual(lines[-len(tail):], tail)
+        start = lines.index(f"{limit} event pertama:") + 1
+        self.assertEqual(lines[start:start + len(head)], head)
+        # Ukuran ringkasan tidak bergantung pada panjang log
+        self.assertLess(len(lines), 4 * limit + len(counts) + 10)
+
+    def test_auto_picks_full_for_small_logs(self):
+        _, log = mlfq_scheduler(generate_workload(3, seed=1), [2, 4, 8], 10, 10**6)
+        self.assertEqual(list(main._log_lines(log, 'auto', limit=50)), list(main._log_lines(log, 'full')))
+        self.assertEqual(list(main._log_lines(self.log, 'auto', limit=5)), list(main._log_lines(self.log, 'summary', limit=5)))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            list(main._log_lines(self.log, 'pages'))
+
+
+@unittest.skipUnless(HAS_PDF, "laporan PDF membutuhkan fpdf dan matplotlib")
+class PdfReportTest(unittest.TestCase):
+    def test_report_without_files_in_working_directory(self):
+        table, timeline, log = large_log()
+        with tempfile.TemporaryDirectory() as directory:
+            cwd = os.getcwd()
+            os.chdir(directory)
+            try:
+                main.generate_pdf_report(timeline, log, table, output_path="hasil.pdf", table_limit=20)
+                self.assertEqual(os.listdir(directory), ["hasil.pdf"])
+            finally:
+                os.chdir(cwd)
+            with open(os.path.join(directory, "hasil.pdf"), "rb") as f:
+                self.assertEqual(f.read(5), b"%PDF-")
+
+
+if __name__ == "__main__":
+    unittest.main()
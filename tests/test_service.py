@@ -0,0 +1,119 @@
+# tests/test_service.py
+import base64
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from helpers import copy_processes
+from mlfq import mlfq_scheduler
+from rr import rr_scheduler
+from service import SimulationClient, SimulationService, _run_batch, make_server, simulate_request
+from workload import generate_workload
+
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+
+def records(processes):
+    return [{'pid': p.pid, 'arrival_time': p.arrival_time, 'burst_time': p.burst_time, 'io_burst': p.io_burst,
+             'priority': p.original_priority} for p in processes]
+
+
+class SimulateRequestTest(unittest.TestCase):
+    def setUp(self):
+        self.processes = generate_workload(30, seed=24)
+
+    def test_matches_schedulers(self):
+        expected = copy_processes(self.processes)
+        timeline, _ = mlfq_scheduler(expected, [2, 4, 8], 10, 500)
+        result = simulate_request({'scheduler': 'mlfq', 'processes': records(self.processes), 'tq': [2, 4, 8],
+                                   'aging': 10, 'max_time': 500})
+        self.assertEqual(result['timeline'], [list(segment) for segment in timeline])
+        by_pid = {row['pid']: row for row in result['processes']}
+        for p in expected:
+            self.assertEqual((by_pid[p.pid]['start_time'], by_pid[p.pid]['completion_time'],
+                              by_pid[p.pid]['remaining_time']), (p.start_time, p.completion_time, p.remaining_time))
+        self.assertEqual(result['metrics']['completed'], sum(p.completion_time is not None for p in expected))
+
+        rr = simulate_request({'scheduler': 'rr', 'processes': records(self.processes), 'rr_quantum': 3})
+        expected_rr = rr_scheduler(copy_processes(self.processes), 3)
+        self.assertEqual(rr['timeline'], [list(segment) for segment in expected_rr])
+
+    def test_invalid_requests(self):
+        valid = {'scheduler': 'mlfq', 'processes': records(list(self.processes)[:3])}
+        for change in ({'scheduler': 'lottery'}, {'processes': []}, {'processes': [{'pid': "P1"}]},
+                       {'processes': [dict(valid['processes'][0], burst_time=0)]}, {'tq': []}, {'tq': [2, 0, 8]},
+                       {'aging': 0}, {'aging': [5, True]}, {'max_time': -1}, {'rr_quantum': 1.5}):
+            with self.assertRaises(ValueError, msg=change):
+                simulate_request(dict(valid, **change))
+        with self.assertRaises(ValueError):
+            simulate_request([valid])
+        statuses = [status for status, _ in _run_batch([valid, dict(valid, tq=[]), dict(valid, scheduler='x')])]
+        self.assertEqual(statuses, [200, 400, 400])
+
+    @unittest.skipUnless(HAS_MATPLOTLIB, "Gantt membutuhkan matplotlib")
+    def test_gantt_png(self):
+        result = simulate_request({'processes': records(list(self.processes)[:5]), 'gantt': True})
+        self.assertTrue(base64.b64decode(result['gantt_png']).startswith(b"\x89PNG"))
+
+
+@unittest.skipUnless(HAS_MATPLOTLIB, "Pemanasan worker membutuhkan matplotlib")
+class ServiceHTTPTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = SimulationService(workers=1, max_batch=4, cache_entries=8)
+        cls.service.warm_up()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.close()
+
+    def serve(self, **options):
+        server = make_server(self.service, port=0, **options)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def exchange(self, client):
+        processes = generate_workload(20, seed=3)
+        request = {'processes': records(processes), 'max_time': 300}
+        status, body = client.simulate(request)
+        self.assertEqual(status, 200)
+        # Kunci dict non-string (mis. metrik per prioritas) menjadi string di JSON
+        self.assertEqual(body, json.loads(json.dumps(simulate_request(request))))
+        status, bodies = client.simulate([request, dict(request, scheduler='fcfs'), dict(request, tq="2")])
+        self.assertEqual(status, 200)
+        self.assertEqual(bodies[0], body)
+        self.assertEqual(bodies[1]['scheduler'], 'fcfs')
+        self.assertIn('error', bodies[2])
+        self.assertEqual(client.simulate(dict(request, aging=-1))[0], 400)
+        self.assertEqual(client._request("GET", "/health"), (200, {'status': 'ok', 'workers': 1}))
+        self.assertEqual(client._request("GET", "/tidak-ada")[0], 404)
+
+    def test_tcp(self):
+        server = self.serve()
+        client = SimulationClient(port=server.server_address[1])
+        self.addCleanup(client.close)
+        before = client.stats()['requests']
+        self.exchange(client)
+        stats = client.stats()
+        self.assertEqual(stats['requests'] - before, 5)
+        self.assertEqual(set(stats['latency_ms']), {'p50', 'p95', 'p99', 'max'})
+
+    def test_unix_socket(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "sim.sock")
+        self.serve(unix_socket=path)
+        client = SimulationClient(unix_socket=path)
+        self.addCleanup(client.close)
+        self.exchange(client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# tests/test_smp.py
+import random
+import unittest
+
+from engine import simulate
+from helpers import copy_processes, random_workload
+from policies import FCFSPolicy, PriorityPolicy, RoundRobinPolicy, SJFPolicy, SRTFPolicy
+from smp import merge_timelines, smp_mlfq_scheduler, smp_rr_scheduler, smp_simulate, socket_migration_cost
+
+FACTORIES = (FCFSPolicy, lambda: RoundRobinPolicy(3), SJFPolicy, SRTFPolicy, lambda: PriorityPolicy(preemptive=True))
+
+
+class SMPTest(unittest.TestCase):
+    def assert_valid_schedule(self, processes, timelines):
+        by_pid = {p.pid: p for p in processes}
+        for timeline in timelines:
+            self.assertTrue(all(a[2] <= b[1] for a, b in zip(timeline, timeline[1:])))
+        merged = merge_timelines(timelines)
+        busy = {}
+        last_end = {}
+        for pid, start, end in merged:
+            self.assertGreaterEqual(start, by_pid[pid].arrival_time)
+            # Satu proses tidak pernah berjalan di dua core sekaligus
+            self.assertGreaterEqual(start, last_end.get(pid, start))
+            last_end[pid] = end
+            busy[pid] = busy.get(pid, 0) + end - start
+        for p in processes:
+            self.assertEqual(busy.get(p.pid, 0), p.burst_time, p.pid)
+            self.assertEqual(p.completion_time, last_end[p.pid])
+
+    def test_single_core_matches_engine(self):
+        rng = random.Random(22)
+        for _ in range(100):
+            processes = random_workload(rng, rng.randint(1, 15), io_bursts=(0, 2))
+            for factory in FACTORIES:
+                expected, _ = simulate(copy_processes(processes), factory())
+                timelines, stats = smp_simulate(copy_processes(processes), factory, 1)
+                self.assertEqual(timelines[0], expected)
+                self.assertEqual(stats[0]['busy_time'], sum(end - start for _, start, end in expected))
+
+    def test_multi_core_invariants(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            processes = random_workload(rng, rng.randint(1, 40), io_bursts=(0, 2, 5))
+            cores = rng.choice([2, 3, 8])
+            for factory in FACTORIES:
+                run = copy_processes(processes)
+                timelines, stats = smp_simulate(run, factory, cores)
+                self.assert_valid_schedule(run, timelines)
+                self.assertEqual(sum(s['busy_time'] for s in stats), sum(p.burst_time for p in processes))
+            run = copy_processes(processes)
+            self.assert_valid_schedule(run, smp_mlfq_scheduler(run, [2, 4, 8], 10, None, cores)[0])
+
+    def test_migration_cost_and_determinism(self):
+        processes = random_workload(random.Random(3), 60, io_bursts=(2, 5))
+        cost = socket_migration_cost(2, 1, 3)
+        self.assertEqual((cost(0, 1), cost(1, 2), cost(3, 2)), (1, 3, 1))
+        first = smp_rr_scheduler(copy_processes(processes), 2, 4, migration_cost=cost, seed=5)
+        second = smp_rr_scheduler(copy_processes(processes), 2, 4, migration_cost=cost, seed=5)
+        self.assertEqual(first, second)
+        timelines, stats = smp_rr_scheduler(copy_processes(processes), 2, 4, migration_cost=2)
+        for core_stats in stats:
+            self.assertEqual(core_stats['migration_time'], 2 * core_stats['migrations'])
+            self.assertLessEqual(core_stats['utilization'], 1.0)
+
+    def test_rejects_zero_cores(self):
+        with self.assertRaises(ValueError):
+            smp_simulate(random_workload(random.Random(1), 3), FCFSPolicy, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# tests/test_stream.py
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from fcfs import fcfs_stream
+from helpers import copy_processes, random_workload
+from mlfq import mlfq_stream
+from process import Process
+from rr import rr_stream
+from stream import SEGMENT, SPAN, FileSink, MetricsSink, consume, expand_span
+
+
+class TrackingSink(MetricsSink):
+    """MetricsSink yang mencatat jumlah maksimum proses yang disimpan"""
+
+    peak = 0
+
+    def segment(self, pid, start, end):
+        super().segment(pid, start, end)
+        self.peak = max(self.peak, len(self._info))
+
+
+def expected_averages(processes):
+    done = [p for p in processes if p.completion_time is not None]
+    return {
+        'Average Turnaround Time': sum(p.completion_time - p.arrival_time for p in done) / len(done),
+        'Average Waiting Time': sum(p.completion_time - p.arrival_time - p.burst_time for p in done) / len(done),
+        'Average Response Time': sum(p.start_time - p.arrival_time for p in done) / len(done),
+    }
+
+
+class MetricsSinkTest(unittest.TestCase):
+    def test_matches_scheduler_state(self):
+        rng = random.Random(4)
+        for _ in range(100):
+            processes = random_workload(rng, rng.randint(1, 20))
+            for make_stream in (lambda ps: fcfs_stream(ps), lambda ps: rr_stream(ps, 3, fast_forward=True),
+                                lambda ps: mlfq_stream(ps, [2, 4, 8], 10, 10**6, fast_forward=True)):
+                run = copy_processes(processes)
+                sink, = consume(make_stream(run), MetricsSink(copy_processes(processes)))
+                self.assertEqual(sink.completed, len(run))
+                averages = sink.averages()
+                for name, value in expected_averages(run).items():
+                    self.assertAlmostEqual(averages[name], value)
+                self.assertEqual(sink._info, {})
+                self.assertEqual(sink._active, {})
+
+    def test_keeps_only_arrived_processes(self):
+        # Kedatangan berjauhan: setiap proses selesai sebelum proses berikutnya datang
+        processes = [Process(f"P{i}", i * 1000, 5, 0, 1) for i in range(1000)]
+        sink, = consume(fcfs_stream(copy_processes(processes)), TrackingSink(processes))
+        self.assertEqual(sink.completed, 1000)
+        self.assertLessEqual(sink.peak, 2)
+
+
+class FileSinkTest(unittest.TestCase):
+    def test_writes_one_json_line_per_item(self):
+        processes = random_workload(random.Random(7), 10, io_bursts=(0,))
+        items = list(rr_stream(copy_processes(processes), 2, fast_forward=True))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.jsonl")
+            consume(iter(items), FileSink(path))
+            with open(path, encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f]
+        self.assertEqual(len(rows), len(items))
+        segments = []
+        for row in rows:
+            if row['type'] == SEGMENT:
+                segments.append((row['pid'], row['start'], row['end']))
+            elif row['type'] == SPAN:
+                segments.extend(expand_span((row['pids'], row['start'], row['quantum'], row['rounds'])))
+        expected = []
+        for kind, payload in items:
+            expected.extend(expand_span(payload) if kind == SPAN else [payload])
+        self.assertEqual(segments, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
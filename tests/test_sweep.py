@@ -0,0 +1,54 @@
+# tests/test_sweep.py
+import unittest
+from unittest import mock
+
+import sweep
+from cache import ResultCache, cached_run
+from helpers import copy_processes
+from metrics import compute_metrics, process_columns
+from mlfq import mlfq_scheduler
+from process import Process
+from sweep import format_sweep, run_sweep, sweep_grid
+from workload import generate_workload
+
+QUANTUM_GRID = [[2, 4, 8], [1, 3, 6]]
+AGING_GRID = [5, None]
+MAX_TIME_GRID = [40, 10**6]
+
+
+def direct_rows(processes):
+    rows = []
+    for point in sweep_grid(QUANTUM_GRID, AGING_GRID, MAX_TIME_GRID):
+        time_quantums, aging_threshold, max_time = point
+        run = copy_processes(processes)
+        timeline, _ = mlfq_scheduler(run, list(time_quantums), aging_threshold, max_time)
+        end_time = timeline[-1][2] if timeline else None
+        rows.append(sweep._summary_row(point, compute_metrics(process_columns(run), end_time=end_time)))
+    return rows
+
+
+class SweepTest(unittest.TestCase):
+    def test_grid_order(self):
+        self.assertEqual(sweep_grid([[1, 2]], [5, 6], [10]), [((1, 2), 5, 10), ((1, 2), 6, 10)])
+
+    def test_matches_direct_runs(self):
+        for processes in (generate_workload(40, io_probability=0.5, seed=8),
+                          [Process(i * 3, i, 2 + i % 7, i % 2, 1 + i % 2) for i in range(25)],
+                          [Process("a\nb", 0, 5, 0, 1), Process("c", 1, 3, 1, 2)]):
+            rows = run_sweep(processes, QUANTUM_GRID, AGING_GRID, MAX_TIME_GRID, workers=2)
+            self.assertEqual(rows, direct_rows(processes))
+        self.assertEqual(len(format_sweep(rows).splitlines()), len(rows) + 1)
+
+    def test_cached_points_are_not_rerun(self):
+        processes = generate_workload(30, seed=2)
+        cache = ResultCache(directory=None)
+        for point in sweep_grid(QUANTUM_GRID, AGING_GRID, MAX_TIME_GRID):
+            time_quantums, aging_threshold, max_time = point
+            cached_run('mlfq', copy_processes(processes), list(time_quantums), aging_threshold, max_time, cache=cache)
+        with mock.patch.object(sweep, 'ProcessPoolExecutor', side_effect=AssertionError("pool tidak boleh dipakai")):
+            rows = run_sweep(processes, QUANTUM_GRID, AGING_GRID, MAX_TIME_GRID, cache=cache)
+        self.assertEqual(rows, direct_rows(processes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# tests/test_trace_file.py
+import os
+import struct
+import tempfile
+import unittest
+
+from helpers import copy_processes, run_state
+from mlfq import mlfq_scheduler
+from process import Process, ProcessTable
+from trace_file import HEADER, load_csv, load_jsonl, load_records, open_trace, write_trace
+from workload import generate_workload
+
+
+def static_rows(processes):
+    return [(p.pid, p.arrival_time, p.burst_time, p.io_burst, p.original_priority) for p in processes]
+
+
+class TraceRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._directory.name, "workload.trace")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def round_trip(self, processes):
+        write_trace(processes, self.path)
+        with open_trace(self.path) as trace:
+            return static_rows(trace), list(trace.pids)
+
+    def test_string_pids_sorted_by_arrival(self):
+        table = generate_workload(500, io_probability=0.3, seed=15)
+        rows, _ = self.round_trip(table)
+        self.assertEqual(rows, sorted(static_rows(table), key=lambda row: row[1]))
+
+    def test_int_pids_keep_their_type(self):
+        processes = [Process(i * 7 - 3, 10 - i, i + 1, i % 3, 1 + i % 3) for i in range(10)]
+        rows, pids = self.round_trip(processes)
+        self.assertEqual(rows, sorted(static_rows(processes), key=lambda row: row[1]))
+        self.assertTrue(all(type(pid) is int for pid in pids))
+
+    def test_mixed_pids_become_strings(self):
+        processes = [Process(1, 0, 3, 0, 1), Process("P2", 1, 4, 0, 2), Process("ü", 2, 5, 1, 3)]
+        _, pids = self.round_trip(processes)
+        self.assertEqual(pids, ["1", "P2", "ü"])
+
+    def test_fractional_times(self):
+        processes = [Process("A", 0.5, 2.25, 0, 1), Process("B", 0, 1, 0.5, 2)]
+        rows, _ = self.round_trip(processes)
+        self.assertEqual(rows, [("B", 0.0, 1.0, 0.5, 2), ("A", 0.5, 2.25, 0.0, 1)])
+
+    def test_old_header_reads_string_pids(self):
+        write_trace([Process(12, 0, 3, 0, 1), Process(34, 1, 3, 0, 1)], self.path)
+        # Trace lama: byte jenis PID masih padding nol
+        with open(self.path, "r+b") as f:
+            f.seek(struct.calcsize("<8scc"))
+            f.write(b"\0")
+        with open_trace(self.path) as trace:
+            self.assertEqual(list(trace.pids), ["12", "34"])
+
+    def test_scheduler_on_mapped_trace(self):
+        table = generate_workload(300, io_probability=0.5, seed=3)
+        write_trace(table, self.path)
+        processes = sorted(copy_processes(table), key=lambda p: p.arrival_time)
+        expected = mlfq_scheduler(processes, [2, 4, 8], 10, 10**6)
+        with open_trace(self.path) as trace:
+            self.assertEqual(mlfq_scheduler(trace, [2, 4, 8], 10, 10**6)[0], expected[0])
+            self.assertEqual(run_state(trace), run_state(processes))
+
+    def test_rejects_bad_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"x" * HEADER.size)
+        with self.assertRaises(ValueError):
+            open_trace(self.path)
+        write_trace(generate_workload(10, seed=1), self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER.size + 10)
+        with self.assertRaises(ValueError):
+            open_trace(self.path)
+
+
+class TextLoaderTest(unittest.TestCase):
+    def test_csv_jsonl_and_records_agree(self):
+        rows = [("P1", 0, 5, 2, 1), ("P2", 3, 4, 0, 3), ("P3", 1, 7, 1, 2)]
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "w.csv")
+            with open(csv_path, "w", encoding="utf-8") as f:
+                f.write("pid,arrival_time,burst_time,io_burst,priority\n")
+                f.writelines(",".join(map(str, row)) + "\n" for row in rows)
+            jsonl_path = os.path.join(directory, "w.jsonl")
+            with open(jsonl_path, "w", encoding="utf-8") as f:
+                for pid, arrival, burst, io_burst, priority in rows:
+                    f.write(f'{{"pid": "{pid}", "arrival_time": {arrival}, "burst_time": {burst}, '
+                            f'"io_burst": {io_burst}, "priority": {priority}}}\n\n')
+            records = [dict(zip(('pid', 'arrival_time', 'burst_time', 'io_burst', 'priority'), row)) for row in rows]
+            for table in (load_csv(csv_path), load_jsonl(jsonl_path), load_records(records)):
+                self.assertIsInstance(table, ProcessTable)
+                self.assertEqual(static_rows(table), rows)
+
+    def test_invalid_records(self):
+        with self.assertRaises(ValueError):
+            load_records([{"pid": "P1", "arrival_time": 0}])
+        with self.assertRaises(ValueError):
+            load_records([{"pid": "P1", "arrival_time": "nol", "burst_time": 3}])
+
+
+if __name__ == "__main__":
+    unittest.main()
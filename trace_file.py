@@ -0,0 +1,263 @@
+# trace_file.py
+"""Loader workload dari file: CSV, JSON Lines, dan trace biner fixed-width.
+
+Format biner (.trace) disimpan per kolom dan terurut menurut arrival_time:
+
+    header 32 byte : magic b"SCHDTRC1", byteorder (b"<"/b">"), typecode waktu
+                     (b"q"/b"d"), jenis PID (b"i" int, b"s" atau b"\\0"
+                     string), 1 byte padding, lebar PID (u32), jumlah
+                     proses (u64), 8 byte padding
+    arrival_time   : n x 8 byte
+    burst_time     : n x 8 byte
+    io_burst       : n x 8 byte
+    priority       : n x 2 byte (int16)
+    pid            : n x lebar PID byte (str(pid) UTF-8, diisi NUL)
+
+PID ditulis sebagai teks; jika semua PID bertipe int, jenis PID b"i"
+membuat pembaca mengembalikannya sebagai int lagi.
+
+open_trace() memetakan file dengan mmap; kolom statis adalah memoryview
+ke file (tanpa salinan) dan PID di-decode saat diakses, sehingga scheduler
+membaca kedatangan langsung dari file tanpa membuat objek per proses.
+
+Konversi dari CSV:  python trace_file.py workload.csv workload.trace
+"""
+import argparse
+import csv
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from process import ProcessTable, _typecode, column_typecode
+
+MAGIC = b"SCHDTRC1"
+HEADER = struct.Struct("<8scccxIQ8x")
+FIELDS = ('pid', 'arrival_time', 'burst_time', 'io_burst', 'priority')
+_BYTEORDER = b"<" if sys.byteorder == "little" else b">"
+# Jenis PID di header -> konversi dari teks (b"\0": trace lama, selalu string)
+PID_KINDS = {b"s": str, b"\0": str, b"i": int}
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _build_table(pids, arrival, burst, io_burst, priority):
+    time_code = _typecode(arrival + burst + io_burst)
+    return ProcessTable.from_arrays(pids, array(time_code, arrival), array(time_code, burst),
+                                    array(time_code, io_burst), array('h', priority))
+
+
+def load_csv(path):
+    """CSV dengan header pid,arrival_time,burst_time,io_burst,priority (io_burst/priority opsional)"""
+    pids, arrival, burst, io_burst, priority = [], [], [], [], []
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = {'pid', 'arrival_time', 'burst_time'} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path}: kolom CSV tidak ada: {', '.join(sorted(missing))}")
+        for row in reader:
+            pids.append(row['pid'])
+            arrival.append(_number(row['arrival_time']))
+            burst.append(_number(row['burst_time']))
+            io_burst.append(_number(row.get('io_burst') or 0))
+            priority.append(int(row.get('priority') or 1))
+    return _build_table(pids, arrival, burst, io_burst, priority)
+
+
+def load_jsonl(path):
+    """Satu objek JSON per baris dengan key yang sama seperti kolom CSV"""
+    pids, arrival, burst, io_burst, priority = [], [], [], [], []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                pids.append(str(row['pid']))
+                arrival.append(row['arrival_time'])
+                burst.append(row['burst_time'])
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"{path}:{line_no}: baris workload tidak valid ({e})") from None
+            io_burst.append(row.get('io_burst', 0))
+            priority.append(row.get('priority', 1))
+    return _build_table(pids, arrival, burst, io_burst, priority)
+
+
+def load_records(records, source="workload"):
+    """Workload dari list dict (misalnya body JSON) dengan key yang sama seperti kolom CSV"""
+    pids, arrival, burst, io_burst, priority = [], [], [], [], []
+    for index, row in enumerate(records):
+        try:
+            pids.append(str(row['pid']))
+            arrival.append(row['arrival_time'])
+            burst.append(row['burst_time'])
+            io_burst.append(row.get('io_burst', 0))
+            priority.append(row.get('priority', 1))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"{source}[{index}]: proses tidak valid ({e!r})") from None
+    try:
+        return _build_table(pids, arrival, burst, io_burst, priority)
+    except (TypeError, OverflowError) as e:
+        raise ValueError(f"{source}: nilai waktu/prioritas harus angka ({e})") from None
+
+
+def write_trace(processes, path):
+    """Tulis workload (ProcessTable atau list Process) ke format biner, terurut menurut kedatangan"""
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    n = len(table)
+    order = sorted(range(n), key=table.arrival_time.__getitem__)
+    pids = [table.pids[i] for i in order]
+    # bool juga int, tapi tidak dikembalikan sama oleh int(); simpan sebagai string
+    pid_kind = b"i" if pids and all(type(pid) is int for pid in pids) else b"s"
+    encoded = [str(pid).encode("utf-8") for pid in pids]
+    width = max((len(pid) for pid in encoded), default=0)
+    time_code = column_typecode(table.arrival_time)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, _BYTEORDER, time_code.encode("ascii"), pid_kind, width, n))
+        for name in ('arrival_time', 'burst_time', 'io_burst'):
+            column = getattr(table, name)
+            f.write(array(time_code, [column[i] for i in order]).tobytes())
+        f.write(array('h', [table.original_priority[i] for i in order]).tobytes())
+        f.write(b"".join(pid.ljust(width, b"\0") for pid in encoded))
+
+
+def csv_to_trace(csv_path, trace_path):
+    table = load_csv(csv_path)
+    write_trace(table, trace_path)
+    return len(table)
+
+
+class _PidColumn:
+    """Kolom PID fixed-width di atas mmap, di-decode per akses"""
+
+    def __init__(self, view, width, count, convert=str):
+        self._view = view
+        self._width = width
+        self._count = count
+        self._convert = convert
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("PID index out of range")
+        start = index * self._width
+        return self._convert(bytes(self._view[start:start + self._width]).rstrip(b"\0").decode("utf-8"))
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+
+class MappedTrace(ProcessTable):
+    """ProcessTable yang kolom statisnya dipetakan langsung dari file .trace.
+
+    Baris terurut menurut kedatangan (sorted_by_arrival), jadi scheduler
+    memakai tabel ini sebagai cursor kedatangan tanpa mengurutkan ulang.
+    Hanya kolom state run yang dialokasikan di memori.
+    """
+
+    sorted_by_arrival = True
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path}: file trace kosong") from None
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: bukan file trace (header terlalu pendek)")
+        magic, byteorder, time_code, pid_kind, width, n = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: bukan file trace (magic {magic!r})")
+        if pid_kind not in PID_KINDS:
+            self.close()
+            raise ValueError(f"{path}: jenis PID trace tidak dikenal ({pid_kind!r})")
+        if byteorder != _BYTEORDER:
+            self.close()
+            raise ValueError(f"{path}: byteorder trace berbeda dengan mesin ini")
+
+        if HEADER.size + n * (3 * 8 + 2 + width) > len(self._mmap):
+            self.close()
+            raise ValueError(f"{path}: file trace terpotong")
+
+        time_code = time_code.decode("ascii")
+        self._views = [memoryview(self._mmap)]
+        offset = HEADER.size
+        for name, typecode, size in (('arrival_time', time_code, 8), ('burst_time', time_code, 8),
+                                     ('io_burst', time_code, 8), ('original_priority', 'h', 2)):
+            column = self._view(offset, n * size).cast(typecode)
+            self._views.append(column)
+            setattr(self, name, column)
+            offset += n * size
+        self.pids = _PidColumn(self._view(offset, n * width), width, n, PID_KINDS[pid_kind])
+        self.time_code = time_code
+        self.reset()
+
+    def _view(self, offset, length):
+        view = self._views[0][offset:offset + length]
+        self._views.append(view)
+        return view
+
+    def close(self):
+        """Lepas memoryview lalu tutup mmap dan file"""
+        for name in self.STATIC_COLUMNS:
+            self.__dict__.pop(name, None)
+        for view in reversed(getattr(self, '_views', ())):
+            view.release()
+        self._views = []
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_trace(path):
+    return MappedTrace(path)
+
+
+def load_workload(path):
+    """Pilih loader menurut ekstensi: .csv, .jsonl/.ndjson, atau .trace (mmap)"""
+    lower = path.lower()
+    if lower.endswith(".csv"):
+        return load_csv(path)
+    if lower.endswith((".jsonl", ".ndjson")):
+        return load_jsonl(path)
+    if lower.endswith(".trace"):
+        return open_trace(path)
+    raise ValueError(f"Format workload tidak dikenal: {path} (gunakan .csv, .jsonl atau .trace)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi workload CSV ke trace biner (mmap)")
+    parser.add_argument("csv_path")
+    parser.add_argument("trace_path")
+    args = parser.parse_args(argv)
+    count = csv_to_trace(args.csv_path, args.trace_path)
+    print(f"{count} proses ditulis ke {args.trace_path}")
+
+
+if __name__ == "__main__":
+    main()
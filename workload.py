@@ -0,0 +1,72 @@
+# workload.py
+import random
+from array import array
+
+from process import ProcessTable
+
+ARRIVAL_MODELS = ('poisson', 'bursty', 'uniform')
+BURST_MODELS = ('exponential', 'pareto', 'uniform')
+
+
+def _arrivals(rng, n, model, mean_gap):
+    times = array('q', [0]) * n
+    t = 0.0
+    if model == 'poisson':
+        # Proses Poisson: jarak antar kedatangan berdistribusi eksponensial
+        for i in range(n):
+            t += rng.expovariate(1.0 / mean_gap)
+            times[i] = int(t)
+    elif model == 'bursty':
+        # On/off: kelompok kedatangan rapat dipisah jeda panjang, rata-rata tetap mean_gap
+        i = 0
+        while i < n:
+            size = min(n - i, 1 + int(rng.expovariate(1.0 / 16)))
+            for _ in range(size):
+                t += rng.expovariate(4.0 / mean_gap)
+                times[i] = int(t)
+                i += 1
+            t += rng.expovariate(1.0 / (mean_gap * size * 0.75))
+    elif model == 'uniform':
+        for i in range(n):
+            t += rng.uniform(0, 2 * mean_gap)
+            times[i] = int(t)
+    else:
+        raise ValueError(f"Model kedatangan tidak dikenal: {model} (pilih {', '.join(ARRIVAL_MODELS)})")
+    return times
+
+
+def _burst(rng, model, mean):
+    if model == 'exponential':
+        value = rng.expovariate(1.0 / mean)
+    elif model == 'pareto':
+        # Heavy-tailed: Pareto alpha=1.5 diskalakan agar rata-ratanya = mean
+        alpha = 1.5
+        value = rng.paretovariate(alpha) * mean * (alpha - 1) / alpha
+    elif model == 'uniform':
+        value = rng.uniform(1, 2 * mean)
+    else:
+        raise ValueError(f"Model burst tidak dikenal: {model} (pilih {', '.join(BURST_MODELS)})")
+    return max(1, int(round(value)))
+
+
+def generate_workload(n, seed=0, arrival='poisson', burst='exponential', mean_gap=4.0,
+                      mean_burst=10.0, io_probability=0.5, mean_io=3.0, priorities=(1, 2, 3)):
+    """Workload sintetis yang reprodusibel (seed sama -> workload sama).
+
+    Hasilnya ProcessTable dengan PID "P1".."Pn", sudah terurut menurut
+    kedatangan, siap dipakai fcfs/rr/mlfq scheduler.
+    """
+    rng = random.Random(seed)
+    arrival_time = _arrivals(rng, n, arrival, mean_gap)
+    burst_time = array('q', [0]) * n
+    io_burst = array('q', [0]) * n
+    priority = array('h', [0]) * n
+    for i in range(n):
+        burst_time[i] = _burst(rng, burst, mean_burst)
+        if rng.random() < io_probability:
+            io_burst[i] = max(1, int(round(rng.expovariate(1.0 / mean_io))))
+        priority[i] = rng.choice(priorities)
+    pids = [f"P{i+1}" for i in range(n)]
+    table = ProcessTable.from_arrays(pids, arrival_time, burst_time, io_burst, priority)
+    table.sorted_by_arrival = True
+    return table